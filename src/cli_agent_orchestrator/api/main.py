@@ -1,18 +1,11 @@
 """Single FastAPI entry point for all HTTP routes."""
 
 import asyncio
-import fcntl
-import json
 import logging
 import os
-import pty
-import signal
-import struct
-import subprocess
-import termios
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated, Dict, List, Optional, cast
+from typing import Annotated, Any, Dict, List, Optional, cast
 
 from fastapi import (
     BackgroundTasks,
@@ -21,15 +14,20 @@ from fastapi import (
     HTTPException,
     Query,
     Request,
+    Response,
     WebSocket,
     WebSocketDisconnect,
     status,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from watchdog.observers.polling import PollingObserver
 
+from cli_agent_orchestrator.api import terminal_hub, terminal_viewer
+from cli_agent_orchestrator.api.session_events import stream_session_events
 from cli_agent_orchestrator.clients.database import (
     create_inbox_message,
     get_inbox_messages,
@@ -38,15 +36,19 @@ from cli_agent_orchestrator.clients.database import (
 )
 from cli_agent_orchestrator.constants import (
     ALLOWED_HOSTS,
+    ARCHIVE_FLUSH_TIMEOUT_SECONDS,
     CAO_HOME_DIR,
     CORS_ORIGINS,
     DEFAULT_PROVIDER,
     INBOX_POLLING_INTERVAL,
+    MEMORY_CLEANUP_INTERVAL_SECONDS,
     SERVER_HOST,
     SERVER_PORT,
     SERVER_VERSION,
     TERMINAL_LOG_DIR,
+    TERMINAL_OUTPUT_SINK,
     WS_ALLOWED_CLIENTS,
+    WS_PER_MESSAGE_DEFLATE,
     add_local_cors_origins,
 )
 from cli_agent_orchestrator.models.flow import Flow
@@ -55,8 +57,11 @@ from cli_agent_orchestrator.models.terminal import Terminal, TerminalId
 from cli_agent_orchestrator.plugins import PluginRegistry
 from cli_agent_orchestrator.providers.manager import provider_manager
 from cli_agent_orchestrator.services import (
+    archive_service,
     flow_service,
     inbox_service,
+    output_stream_service,
+    overview_service,
     session_service,
     terminal_service,
 )
@@ -100,6 +105,31 @@ async def flow_daemon():
         await asyncio.sleep(60)
 
 
+async def memory_cleanup_daemon() -> None:
+    """Background task expiring memories every MEMORY_CLEANUP_INTERVAL_SECONDS."""
+    logger.info("Memory cleanup daemon started")
+    while True:
+        await cleanup_expired_memories()
+        await asyncio.sleep(MEMORY_CLEANUP_INTERVAL_SECONDS)
+
+
+async def output_stream_inbox_daemon(handler: LogFileHandler) -> None:
+    """Background task driving inbox delivery from in-memory output streams.
+
+    Stands in for the log-file watcher in memory output mode: terminals that
+    printed anything since the last tick get the same handling as a
+    modified ``<id>.log``.
+    """
+    logger.info("Output stream inbox watcher started")
+    while True:
+        await asyncio.sleep(INBOX_POLLING_INTERVAL)
+        for terminal_id in output_stream_service.pop_active_terminals():
+            try:
+                await asyncio.to_thread(handler.handle_output_change, terminal_id)
+            except Exception:
+                logger.exception(f"Output stream inbox check failed for {terminal_id}")
+
+
 async def opencode_inbox_delivery_daemon(registry: PluginRegistry) -> None:
     """Background task to wake OpenCode inbox delivery for pending messages."""
     logger.info("OpenCode inbox delivery poller started")
@@ -115,6 +145,8 @@ async def opencode_inbox_delivery_daemon(registry: PluginRegistry) -> None:
 class TerminalOutputResponse(BaseModel):
     output: str
     mode: str
+    cursor: Optional[str] = None
+    truncated: Optional[bool] = None
 
 
 class SkillContentResponse(BaseModel):
@@ -174,7 +206,7 @@ async def lifespan(app: FastAPI):
 
     # Run cleanup in background
     asyncio.create_task(asyncio.to_thread(cleanup_old_data))
-    asyncio.create_task(cleanup_expired_memories())
+    memory_cleanup_task = asyncio.create_task(memory_cleanup_daemon())
 
     # Start flow daemon as background task
     daemon_task = asyncio.create_task(flow_daemon())
@@ -184,11 +216,20 @@ async def lifespan(app: FastAPI):
     opencode_inbox_task = asyncio.create_task(opencode_inbox_delivery_daemon(registry))
 
     # Start inbox watcher
+    log_handler = LogFileHandler(registry)
     inbox_observer = PollingObserver(timeout=INBOX_POLLING_INTERVAL)
-    inbox_observer.schedule(LogFileHandler(registry), str(TERMINAL_LOG_DIR), recursive=False)
+    inbox_observer.schedule(log_handler, str(TERMINAL_LOG_DIR), recursive=False)
     inbox_observer.start()
     logger.info("Inbox watcher started (PollingObserver)")
 
+    # In memory output mode there are no log files to watch; drive inbox
+    # delivery from the streams and re-attach panes that outlived a restart.
+    stream_inbox_task = None
+    if TERMINAL_OUTPUT_SINK == "memory":
+        resumed = await asyncio.to_thread(terminal_service.resume_output_streams)
+        logger.info(f"Resumed {resumed} in-memory output streams")
+        stream_inbox_task = asyncio.create_task(output_stream_inbox_daemon(log_handler))
+
     yield
 
     # Stop inbox observer
@@ -196,13 +237,26 @@ async def lifespan(app: FastAPI):
     inbox_observer.join()
     logger.info("Inbox watcher stopped")
 
-    # Cancel daemon on shutdown
+    # Cancel daemons on shutdown
     daemon_task.cancel()
     try:
         await daemon_task
     except asyncio.CancelledError:
         pass
 
+    memory_cleanup_task.cancel()
+    try:
+        await memory_cleanup_task
+    except asyncio.CancelledError:
+        pass
+
+    if stream_inbox_task is not None:
+        stream_inbox_task.cancel()
+        try:
+            await stream_inbox_task
+        except asyncio.CancelledError:
+            pass
+
     # Cancel OpenCode inbox poller on shutdown
     opencode_inbox_task.cancel()
     try:
@@ -210,6 +264,10 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    # Finish archiving terminals deleted just before shutdown
+    if not await asyncio.to_thread(archive_service.flush, ARCHIVE_FLUSH_TIMEOUT_SECONDS):
+        logger.warning("Terminal archival did not finish before shutdown")
+
     await registry.teardown()
     logger.info("Shutting down CLI Agent Orchestrator server...")
 
@@ -266,12 +324,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (terminal output, overviews) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "service": "cli-agent-orchestrator"}
 
 
+@app.get("/overview")
+async def get_overview(session: Optional[str] = Query(None)) -> Dict:
+    """All sessions with their terminals, live statuses and pending inbox counts.
+
+    Replaces the /sessions → /sessions/{name}/terminals → /terminals/{id}
+    fan-out with one cached, batch-captured snapshot (see ``overview_service``).
+    ``session`` restricts the result to one session.
+    """
+    try:
+        overview = await asyncio.to_thread(overview_service.get_overview)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build overview: {str(e)}",
+        )
+    if session is None:
+        return overview
+    return {"sessions": [s for s in overview["sessions"] if s["name"] == session]}
+
+
 @app.get("/agents/profiles")
 async def list_agent_profiles_endpoint() -> List[Dict]:
     """List all available agent profiles from all configured directories."""
@@ -496,14 +577,29 @@ async def create_session(
 
 
 @app.get("/sessions")
-async def list_sessions() -> List[Dict]:
+async def list_sessions(request: Request, response: Response) -> Any:
+    """List sessions. Honours ``If-None-Match`` with the ETag of the last response."""
     try:
-        return session_service.list_sessions()
+        snapshot = session_service.get_sessions_snapshot()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list sessions: {str(e)}",
         )
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": snapshot.etag})
+    response.headers["ETag"] = snapshot.etag
+    return snapshot.sessions
+
+
+@app.get("/sessions/events")
+async def session_events(request: Request) -> StreamingResponse:
+    """Push session list changes as server-sent events (see ``session_events``)."""
+    return StreamingResponse(
+        stream_session_events(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 @app.get("/sessions/{session_name}")
@@ -543,6 +639,37 @@ async def delete_session(request: Request, session_name: str) -> Dict:
         )
 
 
+@app.post("/sessions/shutdown")
+async def shutdown_sessions(
+    request: Request,
+    session: Optional[List[str]] = Query(default=None, description="Sessions to shut down"),
+    all: bool = Query(default=False, description="Shut down every cao session"),
+) -> Dict:
+    """Tear down many sessions concurrently and report one aggregated result."""
+    if all == bool(session):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specify either all=true or one or more session parameters",
+        )
+    try:
+        for name in session or []:
+            validate_tmux_name(name, "session_name")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    try:
+        result = await asyncio.to_thread(
+            session_service.delete_sessions,
+            None if all else session,
+            registry=get_plugin_registry(request),
+        )
+        return {"success": True, **result}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to shut down sessions: {str(e)}",
+        )
+
+
 @app.post(
     "/sessions/{session_name}/terminals",
     response_model=Terminal,
@@ -634,7 +761,7 @@ async def get_terminal_memory_context(terminal_id: TerminalId):
         from cli_agent_orchestrator.services.memory_service import MemoryService
 
         svc = MemoryService()
-        context = svc.get_memory_context_for_terminal(terminal_id)
+        context = await asyncio.to_thread(svc.get_memory_context_for_terminal, terminal_id)
         return PlainTextResponse(content=context)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -686,13 +813,50 @@ async def send_terminal_input(
         )
 
 
-@app.get("/terminals/{terminal_id}/output", response_model=TerminalOutputResponse)
+@app.get(
+    "/terminals/{terminal_id}/output",
+    response_model=TerminalOutputResponse,
+    response_model_exclude_none=True,
+)
 async def get_terminal_output(
-    terminal_id: TerminalId, mode: OutputMode = OutputMode.FULL
+    terminal_id: TerminalId,
+    mode: OutputMode = OutputMode.FULL,
+    turn: Optional[int] = Query(
+        default=None, ge=1, description="Return the recorded response of this transcript turn"
+    ),
+    since: Optional[str] = Query(
+        default=None,
+        pattern=r"^[^:]*:\d+$",
+        description="Return only output written after this cursor",
+    ),
+    tail: Optional[int] = Query(default=None, ge=1, description="Return at most the last N lines"),
+    strip_ansi: bool = Query(default=False, description="Remove ANSI escape sequences"),
 ) -> TerminalOutputResponse:
+    if since is not None and (mode != OutputMode.FULL or turn is not None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'since' can only be used with mode=full",
+        )
     try:
-        output = terminal_service.get_output(terminal_id, mode)
-        return TerminalOutputResponse(output=output, mode=mode)
+        if since is not None:
+            chunk = await asyncio.to_thread(
+                terminal_service.get_output_since,
+                terminal_id,
+                since,
+                tail_lines=tail,
+                strip_escapes=strip_ansi,
+            )
+            return TerminalOutputResponse(
+                output=chunk.output, mode=mode, cursor=chunk.cursor, truncated=chunk.truncated
+            )
+        # Taken before the capture so a client resuming from it misses nothing
+        cursor = None
+        if mode == OutputMode.FULL and turn is None:
+            cursor = terminal_service.get_output_cursor(terminal_id)
+        output = terminal_service.get_output(
+            terminal_id, mode, turn=turn, tail_lines=tail, strip_escapes=strip_ansi
+        )
+        return TerminalOutputResponse(output=output, mode=mode, cursor=cursor)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -702,6 +866,26 @@ async def get_terminal_output(
         )
 
 
+@app.get("/terminals/{terminal_id}/scrollback")
+async def get_terminal_scrollback(
+    terminal_id: TerminalId,
+    strip_ansi: bool = Query(default=True, description="Remove ANSI escape sequences"),
+) -> StreamingResponse:
+    """Stream a terminal's full scrollback, or its archived copy after deletion."""
+    try:
+        chunks = await asyncio.to_thread(
+            terminal_service.stream_scrollback, terminal_id, strip_escapes=strip_ansi
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get scrollback: {str(e)}",
+        )
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
+
+
 @app.post("/terminals/{terminal_id}/exit")
 async def exit_terminal(terminal_id: TerminalId) -> Dict:
     """Send provider-specific exit command to terminal."""
@@ -848,9 +1032,14 @@ async def get_inbox_messages_endpoint(
 
 
 @app.websocket("/terminals/{terminal_id}/ws")
-async def terminal_ws(websocket: WebSocket, terminal_id: str):
+async def terminal_ws(websocket: WebSocket, terminal_id: str, mode: Optional[str] = None):
     """WebSocket endpoint for live terminal streaming via tmux attach.
 
+    Every viewer of a terminal shares one tmux attach client; only the
+    longest-connected viewer may type or resize (see ``terminal_hub``).
+    With ``?mode=view`` the connection is read-only and never attaches a
+    tmux client or PTY (see ``terminal_viewer``).
+
     Security: This endpoint provides full PTY access with no authentication.
     It is intended for localhost-only use. Do NOT expose the server to
     untrusted networks (e.g. --host 0.0.0.0) without adding authentication.
@@ -866,6 +1055,10 @@ async def terminal_ws(websocket: WebSocket, terminal_id: str):
 
     await websocket.accept()
 
+    if mode not in (None, "view"):
+        await websocket.close(code=1008, reason=f"Unsupported mode: {mode}")
+        return
+
     metadata = get_terminal_metadata(terminal_id)
     if not metadata:
         await websocket.close(code=4004, reason="Terminal not found")
@@ -884,126 +1077,45 @@ async def terminal_ws(websocket: WebSocket, terminal_id: str):
         await websocket.close(code=4003, reason="Invalid tmux target name")
         return
 
-    # Create PTY pair for tmux attach
-    master_fd, slave_fd = pty.openpty()
-
-    # Set initial terminal size
-    winsize = struct.pack("HHHH", 24, 80, 0, 0)
-    fcntl.ioctl(slave_fd, termios.TIOCSWINSZ, winsize)
-
-    # Start tmux attach inside the PTY.
-    # Container/devcontainer environments often leave TERM unset or set to
-    # ``dumb``, which strips colours, breaks cursor positioning and corrupts
-    # the Ink-based TUIs that agent CLIs render. Force a sane default so the
-    # browser-side xterm.js renderer sees the escape sequences it expects.
-    # Any explicit non-dumb TERM the operator set is preserved.
-    pty_env = _build_pty_env()
-    proc = subprocess.Popen(
-        ["tmux", "-u", "attach-session", "-t", f"{session_name}:{window_name}"],
-        stdin=slave_fd,
-        stdout=slave_fd,
-        stderr=slave_fd,
-        close_fds=True,
-        preexec_fn=os.setsid,
-        env=pty_env,
-    )
-    os.close(slave_fd)
-
-    # Make master_fd non-blocking for event-driven reads
-    flag = fcntl.fcntl(master_fd, fcntl.F_GETFL)
-    fcntl.fcntl(master_fd, fcntl.F_SETFL, flag | os.O_NONBLOCK)
-
-    loop = asyncio.get_event_loop()
-    output_queue: asyncio.Queue[bytes] = asyncio.Queue()
-    done = asyncio.Event()
-
-    def _on_pty_data():
-        """Callback when PTY has data available."""
-        try:
-            data = os.read(master_fd, 65536)
-            if data:
-                output_queue.put_nowait(data)
-            else:
-                done.set()
-        except BlockingIOError:
-            pass
-        except OSError:
-            done.set()
+    if mode == "view":
+        await terminal_viewer.serve_view(websocket, terminal_id, session_name, window_name)
+        return
 
-    loop.add_reader(master_fd, _on_pty_data)
-
-    async def _forward_output():
-        """Read from PTY queue and send to WebSocket."""
-        while not done.is_set():
-            try:
-                data = await asyncio.wait_for(output_queue.get(), timeout=1.0)
-                # Drain any additional pending data for batching
-                while not output_queue.empty():
-                    try:
-                        data += output_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
-                await websocket.send_bytes(data)
-            except asyncio.TimeoutError:
-                if proc.poll() is not None:
-                    break
-            except (Exception, asyncio.CancelledError):
-                break
+    # All viewers of a terminal share one tmux attach client (see
+    # terminal_hub). Container/devcontainer environments often leave TERM
+    # unset or set to ``dumb``, which strips colours, breaks cursor
+    # positioning and corrupts the Ink-based TUIs that agent CLIs render.
+    # Force a sane default so the browser-side xterm.js renderer sees the
+    # escape sequences it expects. Any explicit non-dumb TERM the operator
+    # set is preserved.
+    hub = terminal_hub.get_or_create_hub(terminal_id, session_name, window_name, _build_pty_env())
+    subscriber = hub.subscribe()
 
     async def _forward_input():
-        """Receive from WebSocket and write to PTY."""
+        """Receive from WebSocket and forward to the hub (input owner only)."""
         try:
-            while not done.is_set():
-                msg = await websocket.receive_text()
-                payload = json.loads(msg)
-                if payload.get("type") == "input":
-                    raw = payload["data"].encode()
-                    # Write in chunks to avoid overflowing the PTY buffer
-                    chunk_size = 1024
-                    for i in range(0, len(raw), chunk_size):
-                        os.write(master_fd, raw[i : i + chunk_size])
-                        if i + chunk_size < len(raw):
-                            await asyncio.sleep(0.01)
-                elif payload.get("type") == "resize":
-                    rows = payload.get("rows", 24)
-                    cols = payload.get("cols", 80)
-                    winsize_data = struct.pack("HHHH", rows, cols, 0, 0)
-                    fcntl.ioctl(master_fd, termios.TIOCSWINSZ, winsize_data)
-                    # Explicitly notify tmux of the size change —
-                    # TIOCSWINSZ on the master doesn't always deliver
-                    # SIGWINCH to the child process group.
-                    try:
-                        os.kill(proc.pid, signal.SIGWINCH)
-                    except OSError:
-                        pass
+            while not hub.closed:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                await hub.handle_client_frame(subscriber, message.get("text"), message.get("bytes"))
         except WebSocketDisconnect:
             pass
         except (Exception, asyncio.CancelledError):
             pass
-        finally:
-            done.set()
 
+    output_task = asyncio.ensure_future(
+        terminal_hub.pump_to_websocket(websocket, subscriber, lambda: hub.closed, hub.resync)
+    )
+    input_task = asyncio.ensure_future(_forward_input())
     try:
-        await asyncio.gather(_forward_output(), _forward_input())
-    except (Exception, asyncio.CancelledError):
-        pass
+        await asyncio.wait({output_task, input_task}, return_when=asyncio.FIRST_COMPLETED)
     finally:
-        done.set()
-        try:
-            loop.remove_reader(master_fd)
-        except Exception:
-            pass
-        try:
-            os.close(master_fd)
-        except OSError:
-            pass
-        # Terminate tmux attach (just detaches, doesn't kill the session)
-        proc.terminate()
-        try:
-            await asyncio.wait_for(asyncio.to_thread(proc.wait), timeout=3.0)
-        except asyncio.TimeoutError:
-            proc.kill()
-            await asyncio.to_thread(proc.wait)
+        for task in (output_task, input_task):
+            task.cancel()
+        # The last viewer leaving terminates the shared tmux attach client
+        # (which just detaches; the session keeps running).
+        hub.unsubscribe(subscriber)
 
 
 # ── Flow management endpoints ────────────────────────────────────────
@@ -1174,7 +1286,7 @@ def main():
     # already-installed CORSMiddleware reads the list by reference, so
     # mutating it before uvicorn starts is sufficient. See issue #151.
     add_local_cors_origins(host, port)
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(app, host=host, port=port, ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE)
 
 
 if __name__ == "__main__":
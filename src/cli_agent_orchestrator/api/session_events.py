@@ -0,0 +1,68 @@
+"""Server-sent session list updates (``GET /sessions/events``).
+
+Each connection first receives the full session list, then only deltas:
+
+- ``{"type": "snapshot", "etag": ..., "sessions": [...]}``
+- ``{"type": "delta", "etag": ..., "upserted": [...], "removed": [ids]}``
+
+The event ``id`` is the same ETag ``GET /sessions`` returns. Connections
+wake when cao-server creates or deletes a session
+(``session_service.subscribe_sessions_changed``) rather than on a timer, and
+read the shared ``session_service.get_sessions_snapshot()`` cache, so an idle
+dashboard costs no tmux work. Sessions started or killed outside cao-server
+are picked up at the next keepalive. Nothing is sent while the list is
+unchanged.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from cli_agent_orchestrator.constants import SESSION_EVENTS_KEEPALIVE_SECONDS
+from cli_agent_orchestrator.services import session_service
+from cli_agent_orchestrator.services.session_service import SessionsSnapshot
+
+
+def session_event(previous: Optional[SessionsSnapshot], current: SessionsSnapshot) -> Dict:
+    """Describe ``current`` as a full snapshot or as a delta from ``previous``."""
+    if previous is None:
+        return {"type": "snapshot", "etag": current.etag, "sessions": current.sessions}
+    before = {s["id"]: s for s in previous.sessions}
+    after = {s["id"]: s for s in current.sessions}
+    return {
+        "type": "delta",
+        "etag": current.etag,
+        "upserted": [s for sid, s in after.items() if before.get(sid) != s],
+        "removed": [sid for sid in before if sid not in after],
+    }
+
+
+def format_sse(event: Dict) -> str:
+    return f"id: {event['etag']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream_session_events(
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """Yield SSE messages whenever the session list changes."""
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+
+    def on_change() -> None:
+        loop.call_soon_threadsafe(changed.set)
+
+    unsubscribe = session_service.subscribe_sessions_changed(on_change)
+    previous: Optional[SessionsSnapshot] = None
+    try:
+        while not await is_disconnected():
+            current = await asyncio.to_thread(session_service.get_sessions_snapshot)
+            if previous is None or current.etag != previous.etag:
+                yield format_sse(session_event(previous, current))
+                previous = current
+            try:
+                await asyncio.wait_for(changed.wait(), SESSION_EVENTS_KEEPALIVE_SECONDS)
+                changed.clear()
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+    finally:
+        unsubscribe()
@@ -0,0 +1,360 @@
+"""Per-terminal fan-out hub for WebSocket viewers.
+
+One ``tmux attach-session`` client (inside one PTY) per terminal is shared
+by every WebSocket connected to that terminal:
+
+- PTY output is broadcast to each subscriber through its own bounded
+  buffer and sent in coalesced frames. A subscriber that falls
+  ``WS_SUBSCRIBER_BUFFER_BYTES`` behind skips its backlog and gets a tmux
+  redraw instead of slowing everyone else down.
+- Only the input owner (the longest-connected subscriber) may type or
+  resize; ownership passes to the next subscriber when the owner leaves.
+  Subscribers are told via a ``{"type": "input_owner", "owner": bool}``
+  text frame.
+- Clients send input and resize either as JSON text frames or as compact
+  binary frames: one opcode byte (``FRAME_INPUT``/``FRAME_RESIZE``) then the
+  payload, which avoids JSON encoding each keystroke.
+- A viewer joining a running hub triggers a tmux redraw so it gets a full
+  screen instead of a partial diff.
+- The attach client is torn down when the last subscriber leaves.
+
+All methods run on the event loop thread.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import pty
+import signal
+import struct
+import subprocess
+import termios
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Union
+
+from fastapi import WebSocket
+
+from cli_agent_orchestrator.constants import (
+    WS_FRAME_INTERVAL_SECONDS,
+    WS_FRAME_MAX_BYTES,
+    WS_SUBSCRIBER_BUFFER_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+PTY_READ_BYTES = 65536
+INPUT_CHUNK_BYTES = 1024
+
+# Binary client frame opcodes (first byte of the frame)
+FRAME_INPUT = 0x00  # payload: raw keystroke bytes
+FRAME_RESIZE = 0x01  # payload: rows, cols as big-endian uint16
+
+# Items queued for a subscriber: PTY bytes, a JSON control message, or None
+# once the hub has closed.
+HubItem = Optional[Union[bytes, str]]
+
+
+class HubSubscriber:
+    """One WebSocket's pending output: a byte buffer plus control messages.
+
+    Output chunks are appended to a single bytearray that the sender slices
+    into frames, rather than queued one object per PTY read. When the
+    unsent backlog would exceed ``max_bytes`` it is discarded and the
+    subscriber is flagged for a resync: skipping bytes mid-stream would
+    corrupt its screen, so the sender repaints it from a fresh snapshot.
+    """
+
+    def __init__(self, max_bytes: int = WS_SUBSCRIBER_BUFFER_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.pending = bytearray()
+        self.messages: Deque[str] = deque()
+        self.closed = False
+        self.needs_resync = False
+        self.resyncs = 0
+        self._ready = asyncio.Event()
+
+    def push(self, item: HubItem) -> None:
+        if item is None:
+            self.closed = True
+        elif isinstance(item, str):
+            self.messages.append(item)
+        elif self.needs_resync:
+            # The snapshot taken on resync will cover this output
+            return
+        elif len(self.pending) + len(item) > self.max_bytes:
+            self.pending.clear()
+            self.needs_resync = True
+            self.resyncs += 1
+        else:
+            self.pending += item
+        self._ready.set()
+
+    def take(self, max_bytes: int) -> bytes:
+        """Remove and return up to ``max_bytes`` of pending output."""
+        frame = bytes(self.pending[:max_bytes])
+        del self.pending[:max_bytes]
+        return frame
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until something was pushed; False on timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._ready.clear()
+        return True
+
+
+async def pump_to_websocket(
+    websocket: WebSocket,
+    subscriber: HubSubscriber,
+    is_closed: Callable[[], bool],
+    resync: Callable[[], Awaitable[Optional[bytes]]],
+) -> None:
+    """Send a subscriber's output to its WebSocket until the source closes.
+
+    Output is coalesced into frames of up to ``WS_FRAME_MAX_BYTES``, waiting
+    at most ``WS_FRAME_INTERVAL_SECONDS`` for a partial frame to fill. When
+    the subscriber fell behind, ``resync`` is awaited for a full-screen
+    snapshot to send instead of the discarded backlog (it may return None
+    if the repaint arrives through the output stream itself).
+    """
+    try:
+        while True:
+            while subscriber.messages:
+                await websocket.send_text(subscriber.messages.popleft())
+
+            if subscriber.needs_resync:
+                subscriber.needs_resync = False
+                snapshot = await resync()
+                if snapshot:
+                    await websocket.send_bytes(snapshot)
+                continue
+
+            if subscriber.pending:
+                if len(subscriber.pending) < WS_FRAME_MAX_BYTES and not subscriber.closed:
+                    await asyncio.sleep(WS_FRAME_INTERVAL_SECONDS)
+                await websocket.send_bytes(subscriber.take(WS_FRAME_MAX_BYTES))
+                continue
+
+            if subscriber.closed:
+                break
+            if not await subscriber.wait(timeout=1.0) and is_closed():
+                break
+    except (Exception, asyncio.CancelledError):
+        pass
+
+
+class TerminalHub:
+    """Shared tmux attach client for one terminal."""
+
+    def __init__(
+        self, terminal_id: str, session_name: str, window_name: str, env: Dict[str, str]
+    ) -> None:
+        self.terminal_id = terminal_id
+        self.session_name = session_name
+        self.window_name = window_name
+        self.env = env
+        self.subscribers: List[HubSubscriber] = []
+        self.closed = False
+        self._master_fd: Optional[int] = None
+        self._client_tty: Optional[str] = None
+        self._proc: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        """Open the PTY and start ``tmux attach-session`` inside it."""
+        master_fd, slave_fd = pty.openpty()
+        try:
+            # Set initial terminal size
+            winsize = struct.pack("HHHH", 24, 80, 0, 0)
+            fcntl.ioctl(slave_fd, termios.TIOCSWINSZ, winsize)
+            try:
+                self._client_tty = os.ttyname(slave_fd)
+            except OSError:
+                self._client_tty = None
+
+            self._proc = subprocess.Popen(
+                [
+                    "tmux",
+                    "-u",
+                    "attach-session",
+                    "-t",
+                    f"{self.session_name}:{self.window_name}",
+                ],
+                stdin=slave_fd,
+                stdout=slave_fd,
+                stderr=slave_fd,
+                close_fds=True,
+                preexec_fn=os.setsid,
+                env=self.env,
+            )
+        except BaseException:
+            os.close(master_fd)
+            raise
+        finally:
+            os.close(slave_fd)
+
+        # Make master_fd non-blocking for event-driven reads
+        flag = fcntl.fcntl(master_fd, fcntl.F_GETFL)
+        fcntl.fcntl(master_fd, fcntl.F_SETFL, flag | os.O_NONBLOCK)
+        self._master_fd = master_fd
+        asyncio.get_running_loop().add_reader(master_fd, self._on_pty_data)
+
+    def _on_pty_data(self) -> None:
+        """Callback when PTY has data available."""
+        assert self._master_fd is not None
+        try:
+            data = os.read(self._master_fd, PTY_READ_BYTES)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self.close()
+            return
+        for subscriber in self.subscribers:
+            subscriber.push(data)
+
+    @property
+    def process_exited(self) -> bool:
+        return self._proc is None or self._proc.poll() is not None
+
+    def subscribe(self) -> HubSubscriber:
+        """Add a subscriber; the first one becomes the input owner."""
+        subscriber = HubSubscriber()
+        joined_running_hub = bool(self.subscribers)
+        self.subscribers.append(subscriber)
+        subscriber.push(self._owner_message(subscriber))
+        if joined_running_hub:
+            self.request_redraw()
+        return subscriber
+
+    def unsubscribe(self, subscriber: HubSubscriber) -> None:
+        """Remove a subscriber, handing off input ownership or closing the hub."""
+        if subscriber not in self.subscribers:
+            return
+        was_owner = self.is_owner(subscriber)
+        self.subscribers.remove(subscriber)
+        if not self.subscribers:
+            self.close()
+        elif was_owner:
+            new_owner = self.subscribers[0]
+            new_owner.push(self._owner_message(new_owner))
+
+    def is_owner(self, subscriber: HubSubscriber) -> bool:
+        return bool(self.subscribers) and self.subscribers[0] is subscriber
+
+    def _owner_message(self, subscriber: HubSubscriber) -> str:
+        return json.dumps({"type": "input_owner", "owner": self.is_owner(subscriber)})
+
+    async def write_input(self, subscriber: HubSubscriber, raw: bytes) -> bool:
+        """Write keystrokes to the PTY if ``subscriber`` owns input."""
+        if not self.is_owner(subscriber) or self._master_fd is None:
+            return False
+        # Write in chunks to avoid overflowing the PTY buffer
+        for i in range(0, len(raw), INPUT_CHUNK_BYTES):
+            os.write(self._master_fd, raw[i : i + INPUT_CHUNK_BYTES])
+            if i + INPUT_CHUNK_BYTES < len(raw):
+                await asyncio.sleep(0.01)
+        return True
+
+    def resize(self, subscriber: HubSubscriber, rows: int, cols: int) -> bool:
+        """Resize the shared PTY if ``subscriber`` owns input."""
+        if not self.is_owner(subscriber) or self._master_fd is None:
+            return False
+        winsize_data = struct.pack("HHHH", rows, cols, 0, 0)
+        fcntl.ioctl(self._master_fd, termios.TIOCSWINSZ, winsize_data)
+        # Explicitly notify tmux of the size change —
+        # TIOCSWINSZ on the master doesn't always deliver
+        # SIGWINCH to the child process group.
+        if self._proc is not None:
+            try:
+                os.kill(self._proc.pid, signal.SIGWINCH)
+            except OSError:
+                pass
+        return True
+
+    async def handle_client_frame(
+        self, subscriber: HubSubscriber, text: Optional[str], data: Optional[bytes]
+    ) -> None:
+        """Apply one input/resize frame from a client, JSON text or binary."""
+        if data is not None:
+            if not data:
+                return
+            opcode, body = data[0], data[1:]
+            if opcode == FRAME_INPUT:
+                await self.write_input(subscriber, body)
+            elif opcode == FRAME_RESIZE and len(body) == 4:
+                rows, cols = struct.unpack("!HH", body)
+                self.resize(subscriber, rows, cols)
+            return
+        if text is None:
+            return
+        payload = json.loads(text)
+        if payload.get("type") == "input":
+            await self.write_input(subscriber, payload["data"].encode())
+        elif payload.get("type") == "resize":
+            self.resize(subscriber, payload.get("rows", 24), payload.get("cols", 80))
+
+    async def resync(self) -> None:
+        """Resync a lagging subscriber: the redraw reaches it as normal output."""
+        self.request_redraw()
+
+    def request_redraw(self) -> None:
+        """Ask tmux to repaint the shared client so a new viewer gets a full screen."""
+        if self._client_tty is None:
+            return
+        try:
+            subprocess.Popen(
+                ["tmux", "refresh-client", "-t", self._client_tty],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.debug(f"Failed to refresh tmux client for {self.terminal_id}: {e}")
+
+    def close(self) -> None:
+        """Stop the attach client and release every subscriber."""
+        if self.closed:
+            return
+        self.closed = True
+        if _hubs.get(self.terminal_id) is self:
+            del _hubs[self.terminal_id]
+        if self._master_fd is not None:
+            try:
+                asyncio.get_running_loop().remove_reader(self._master_fd)
+            except Exception:
+                pass
+            try:
+                os.close(self._master_fd)
+            except OSError:
+                pass
+            self._master_fd = None
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.terminate()
+            except OSError:
+                pass
+        for subscriber in self.subscribers:
+            subscriber.push(None)
+
+
+# Running hubs keyed by terminal ID
+_hubs: Dict[str, TerminalHub] = {}
+
+
+def get_or_create_hub(
+    terminal_id: str, session_name: str, window_name: str, env: Dict[str, str]
+) -> TerminalHub:
+    """Return the terminal's running hub, starting one if needed."""
+    hub = _hubs.get(terminal_id)
+    if hub is not None and not hub.closed and not hub.process_exited:
+        return hub
+    if hub is not None:
+        hub.close()
+    hub = TerminalHub(terminal_id, session_name, window_name, env)
+    hub.start()
+    _hubs[terminal_id] = hub
+    return hub
@@ -0,0 +1,132 @@
+"""Read-only WebSocket viewers (``/terminals/{id}/ws?mode=view``).
+
+A view-mode connection never starts a tmux client or PTY, so it cannot type
+into or resize the agent's pane. It receives:
+
+1. a replay of the pane's current screen (``capture-pane -e``) with the
+   cursor restored, then
+2. live pane output from the terminal's in-memory output stream, or, in
+   file output mode, from the tail of ``<id>.log``, batched and bounded the
+   same way as attached viewers (see ``terminal_hub.pump_to_websocket``).
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from cli_agent_orchestrator.api.terminal_hub import HubSubscriber, pump_to_websocket
+from cli_agent_orchestrator.clients.tmux import tmux_client
+from cli_agent_orchestrator.constants import TERMINAL_LOG_DIR
+from cli_agent_orchestrator.services import output_stream_service
+
+logger = logging.getLogger(__name__)
+
+# How often the log file is checked for new output in file mode (seconds)
+LOG_FOLLOW_INTERVAL = 0.1
+# Upper bound on bytes read from the log per check
+LOG_FOLLOW_READ_BYTES = 1024 * 1024
+
+
+def render_snapshot(screen: str, cursor_x: int, cursor_y: int) -> bytes:
+    """Turn a captured screen into bytes that repaint a fresh terminal."""
+    body = screen.replace("\n", "\r\n")
+    return f"\x1b[2J\x1b[H{body}\x1b[{cursor_y + 1};{cursor_x + 1}H".encode("utf-8")
+
+
+def read_new_log_bytes(log_path: Path, offset: int) -> Tuple[bytes, int]:
+    """Read bytes appended to ``log_path`` since ``offset``.
+
+    If the file shrank (the log sink rotated it), reading restarts from the
+    beginning of the new live file.
+    """
+    try:
+        size = log_path.stat().st_size
+    except FileNotFoundError:
+        return b"", 0
+    if size < offset:
+        offset = 0
+    if size == offset:
+        return b"", offset
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        data = f.read(LOG_FOLLOW_READ_BYTES)
+    return data, offset + len(data)
+
+
+def log_end_offset(log_path: Path) -> int:
+    """Current size of ``log_path``, or 0 if it does not exist yet."""
+    try:
+        return log_path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+async def _follow_log(log_path: Path, subscriber: HubSubscriber, offset: int) -> None:
+    while True:
+        await asyncio.sleep(LOG_FOLLOW_INTERVAL)
+        data, offset = await asyncio.to_thread(read_new_log_bytes, log_path, offset)
+        if data:
+            subscriber.push(data)
+
+
+async def _drain_input(websocket: WebSocket) -> None:
+    """Discard client frames; returns when the client disconnects."""
+    try:
+        while True:
+            await websocket.receive()
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+
+
+async def serve_view(
+    websocket: WebSocket, terminal_id: str, session_name: str, window_name: str
+) -> None:
+    """Stream a terminal to an accepted WebSocket without attaching to tmux."""
+    loop = asyncio.get_running_loop()
+    subscriber = HubSubscriber()
+    unsubscribe = None
+    follow_task = None
+
+    # Start collecting live output before taking the snapshot so nothing
+    # printed in between is lost; a few duplicated bytes just repaint.
+    stream = output_stream_service.get_stream(terminal_id)
+    if stream is not None:
+
+        def on_output(data: bytes) -> None:
+            loop.call_soon_threadsafe(subscriber.push, data)
+
+        unsubscribe = stream.subscribe(on_output)
+    else:
+        log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
+        offset = await asyncio.to_thread(log_end_offset, log_path)
+        follow_task = asyncio.ensure_future(_follow_log(log_path, subscriber, offset))
+
+    async def snapshot() -> bytes:
+        screen, cursor_x, cursor_y = await asyncio.to_thread(
+            tmux_client.get_screen_snapshot, session_name, window_name
+        )
+        return render_snapshot(screen, cursor_x, cursor_y)
+
+    try:
+        await websocket.send_bytes(await snapshot())
+
+        # A viewer that falls behind is repainted from a new snapshot
+        output_task = asyncio.ensure_future(
+            pump_to_websocket(websocket, subscriber, lambda: False, snapshot)
+        )
+        input_task = asyncio.ensure_future(_drain_input(websocket))
+        try:
+            await asyncio.wait({output_task, input_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            output_task.cancel()
+            input_task.cancel()
+    except Exception as e:
+        logger.debug(f"View stream for {terminal_id} ended: {e}")
+    finally:
+        if unsubscribe is not None:
+            unsubscribe()
+        if follow_task is not None:
+            follow_task.cancel()
@@ -218,3 +218,17 @@ def clear(scope, yes):
             click.echo(f"Warning: Failed to delete '{mem.key}'.", err=True)
 
     click.echo(f"Cleared {deleted_count} {scope}-scoped memory(ies).")
+
+
+@memory.command()
+def reindex():
+    """Rebuild the memory search index from the wiki files on disk.
+
+    Needed only after memory files are added, edited or removed by hand.
+    """
+    svc = _get_memory_service()
+    try:
+        count = svc.rebuild_search_index()
+    except Exception as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Indexed {count} memory(ies).")
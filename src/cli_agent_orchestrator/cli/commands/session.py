@@ -42,6 +42,21 @@ def _get_terminal_output(terminal_id):
     return response.json()
 
 
+def _get_overview(session_name):
+    response = requests.get(f"{API_BASE_URL}/overview", params={"session": session_name})
+    response.raise_for_status()
+    return response.json()
+
+
+def _worker_statuses(session_name):
+    """Live status of every terminal in a session, from one /overview call."""
+    try:
+        overview = _get_overview(session_name)
+    except requests.exceptions.RequestException:
+        return {}
+    return {t["id"]: t["status"] for s in overview["sessions"] for t in s["terminals"]}
+
+
 def _resolve_conductor(session_name):
     terminals = _get_terminals(session_name)
     if not terminals:
@@ -137,6 +152,13 @@ def status(session_name, terminal_id, workers, as_json):
     except requests.exceptions.RequestException:
         last_output = None
 
+    worker_terminals = []
+    if workers and not terminal_id and len(all_terminals) > 1:
+        statuses = _worker_statuses(session_name)
+        worker_terminals = [
+            {**t, "status": statuses.get(t["id"], t.get("status"))} for t in all_terminals[1:]
+        ]
+
     if as_json:
         result = {
             "session": session_name,
@@ -156,7 +178,7 @@ def status(session_name, terminal_id, workers, as_json):
                     "provider": t.get("provider"),
                     "status": t.get("status"),
                 }
-                for t in all_terminals[1:]
+                for t in worker_terminals
             ]
         click.echo(json.dumps(result, indent=2))
         return
@@ -178,7 +200,6 @@ def status(session_name, terminal_id, workers, as_json):
         click.echo("\nNo last response available")
 
     if workers and not terminal_id:
-        worker_terminals = all_terminals[1:]
         if worker_terminals:
             click.echo(f"\n{'ID':<12} {'AGENT':<20} {'PROVIDER':<15} {'STATUS':<15}")
             click.echo("-" * 65)
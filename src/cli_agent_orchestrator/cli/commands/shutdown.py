@@ -6,9 +6,10 @@ import requests
 from cli_agent_orchestrator.constants import API_BASE_URL
 
 
-def _list_sessions():
+def _shutdown_all():
+    """Shut down every cao session in one request; the server tears them down in parallel."""
     try:
-        response = requests.get(f"{API_BASE_URL}/sessions")
+        response = requests.post(f"{API_BASE_URL}/sessions/shutdown", params={"all": "true"})
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -39,21 +40,19 @@ def shutdown(shutdown_all, session):
     if shutdown_all and session:
         raise click.ClickException("Cannot use --all and --session together")
 
-    if shutdown_all:
-        sessions = _list_sessions()
-        sessions_to_shutdown = [s["name"] for s in sessions]
-    else:
-        sessions_to_shutdown = [session]
+    if session:
+        if _delete_session(session):
+            click.echo(f"✓ Shutdown session '{session}'")
+        return
 
-    if not sessions_to_shutdown:
+    result = _shutdown_all()
+    if not result["deleted"] and not result["errors"]:
         click.echo("No cao sessions found to shutdown")
         return
 
-    for session_name in sessions_to_shutdown:
-        try:
-            if _delete_session(session_name):
-                click.echo(f"✓ Shutdown session '{session_name}'")
-        except click.ClickException as e:
-            if not shutdown_all:
-                raise
-            click.echo(f"Error: {e.format_message()}", err=True)
+    for session_name in result["deleted"]:
+        click.echo(f"✓ Shutdown session '{session_name}'")
+    for error in result["errors"]:
+        click.echo(
+            f"Error: Failed to shutdown session '{error['session']}': {error['error']}", err=True
+        )
@@ -25,7 +25,9 @@ def restore(terminal_id: str):
     The session must still exist.
     """
     snapshot_path = TERMINAL_LOG_DIR / f"{terminal_id}.snapshot.json"
-    scrollback_path = TERMINAL_LOG_DIR / f"{terminal_id}.scrollback"
+    scrollback_path = TERMINAL_LOG_DIR / f"{terminal_id}.scrollback.gz"
+    # Terminals deleted by older versions have an uncompressed scrollback
+    legacy_scrollback_path = TERMINAL_LOG_DIR / f"{terminal_id}.scrollback"
 
     if not snapshot_path.exists():
         raise click.ClickException(f"No snapshot found for terminal {terminal_id}")
@@ -51,13 +53,15 @@ def restore(terminal_id: str):
         raise click.ClickException("Failed to connect to cao-server")
 
     # Create a plain window (no agent) in the existing session
-    # Pass the scrollback file as the initial command: cat prints it as output,
-    # then exec replaces cat with the user's login shell (tmux-resurrect pattern).
+    # Pass the scrollback file as the initial command: gzip/cat prints it as output,
+    # then exec replaces it with the user's login shell (tmux-resurrect pattern).
     window_name = f"restored-{original_window}"
     login_shell = os.environ.get("SHELL", "bash")
 
     if scrollback_path.exists():
-        window_shell = f"cat '{scrollback_path}'; exec {login_shell} -l"
+        window_shell = f"gzip -dc '{scrollback_path}'; exec {login_shell} -l"
+    elif legacy_scrollback_path.exists():
+        window_shell = f"cat '{legacy_scrollback_path}'; exec {login_shell} -l"
     else:
         window_shell = f"exec {login_shell} -l"
 
@@ -13,12 +13,14 @@ from sqlalchemy import (
     String,
     UniqueConstraint,
     create_engine,
+    func,
 )
 from sqlalchemy.orm import DeclarativeBase, declarative_base, sessionmaker
 
 from cli_agent_orchestrator.constants import DATABASE_URL, DB_DIR, DEFAULT_PROVIDER
 from cli_agent_orchestrator.models.flow import Flow
 from cli_agent_orchestrator.models.inbox import InboxMessage, MessageStatus
+from cli_agent_orchestrator.models.terminal import TerminalTurn
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +121,28 @@ class FlowModel(Base):
     enabled = Column(Boolean, default=True)
 
 
+class TerminalTurnModel(Base):
+    """SQLAlchemy model for the per-turn transcript of a terminal.
+
+    One row per message sent with ``send_input``. Rows outlive the terminal
+    record so handoff results can be re-read after the worker is gone.
+    """
+
+    __tablename__ = "terminal_turns"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    terminal_id = Column(String, nullable=False, index=True)
+    turn = Column(Integer, nullable=False)  # 1-based, per terminal
+    provider = Column(String, nullable=True)
+    input = Column(String, nullable=False)
+    response = Column(String, nullable=True)
+    status_transitions = Column(String, nullable=False, default="[]")  # JSON [[status, iso_ts]]
+    started_at = Column(DateTime, default=datetime.now)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (UniqueConstraint("terminal_id", "turn", name="uq_terminal_turn"),)
+
+
 # Module-level singletons
 DB_DIR.mkdir(parents=True, exist_ok=True)
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
@@ -328,6 +352,37 @@ def list_all_terminals() -> List[Dict[str, Any]]:
         ]
 
 
+def list_terminals_with_pending_counts() -> List[Dict[str, Any]]:
+    """List all terminals with their pending inbox message counts in one query."""
+    with SessionLocal() as db:
+        pending = (
+            db.query(
+                InboxModel.receiver_id.label("receiver_id"),
+                func.count(InboxModel.id).label("count"),
+            )
+            .filter(InboxModel.status == MessageStatus.PENDING.value)
+            .group_by(InboxModel.receiver_id)
+            .subquery()
+        )
+        rows = (
+            db.query(TerminalModel, pending.c.count)
+            .outerjoin(pending, pending.c.receiver_id == TerminalModel.id)
+            .all()
+        )
+        return [
+            {
+                "id": t.id,
+                "tmux_session": t.tmux_session,
+                "tmux_window": t.tmux_window,
+                "provider": t.provider,
+                "agent_profile": t.agent_profile,
+                "last_active": t.last_active,
+                "pending_messages": count or 0,
+            }
+            for t, count in rows
+        ]
+
+
 def list_pending_receiver_ids_by_provider(provider: str) -> List[str]:
     """List receiver terminal IDs with pending messages for a specific provider."""
     with SessionLocal() as db:
@@ -362,6 +417,113 @@ def delete_terminals_by_session(tmux_session: str) -> int:
         return deleted
 
 
+def _to_terminal_turn(row: TerminalTurnModel) -> TerminalTurn:
+    import json as _json
+
+    return TerminalTurn(
+        terminal_id=row.terminal_id,
+        turn=row.turn,
+        provider=row.provider,
+        input=row.input,
+        response=row.response,
+        status_transitions=[tuple(t) for t in _json.loads(row.status_transitions or "[]")],
+        started_at=row.started_at,
+        completed_at=row.completed_at,
+    )
+
+
+def _latest_turn(db: Any, terminal_id: str) -> Optional[TerminalTurnModel]:
+    latest: Optional[TerminalTurnModel] = (
+        db.query(TerminalTurnModel)
+        .filter(TerminalTurnModel.terminal_id == terminal_id)
+        .order_by(TerminalTurnModel.turn.desc())
+        .first()
+    )
+    return latest
+
+
+def create_terminal_turn(terminal_id: str, provider: Optional[str], input_text: str) -> int:
+    """Start a new transcript turn for a terminal and return its 1-based number."""
+    with SessionLocal() as db:
+        latest = _latest_turn(db, terminal_id)
+        turn = TerminalTurnModel(
+            terminal_id=terminal_id,
+            turn=(latest.turn + 1) if latest else 1,
+            provider=provider,
+            input=input_text,
+        )
+        db.add(turn)
+        db.commit()
+        return int(turn.turn)
+
+
+def _turn_or_latest(db: Any, terminal_id: str, turn: Optional[int]) -> Optional[TerminalTurnModel]:
+    if turn is None:
+        return _latest_turn(db, terminal_id)
+    row: Optional[TerminalTurnModel] = (
+        db.query(TerminalTurnModel)
+        .filter(TerminalTurnModel.terminal_id == terminal_id, TerminalTurnModel.turn == turn)
+        .first()
+    )
+    return row
+
+
+def append_terminal_turn_status(terminal_id: str, status: str, turn: Optional[int] = None) -> bool:
+    """Append a status transition to one of the terminal's turns (default: the latest).
+
+    No-op (returns False) if there is no such turn or the status is
+    unchanged from the last recorded transition.
+    """
+    import json as _json
+
+    with SessionLocal() as db:
+        latest = _turn_or_latest(db, terminal_id, turn)
+        if not latest:
+            return False
+        transitions = _json.loads(latest.status_transitions or "[]")
+        if transitions and transitions[-1][0] == status:
+            return False
+        transitions.append([status, datetime.now().isoformat()])
+        latest.status_transitions = _json.dumps(transitions)
+        db.commit()
+        return True
+
+
+def complete_terminal_turn(terminal_id: str, response: str, turn: Optional[int] = None) -> bool:
+    """Record the extracted response on one of the terminal's turns (default: the latest)."""
+    with SessionLocal() as db:
+        latest = _turn_or_latest(db, terminal_id, turn)
+        if not latest:
+            return False
+        latest.response = response
+        latest.completed_at = datetime.now()
+        db.commit()
+        return True
+
+
+def get_terminal_turn(terminal_id: str, turn: Optional[int] = None) -> Optional[TerminalTurn]:
+    """Get one transcript turn.
+
+    Args:
+        terminal_id: Terminal ID
+        turn: 1-based turn number; None returns the latest completed turn
+
+    Returns:
+        The turn, or None if it does not exist
+    """
+    with SessionLocal() as db:
+        query = db.query(TerminalTurnModel).filter(TerminalTurnModel.terminal_id == terminal_id)
+        if turn is None:
+            row = (
+                query.filter(TerminalTurnModel.completed_at.isnot(None))
+                .order_by(TerminalTurnModel.turn.desc())
+                .first()
+            )
+        else:
+            row = query.filter(TerminalTurnModel.turn == turn).first()
+        return _to_terminal_turn(row) if row else None
+
+
 def create_inbox_message(sender_id: str, receiver_id: str, message: str) -> InboxMessage:
     """Create inbox message with status=MessageStatus.PENDING."""
     with SessionLocal() as db:
@@ -2,18 +2,50 @@
 
 import logging
 import os
+import shlex
 import subprocess
+import sys
 import time
 import uuid
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import libtmux
 
-from cli_agent_orchestrator.constants import TMUX_HISTORY_LINES
+from cli_agent_orchestrator.constants import (
+    TERMINAL_LOG_SEGMENT_BYTES,
+    TERMINAL_LOG_SEGMENTS,
+    TMUX_HISTORY_LINES,
+)
 from cli_agent_orchestrator.utils.terminal import validate_tmux_name
 
 logger = logging.getLogger(__name__)
 
+# Bytes read per chunk when streaming a full scrollback capture
+SCROLLBACK_CHUNK_BYTES = 64 * 1024
+# Non-blank lines above a marked cursor line kept to find it again after
+# history drops, looking at most SCROLLBACK_MARK_CONTEXT_MAX_LINES lines up
+SCROLLBACK_MARK_CONTEXT_LINES = 3
+SCROLLBACK_MARK_CONTEXT_MAX_LINES = 20
+
+
+@dataclass(frozen=True)
+class ScrollbackMark:
+    """A pane scrollback line recorded by ``TmuxClient.mark_cursor_line``.
+
+    Attributes:
+        line: Line number counted from the top of the scrollback
+            (``history_size + cursor_y``) when the mark was taken.
+        history_limit: The pane's ``history-limit`` at that time.
+        context: Plain text of the lines just above ``line``, back to the
+            ``SCROLLBACK_MARK_CONTEXT_LINES``-th non-blank one, used to
+            relocate it after history drops.
+    """
+
+    line: int
+    history_limit: int
+    context: Tuple[str, ...]
+
 
 class TmuxClient:
     """Simplified tmux client for basic operations."""
@@ -500,6 +532,283 @@ class TmuxClient:
             logger.error(f"Failed to get history from {session_name}:{window_name}: {e}")
             raise
 
+    def iter_history(
+        self, session_name: str, window_name: str, strip_escapes: bool = True
+    ) -> Iterator[bytes]:
+        """Stream a window's entire scrollback in chunks.
+
+        Like ``get_history(full_history=True)``, but ``capture-pane -S -``
+        runs as a subprocess whose output is yielded as it is read, so the
+        scrollback is never held in memory as a whole.
+
+        Raises:
+            ValueError: If the window does not exist (raised on the call,
+                before any chunk is yielded)
+        """
+        target = (
+            f"{validate_tmux_name(session_name, 'session_name')}:"
+            f"{validate_tmux_name(window_name, 'window_name')}"
+        )
+        flags = ["-p", "-S", "-"]
+        if not strip_escapes:
+            flags = ["-e"] + flags
+        proc = subprocess.Popen(
+            ["tmux", "capture-pane", *flags, "-t", target],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        first = proc.stdout.read(SCROLLBACK_CHUNK_BYTES)
+        if not first and proc.wait() != 0:
+            error = proc.stderr.read().decode(errors="replace").strip()
+            proc.stdout.close()
+            proc.stderr.close()
+            raise ValueError(f"Failed to capture {target}: {error}")
+        return self._iter_capture(proc, first)
+
+    @staticmethod
+    def _iter_capture(proc: subprocess.Popen, first: bytes) -> Iterator[bytes]:
+        assert proc.stdout is not None and proc.stderr is not None
+        try:
+            chunk = first
+            while chunk:
+                yield chunk
+                chunk = proc.stdout.read(SCROLLBACK_CHUNK_BYTES)
+        finally:
+            # Reader gone early (e.g. client disconnected): stop tmux
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+    def _pane_line_state(self, pane) -> Optional[Tuple[int, int, int, bool]]:
+        """Return (history_size, cursor_y, history_limit, alternate_on) for a pane."""
+        result = pane.cmd(
+            "display-message",
+            "-p",
+            "#{history_size} #{cursor_y} #{history_limit} #{alternate_on}",
+        )
+        if not result.stdout:
+            return None
+        try:
+            history_size, cursor_y, history_limit, alternate_on = result.stdout[0].split()
+            return int(history_size), int(cursor_y), int(history_limit), alternate_on == "1"
+        except ValueError:
+            return None
+
+    def capture_panes(
+        self, targets: List[Tuple[str, str, Optional[int]]]
+    ) -> Optional[Dict[Tuple[str, str], str]]:
+        """Capture the tails of several windows with a single tmux invocation.
+
+        Equivalent to calling ``get_history(session, window, tail_lines)``
+        for each target, but chains the ``capture-pane`` commands with
+        ``;`` separated by marker lines so N panes cost one tmux process.
+
+        Returns:
+            Dict keyed by (session, window), or None if the batch failed
+            (e.g. a window no longer exists, which aborts the whole chain)
+        """
+        if not targets:
+            return {}
+        marker = f"__cao_capture_{uuid.uuid4().hex}__"
+        args: List[str] = []
+        for i, (session_name, window_name, tail_lines) in enumerate(targets):
+            if i:
+                args += [";", "display-message", "-p", marker, ";"]
+            lines = tail_lines if tail_lines is not None else TMUX_HISTORY_LINES
+            args += ["capture-pane", "-e", "-p", "-S", f"-{lines}"]
+            args += ["-t", f"{session_name}:{window_name}"]
+        try:
+            result = self.server.cmd(*args)
+        except Exception as e:
+            logger.warning(f"Batched capture of {len(targets)} panes failed: {e}")
+            return None
+        if result.stderr:
+            logger.debug(f"Batched capture of {len(targets)} panes failed: {result.stderr}")
+            return None
+
+        segments: List[List[str]] = [[]]
+        for line in result.stdout:
+            if line == marker:
+                segments.append([])
+            else:
+                segments[-1].append(line)
+        if len(segments) != len(targets):
+            return None
+        captures: Dict[Tuple[str, str], str] = {}
+        for (session_name, window_name, _), segment in zip(targets, segments):
+            # Match get_history: libtmux drops trailing blank lines of a capture
+            while segment and segment[-1] == "":
+                segment.pop()
+            captures[(session_name, window_name)] = "\n".join(segment)
+        return captures
+
+    def mark_cursor_line(self, session_name: str, window_name: str) -> Optional[ScrollbackMark]:
+        """Record the pane cursor's scrollback line for ``get_history_from_mark``.
+
+        Returns None when the pane is on the alternate screen: full-screen
+        TUIs redraw in place, so there is no scrollback line to return to.
+        """
+        try:
+            session = self.server.sessions.get(session_name=session_name)
+            if not session:
+                return None
+            window = session.windows.get(window_name=window_name)
+            if not window:
+                return None
+            pane = window.panes[0]
+            state = self._pane_line_state(pane)
+            if state is None:
+                return None
+            history_size, cursor_y, history_limit, alternate_on = state
+            if alternate_on:
+                return None
+            line = history_size + cursor_y
+            context: Tuple[str, ...] = ()
+            if line > 0:
+                first = max(0, line - SCROLLBACK_MARK_CONTEXT_MAX_LINES)
+                above = self._capture_lines(pane, history_size, first, line - 1)
+                # Blank lines match anywhere; keep enough non-blank ones to
+                # tell the marked line apart from its shifted candidates.
+                start = len(above)
+                non_blank = 0
+                while start > 0 and non_blank < SCROLLBACK_MARK_CONTEXT_LINES:
+                    start -= 1
+                    if above[start].strip():
+                        non_blank += 1
+                context = tuple(above[start:])
+            return ScrollbackMark(line=line, history_limit=history_limit, context=context)
+        except Exception as e:
+            logger.error(f"Failed to mark cursor line for {session_name}:{window_name}: {e}")
+            return None
+
+    def get_history_from_mark(
+        self,
+        session_name: str,
+        window_name: str,
+        mark: ScrollbackMark,
+        strip_escapes: bool = False,
+    ) -> Optional[str]:
+        """Get window history from a line recorded by ``mark_cursor_line`` to the end.
+
+        Once the scrollback reaches ``history-limit``, tmux drops the oldest
+        tenth of it at a time, shifting every line up. The marked line is
+        relocated by trying each whole number of drops (fewest first) and
+        keeping the first position whose preceding lines still match the
+        context captured with the mark; each try captures only the context's
+        few lines, so the cost does not grow with the scrollback. If the
+        marked line itself has been dropped, everything still in the
+        scrollback was printed after it and is returned whole.
+
+        Returns None if the pane switched to the alternate screen.
+        """
+        try:
+            session = self.server.sessions.get(session_name=session_name)
+            if not session:
+                raise ValueError(f"Session '{session_name}' not found")
+
+            window = session.windows.get(window_name=window_name)
+            if not window:
+                raise ValueError(f"Window '{window_name}' not found in session '{session_name}'")
+
+            pane = window.panes[0]
+            state = self._pane_line_state(pane)
+            if state is None:
+                return None
+            history_size, cursor_y, history_limit, alternate_on = state
+            if alternate_on:
+                return None
+
+            step = max(1, mark.history_limit // 10)
+            if history_size < history_limit - step:
+                # The history has never been trimmed, so lines have not moved.
+                start = mark.line
+            else:
+                # At least this many drops happened if the cursor is now
+                # above the marked line.
+                drops = max(0, -(-(mark.line - history_size - cursor_y) // step))
+                start = self._relocate_mark(
+                    pane, mark, history_size, history_size + cursor_y, drops, step
+                )
+
+            # capture-pane counts negative start lines into the scrollback
+            # and non-negative ones from the top of the visible screen.
+            flags = ["-p", "-S", str(start - history_size)]
+            if not strip_escapes:
+                flags = ["-e"] + flags
+            result = pane.cmd("capture-pane", *flags)
+            return "\n".join(result.stdout) if result.stdout else ""
+        except Exception as e:
+            logger.error(f"Failed to get history from mark for {session_name}:{window_name}: {e}")
+            raise
+
+    def _relocate_mark(
+        self, pane, mark: ScrollbackMark, history_size: int, end: int, drops: int, step: int
+    ) -> int:
+        """Current line of ``mark`` in a pane whose last written line is ``end``.
+
+        Tries ``drops``, ``drops + 1``, ... history drops of ``step`` lines
+        each and returns the first line whose preceding lines match the
+        mark's context, capturing just those lines for each try. If none
+        does, the marked line has been dropped and everything left was
+        printed after it, so 0 is returned.
+        """
+        width = len(mark.context)
+        line = mark.line - drops * step
+        while line > 0:
+            if line <= end:
+                # After drops the oldest context lines may be gone too.
+                kept = min(width, line)
+                if kept == 0:
+                    return line
+                above = self._capture_lines(pane, history_size, line - kept, line - 1)
+                if tuple(above) == mark.context[width - kept :]:
+                    return line
+            line -= step
+        return 0
+
+    @staticmethod
+    def _capture_lines(pane, history_size: int, first: int, last: int) -> List[str]:
+        """Plain text of scrollback lines ``first`` to ``last`` (counted from the top)."""
+        result = pane.cmd(
+            "capture-pane", "-p", "-S", str(first - history_size), "-E", str(last - history_size)
+        )
+        lines = list(result.stdout or ())
+        # libtmux drops trailing blank lines from command output.
+        return lines + [""] * (last - first + 1 - len(lines))
+
+    def get_screen_snapshot(self, session_name: str, window_name: str) -> Tuple[str, int, int]:
+        """Capture the visible pane (with escape sequences) and its cursor position.
+
+        Returns:
+            Tuple of (screen text, cursor_x, cursor_y), cursor 0-based
+        """
+        try:
+            session = self.server.sessions.get(session_name=session_name)
+            if not session:
+                raise ValueError(f"Session '{session_name}' not found")
+
+            window = session.windows.get(window_name=window_name)
+            if not window:
+                raise ValueError(f"Window '{window_name}' not found in session '{session_name}'")
+
+            pane = window.panes[0]
+            screen = pane.cmd("capture-pane", "-e", "-p")
+            cursor = pane.cmd("display-message", "-p", "#{cursor_x} #{cursor_y}")
+            cursor_x, cursor_y = 0, 0
+            if cursor.stdout:
+                try:
+                    cursor_x, cursor_y = (int(v) for v in cursor.stdout[0].split())
+                except ValueError:
+                    pass
+            text = "\n".join(screen.stdout) if screen.stdout else ""
+            return text, cursor_x, cursor_y
+        except Exception as e:
+            logger.error(f"Failed to get screen snapshot for {session_name}:{window_name}: {e}")
+            raise
+
     def list_sessions(self) -> List[Dict[str, str]]:
         """List all tmux sessions."""
         try:
@@ -617,13 +926,21 @@ class TmuxClient:
             logger.error(f"Failed to get pane command for {session_name}:{window_name}: {e}")
             return None
 
-    def pipe_pane(self, session_name: str, window_name: str, file_path: str) -> None:
+    def pipe_pane(
+        self, session_name: str, window_name: str, file_path: str, fifo: bool = False
+    ) -> None:
         """Start piping pane output to file.
 
+        Output goes through ``utils.log_sink``, which keeps ``file_path`` as
+        the live log and rotates it into gzip-compressed segments once it
+        exceeds ``TERMINAL_LOG_SEGMENT_BYTES``.
+
         Args:
             session_name: Tmux session name
             window_name: Tmux window name
             file_path: Absolute path to log file
+            fifo: If True, ``file_path`` is a named pipe read by cao-server
+                and output is written to it as-is
         """
         try:
             session = self.server.sessions.get(session_name=session_name)
@@ -636,7 +953,24 @@ class TmuxClient:
 
             pane = window.active_pane
             if pane:
-                pane.cmd("pipe-pane", "-o", f"cat >> {file_path}")
+                if fifo:
+                    pane.cmd("pipe-pane", "-o", f"cat > {shlex.quote(file_path)}")
+                    logger.info(
+                        f"Started pipe-pane for {session_name}:{window_name} to {file_path}"
+                    )
+                    return
+                sink = " ".join(
+                    shlex.quote(arg)
+                    for arg in (
+                        sys.executable,
+                        "-m",
+                        "cli_agent_orchestrator.utils.log_sink",
+                        file_path,
+                        str(TERMINAL_LOG_SEGMENT_BYTES),
+                        str(TERMINAL_LOG_SEGMENTS),
+                    )
+                )
+                pane.cmd("pipe-pane", "-o", sink)
                 logger.info(f"Started pipe-pane for {session_name}:{window_name} to {file_path}")
         except Exception as e:
             logger.error(f"Failed to start pipe-pane for {session_name}:{window_name}: {e}")
@@ -19,6 +19,18 @@ from cli_agent_orchestrator.models.provider import ProviderType
 # All CAO-managed tmux sessions are prefixed to distinguish them from user sessions
 SESSION_PREFIX = "cao-"
 
+# How long GET /sessions and the /sessions/events push channel reuse one tmux
+# session enumeration
+SESSION_LIST_CACHE_SECONDS = 2.0
+# Idle push connections get an SSE comment this often so proxies keep them
+# open; the session list is also rechecked then for changes made outside
+# cao-server
+SESSION_EVENTS_KEEPALIVE_SECONDS = 15.0
+# How long GET /overview reuses one round of status captures
+OVERVIEW_CACHE_SECONDS = 1.0
+# How many provider cleanups and session kills a shutdown runs at once
+SHUTDOWN_MAX_WORKERS = 16
+
 # =============================================================================
 # Provider Configuration
 # =============================================================================
@@ -53,6 +65,22 @@ LOG_DIR = CAO_HOME_DIR / "logs"
 TERMINAL_LOG_DIR = LOG_DIR / "terminal"  # Per-terminal log files for pipe-pane output
 TERMINAL_LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+# Per-terminal pipe-pane log bounds. The live log (<id>.log) is rotated once
+# it exceeds TERMINAL_LOG_SEGMENT_BYTES; rotated segments are gzip-compressed
+# (<id>.log.1.gz newest) and at most TERMINAL_LOG_SEGMENTS are kept.
+TERMINAL_LOG_SEGMENT_BYTES = 8 * 1024 * 1024
+TERMINAL_LOG_SEGMENTS = 4
+
+# Where pipe-pane output goes: "file" appends to <id>.log on disk; "memory"
+# streams it through a FIFO into a per-terminal ring buffer inside cao-server.
+TERMINAL_OUTPUT_SINK = os.environ.get("CAO_TERMINAL_OUTPUT_SINK", "file").lower()
+# Bytes of recent output kept per terminal in "memory" mode
+TERMINAL_RING_BUFFER_BYTES = 1024 * 1024
+# In "memory" mode, also write output to <id>.log from a background thread
+TERMINAL_OUTPUT_SPILL = os.environ.get("CAO_TERMINAL_OUTPUT_SPILL", "false").lower() == "true"
+# How long server shutdown waits for queued terminal archives to be written
+ARCHIVE_FLUSH_TIMEOUT_SECONDS = 30.0
+
 # =============================================================================
 # Inbox Service Configuration
 # =============================================================================
@@ -207,6 +235,20 @@ WS_ALLOWED_CLIENTS = [
     "localhost",
 ] + _split_env_list("CAO_WS_ALLOWED_CLIENTS")
 
+# Unsent output bytes buffered per terminal WebSocket viewer. A viewer that
+# falls this far behind loses the backlog and is resynced with a fresh screen.
+WS_SUBSCRIBER_BUFFER_BYTES = 1024 * 1024
+
+# Output is coalesced into WebSocket frames of at most this many bytes, waiting
+# up to this long for more output before sending a partial frame.
+WS_FRAME_MAX_BYTES = 64 * 1024
+WS_FRAME_INTERVAL_SECONDS = 0.016
+
+# Negotiate permessage-deflate on WebSocket connections. Terminal output
+# compresses well, which matters for viewers on slow links; set
+# ``CAO_WS_PER_MESSAGE_DEFLATE=false`` to trade bandwidth for server CPU.
+WS_PER_MESSAGE_DEFLATE = os.environ.get("CAO_WS_PER_MESSAGE_DEFLATE", "true").lower() == "true"
+
 # =============================================================================
 # Memory System Configuration
 # =============================================================================
@@ -220,6 +262,31 @@ MEMORY_BASE_DIR = CAO_HOME_DIR / "memory"
 MEMORY_MAX_PER_SCOPE = 10
 MEMORY_SCOPE_BUDGET_CHARS = 1000
 
+# Rendered <cao-memory> blocks kept for reuse across terminals that share the
+# same session/project/global scopes (e.g. a fan-out of workers)
+MEMORY_CONTEXT_CACHE_SIZE = 256
+
+# Git-remote project identity memoized per working directory; an entry is
+# also dropped as soon as the repository's .git/config changes
+PROJECT_ID_CACHE_SIZE = 256
+PROJECT_ID_CACHE_TTL_SECONDS = 300
+
+# How long the first message to a terminal waits for the memory_manager's
+# curated <cao-memory> block before the deterministic block is sent instead
+MEMORY_CURATED_WAIT_SECONDS = 1.0
+# Background threads running curated memory requests for first messages
+MEMORY_INJECTION_WORKERS = 4
+# Background threads prefetching deterministic memory blocks at terminal
+# creation; a separate pool, so a burst of new terminals never delays a
+# curated request
+MEMORY_PREFETCH_WORKERS = 2
+
+# Threads running MemoryService's blocking file/SQLite work for its async API
+MEMORY_IO_WORKERS = 8
+
+# How often cao-server deletes memories past their retention (first run at startup)
+MEMORY_CLEANUP_INTERVAL_SECONDS = 3600
+
 # =============================================================================
 # Tool Restriction Configuration
 # =============================================================================
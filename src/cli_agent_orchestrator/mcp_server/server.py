@@ -835,7 +835,8 @@ async def memory_store(
     first 6 words of content.
 
     Use this to persist facts, decisions, user preferences, and project conventions
-    that should be available across agent sessions.
+    that should be available across agent sessions. If other memories in the same
+    scope say nearly the same thing, their keys are returned as ``duplicates``.
     """
     from cli_agent_orchestrator.services.memory_service import MemoryService
 
@@ -850,7 +851,7 @@ async def memory_store(
             tags=tags or "",
             terminal_context=terminal_context,
         )
-        return {
+        result = {
             "success": True,
             "key": memory.key,
             "scope": memory.scope,
@@ -859,6 +860,10 @@ async def memory_store(
             "action": memory.action
             or ("updated" if memory.created_at != memory.updated_at else "created"),
         }
+        if memory.duplicates:
+            # Near-identical memories already exist; the agent can merge or forget them
+            result["duplicates"] = memory.duplicates
+        return result
     except MemoryDisabledError as e:
         return {"success": False, "disabled": True, "error": str(e)}
     except Exception as e:
@@ -891,6 +896,8 @@ async def memory_recall(
 
     Returns content from matching wiki files, sorted by recency.
     When no scope is specified, results follow scope precedence: session > project > global.
+    ``search_mode="similar"`` instead returns memories worded like the query, most
+    similar first; it tolerates typos and rephrasing.
 
     Use this to check if relevant knowledge already exists before asking the user.
     """
@@ -47,6 +47,11 @@ class Memory(BaseModel):
         exclude=True,
         description="Set by store() to 'created' or 'updated'; not persisted on disk.",
     )
+    duplicates: list[str] = Field(
+        default_factory=list,
+        exclude=True,
+        description="Set by store(): keys of near-duplicate memories in the same scope.",
+    )
 
     @field_validator("scope")
     @classmethod
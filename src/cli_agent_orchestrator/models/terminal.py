@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
@@ -38,3 +38,18 @@ class Terminal(BaseModel):
         None, description="Current terminal status (live only)"
     )
     last_active: Optional[datetime] = Field(None, description="Last active timestamp")
+
+
+class TerminalTurn(BaseModel):
+    """One input/response exchange recorded in a terminal's transcript."""
+
+    terminal_id: str = Field(..., description="Terminal the turn was sent to")
+    turn: int = Field(..., description="1-based turn number within the terminal")
+    provider: Optional[str] = Field(None, description="CLI tool provider")
+    input: str = Field(..., description="Message sent to the agent")
+    response: Optional[str] = Field(None, description="Extracted agent response")
+    status_transitions: List[Tuple[str, str]] = Field(
+        default_factory=list, description="Observed (status, ISO timestamp) transitions"
+    )
+    started_at: Optional[datetime] = Field(None, description="When the input was sent")
+    completed_at: Optional[datetime] = Field(None, description="When the response was recorded")
@@ -20,12 +20,33 @@ Each provider must implement pattern matching for its specific CLI's prompt
 and output format to reliably detect status changes.
 """
 
+import hashlib
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from cli_agent_orchestrator.constants import TMUX_HISTORY_LINES
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 
 
+class _StatusFlight:
+    """A status capture in progress that concurrent callers can join."""
+
+    def __init__(self, tail_lines: Optional[int]) -> None:
+        self.tail_lines = tail_lines
+        self.done = threading.Event()
+        self.status: Optional[TerminalStatus] = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> TerminalStatus:
+        """Block until the leading caller finishes and return its result."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        assert self.status is not None
+        return self.status
+
+
 class BaseProvider(ABC):
     """Abstract base class for CLI tool providers.
 
@@ -66,6 +87,11 @@ class BaseProvider(ABC):
         self._allowed_tools: Optional[List[str]] = allowed_tools
         self._skill_prompt: Optional[str] = skill_prompt
         self._shell_baseline: Optional[str] = None
+        # Status memoization: the in-flight capture other callers can join,
+        # and the last (tail hash, state) → status classification.
+        self._status_lock = threading.Lock()
+        self._status_flight: Optional[_StatusFlight] = None
+        self._status_memo: Optional[Tuple[tuple, TerminalStatus]] = None
 
     @property
     def shell_baseline(self) -> Optional[str]:
@@ -107,18 +133,110 @@ class BaseProvider(ABC):
         """
         pass
 
-    @abstractmethod
     def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
         """Get current provider status by analyzing terminal output.
 
+        Captures the pane tail with ``_capture_status_output`` and classifies
+        it with ``_classify_status``. The API, the inbox handler and waiters
+        often ask for the same terminal's status at nearly the same time, so:
+
+        - Callers arriving while another thread is capturing this terminal
+          (same ``tail_lines``) wait for that capture and share its result
+          instead of running their own capture-pane.
+        - The classification is memoized against a hash of the captured
+          tail plus ``_status_memo_state()``. An unchanged screen returns the
+          previous result without re-running the provider's parsing.
+
         Args:
             tail_lines: Number of lines to capture from terminal (default: provider-specific)
 
         Returns:
             TerminalStatus: Current status of the provider
         """
+        with self._status_lock:
+            flight = self._status_flight
+            is_leader = flight is None or flight.tail_lines != tail_lines
+            if is_leader:
+                flight = _StatusFlight(tail_lines)
+                self._status_flight = flight
+        assert flight is not None
+        if not is_leader:
+            return flight.wait()
+
+        try:
+            output = self._capture_status_output(tail_lines)
+            flight.status = self._classify_memoized(output, tail_lines)
+            return flight.status
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._status_lock:
+                if self._status_flight is flight:
+                    self._status_flight = None
+            flight.done.set()
+
+    def _classify_memoized(self, output: str, tail_lines: Optional[int]) -> TerminalStatus:
+        """Classify ``output``, reusing the last result if nothing changed."""
+        if not output:
+            # Empty or missing captures are cheap to classify; skip the memo.
+            return self._classify_status(output)
+        digest = hashlib.blake2b(output.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        memo = self._status_memo
+        if memo is not None and memo[0] == (digest, tail_lines, self._status_memo_state()):
+            return memo[1]
+
+        status = self._classify_status(output)
+        # Key on the state *after* classification: some providers latch
+        # flags while parsing (e.g. Kimi's ``_has_received_input``), and the
+        # next call sees the latched value.
+        self._status_memo = ((digest, tail_lines, self._status_memo_state()), status)
+        return status
+
+    def status_capture_lines(self) -> Optional[int]:
+        """Pane tail length ``get_status()`` captures, for batched captures.
+
+        Callers that capture many panes at once (``TmuxClient.capture_panes``)
+        take this many lines and pass them to ``classify_captured_status``.
+        Return None if the status capture is not a plain pane tail; callers
+        then fall back to ``get_status()``.
+        """
+        return TMUX_HISTORY_LINES
+
+    def classify_captured_status(self, capture: str) -> TerminalStatus:
+        """Classify a raw pane tail captured by someone else (see ``status_capture_lines``)."""
+        return self._classify_memoized(self._status_output_from_capture(capture), None)
+
+    def _status_output_from_capture(self, capture: str) -> str:
+        """Turn a raw ``capture-pane -e`` tail into what ``_capture_status_output`` returns."""
+        return capture
+
+    @abstractmethod
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        """Capture the terminal output that ``_classify_status`` parses.
+
+        Providers implement this with their module-level ``tmux_client`` so
+        tests can patch the capture per provider module.
+        """
         pass
 
+    @abstractmethod
+    def _classify_status(self, output: str) -> TerminalStatus:
+        """Map captured terminal output to a TerminalStatus.
+
+        Must depend only on ``output`` and the flags reported by
+        ``_status_memo_state()``; otherwise a memoized result can go stale.
+        """
+        pass
+
+    def _status_memo_state(self) -> Tuple[object, ...]:
+        """Provider flags that change ``_classify_status`` results for the same output.
+
+        Part of the status memo key. Override when classification reads
+        instance state (e.g. "input received" latches).
+        """
+        return ()
+
     @abstractmethod
     def get_idle_pattern_for_log(self) -> str:
         """Get pattern that indicates IDLE state in log file output.
@@ -318,7 +318,10 @@ class ClaudeCodeProvider(BaseProvider):
         self._initialized = True
         return True
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+
+    def _classify_status(self, output: str) -> TerminalStatus:
         """Get Claude Code status by analyzing terminal output.
 
         Uses a structural "thinking-before-separator" check as the primary
@@ -351,8 +354,6 @@ class ClaudeCodeProvider(BaseProvider):
         See: https://github.com/awslabs/cli-agent-orchestrator/issues/104
         """
 
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
-
         if not output:
             return TerminalStatus.ERROR
 
@@ -289,10 +289,11 @@ class CodexProvider(BaseProvider):
         self._initialized = True
         return True
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
-        """Get Codex status by analyzing terminal output."""
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
 
+    def _classify_status(self, output: str) -> TerminalStatus:
+        """Get Codex status by analyzing terminal output."""
         if not output:
             return TerminalStatus.ERROR
 
@@ -48,6 +48,8 @@ COPILOT_STATUS_BAR_PATTERN = r"^\s*(?:autopilot|plan|interactive)\s*[·•]"
 # Path can be tilde-prefixed (home) or absolute (e.g. /tmp/...), so allow both.
 COPILOT_CWD_BREADCRUMB_PATTERN = r"^\s+(?:~|/)[^\[]*\["
 PROCESSING_LINE_PATTERN = r"^(?:[●◐◑◒◓◉◎∙]\s*)?.*\besc to cancel\b.*$"
+# Pane tail captured for status checks
+STATUS_TAIL_LINES = 220
 
 
 class CopilotCliProvider(BaseProvider):
@@ -414,9 +416,17 @@ class CopilotCliProvider(BaseProvider):
             break
         return trimmed
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
-        effective_tail_lines = tail_lines if tail_lines is not None else 220
-        output = self._history(tail_lines=effective_tail_lines)
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        effective_tail_lines = tail_lines if tail_lines is not None else STATUS_TAIL_LINES
+        return self._history(tail_lines=effective_tail_lines)
+
+    def status_capture_lines(self) -> Optional[int]:
+        return STATUS_TAIL_LINES
+
+    def _status_output_from_capture(self, capture: str) -> str:
+        return self._clean(capture)
+
+    def _classify_status(self, output: str) -> TerminalStatus:
         if not output.strip():
             return TerminalStatus.PROCESSING
 
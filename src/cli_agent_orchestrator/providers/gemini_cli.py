@@ -33,9 +33,10 @@ import os
 import re
 import shlex
 import shutil
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from cli_agent_orchestrator.clients.tmux import tmux_client
 from cli_agent_orchestrator.constants import GEMINI_WORKSPACES_DIR
@@ -47,6 +48,11 @@ from cli_agent_orchestrator.utils.terminal import wait_for_shell, wait_until_sta
 logger = logging.getLogger(__name__)
 
 
+# Serializes read-modify-write of ~/.gemini/settings.json, which every Gemini
+# terminal shares; terminals are created and cleaned up on concurrent threads.
+_settings_lock = threading.Lock()
+
+
 # Custom exception for provider errors
 class ProviderError(Exception):
     """Exception raised for Gemini CLI provider-specific errors."""
@@ -396,38 +402,39 @@ class GeminiCliProvider(BaseProvider):
         """
         settings_path = Path.home() / ".gemini" / "settings.json"
 
-        # Read existing settings (or start fresh)
-        if settings_path.exists():
-            with open(settings_path) as f:
-                settings = json.load(f)
-        else:
-            settings_path.parent.mkdir(parents=True, exist_ok=True)
-            settings = {}
-
-        if "mcpServers" not in settings:
-            settings["mcpServers"] = {}
-
-        for server_name, server_config in mcp_servers.items():
-            if isinstance(server_config, dict):
-                cfg = server_config
+        with _settings_lock:
+            # Read existing settings (or start fresh)
+            if settings_path.exists():
+                with open(settings_path) as f:
+                    settings = json.load(f)
             else:
-                cfg = server_config.model_dump(exclude_none=True)
-
-            entry = {
-                "command": cfg.get("command", ""),
-                "args": cfg.get("args", []),
-            }
-            # Forward CAO_TERMINAL_ID so MCP servers (e.g. cao-mcp-server)
-            # can identify the current terminal for handoff/assign operations.
-            env = dict(cfg.get("env", {}))
-            env["CAO_TERMINAL_ID"] = self.terminal_id
-            entry["env"] = env
-
-            settings["mcpServers"][server_name] = entry
-            self._mcp_server_names.append(server_name)
+                settings_path.parent.mkdir(parents=True, exist_ok=True)
+                settings = {}
+
+            if "mcpServers" not in settings:
+                settings["mcpServers"] = {}
+
+            for server_name, server_config in mcp_servers.items():
+                if isinstance(server_config, dict):
+                    cfg = server_config
+                else:
+                    cfg = server_config.model_dump(exclude_none=True)
+
+                entry = {
+                    "command": cfg.get("command", ""),
+                    "args": cfg.get("args", []),
+                }
+                # Forward CAO_TERMINAL_ID so MCP servers (e.g. cao-mcp-server)
+                # can identify the current terminal for handoff/assign operations.
+                env = dict(cfg.get("env", {}))
+                env["CAO_TERMINAL_ID"] = self.terminal_id
+                entry["env"] = env
+
+                settings["mcpServers"][server_name] = entry
+                self._mcp_server_names.append(server_name)
 
-        with open(settings_path, "w") as f:
-            json.dump(settings, f, indent=2)
+            with open(settings_path, "w") as f:
+                json.dump(settings, f, indent=2)
 
     def _unregister_mcp_servers(self) -> None:
         """Remove MCP servers that were registered during initialization.
@@ -445,15 +452,16 @@ class GeminiCliProvider(BaseProvider):
             return
 
         try:
-            with open(settings_path) as f:
-                settings = json.load(f)
+            with _settings_lock:
+                with open(settings_path) as f:
+                    settings = json.load(f)
 
-            mcp_servers = settings.get("mcpServers", {})
-            for server_name in self._mcp_server_names:
-                mcp_servers.pop(server_name, None)
+                mcp_servers = settings.get("mcpServers", {})
+                for server_name in self._mcp_server_names:
+                    mcp_servers.pop(server_name, None)
 
-            with open(settings_path, "w") as f:
-                json.dump(settings, f, indent=2)
+                with open(settings_path, "w") as f:
+                    json.dump(settings, f, indent=2)
         except Exception as e:
             logger.warning(f"Failed to unregister MCP servers from settings.json: {e}")
 
@@ -562,11 +570,17 @@ class GeminiCliProvider(BaseProvider):
         """
         self._received_input_after_init = True
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
+    def _status_memo_state(self) -> Tuple[object, ...]:
+        return (self._initialized, self._uses_prompt_interactive, self._received_input_after_init)
+
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+
+    def _classify_status(self, output: str) -> TerminalStatus:
         """Get Gemini CLI status by analyzing terminal output.
 
         Status detection logic:
-        1. Capture tmux pane output (full or tail)
+        1. Take the captured tmux pane output (full or tail)
         2. Strip ANSI codes for reliable text matching
         3. Check bottom N lines for the idle prompt pattern (* + placeholder text)
         4. If idle prompt found: distinguish IDLE vs COMPLETED by checking for ✦ response
@@ -574,13 +588,11 @@ class GeminiCliProvider(BaseProvider):
         6. Check for ERROR patterns as fallback
 
         Args:
-            tail_lines: Optional number of lines to capture from bottom
+            output: Captured tmux pane output (see ``_capture_status_output``)
 
         Returns:
             TerminalStatus indicating current state
         """
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
-
         if not output:
             return TerminalStatus.ERROR
 
@@ -33,7 +33,7 @@ import shlex
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from cli_agent_orchestrator.clients.tmux import tmux_client
 from cli_agent_orchestrator.models.terminal import TerminalStatus
@@ -359,11 +359,17 @@ class KimiCliProvider(BaseProvider):
         self._initialized = True
         return True
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
+    def _status_memo_state(self) -> Tuple[object, ...]:
+        return (self._has_received_input,)
+
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+
+    def _classify_status(self, output: str) -> TerminalStatus:
         """Get Kimi CLI status by analyzing terminal output.
 
         Status detection logic:
-        1. Capture tmux pane output (full or tail)
+        1. Take the captured tmux pane output (full or tail)
         2. Strip ANSI codes for reliable text matching
         3. Latch ``_has_received_input`` when user input box (╭─) is detected
         4. Check bottom N lines for the idle prompt pattern
@@ -381,13 +387,11 @@ class KimiCliProvider(BaseProvider):
           IS still visible in the capture, and persists through completion
 
         Args:
-            tail_lines: Optional number of lines to capture from bottom
+            output: Captured tmux pane output (see ``_capture_status_output``)
 
         Returns:
             TerminalStatus indicating current state
         """
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
-
         if not output:
             return TerminalStatus.ERROR
 
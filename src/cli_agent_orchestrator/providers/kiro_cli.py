@@ -20,7 +20,7 @@ The provider detects the following terminal states:
 import logging
 import re
 import shlex
-from typing import Optional
+from typing import Optional, Tuple
 
 from cli_agent_orchestrator.clients.tmux import tmux_client
 from cli_agent_orchestrator.models.terminal import TerminalStatus
@@ -135,6 +135,9 @@ class KiroCliProvider(BaseProvider):
         super().__init__(terminal_id, session_name, window_name, allowed_tools)
         self._initialized = False
         self._input_received = False
+        # Set by _classify_status when the capture shows no prompt at all;
+        # see _classify_memoized.
+        self._prompt_missing = False
         self._agent_profile = agent_profile
 
         # Build dynamic prompt pattern based on agent profile
@@ -276,7 +279,34 @@ class KiroCliProvider(BaseProvider):
         self._initialized = True
         return True
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
+    def _status_memo_state(self) -> Tuple[object, ...]:
+        return (self._initialized, self._input_received, self.shell_baseline)
+
+    def _classify_memoized(self, output: str, tail_lines: Optional[int]) -> TerminalStatus:
+        """Memoized classification, then the live shell check (Check 3).
+
+        Whether kiro-cli has exited to the shell is read from the pane's
+        current command, not from the capture, so it runs on every call
+        instead of being cached with an unchanged screen. The memo holds only
+        the last classification, so ``_prompt_missing`` always describes it.
+        """
+        status = super()._classify_memoized(output, tail_lines)
+        if (
+            status == TerminalStatus.PROCESSING
+            and self._prompt_missing
+            and self._initialized
+            and self.shell_baseline
+        ):
+            current_cmd = tmux_client.get_pane_current_command(self.session_name, self.window_name)
+            if current_cmd == self.shell_baseline:
+                return TerminalStatus.IDLE
+        return status
+
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        logger.debug(f"get_status: tail_lines={tail_lines}")
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+
+    def _classify_status(self, output: str) -> TerminalStatus:
         """Get Kiro CLI status by analyzing terminal output.
 
         Status detection logic (in priority order):
@@ -288,19 +318,16 @@ class KiroCliProvider(BaseProvider):
         6. Only prompt visible → IDLE (waiting for input)
 
         Args:
-            tail_lines: Number of lines to capture from terminal history.
-                        If None, uses default from tmux_client.
+            output: Captured terminal history (see ``_capture_status_output``).
 
         Returns:
             Current TerminalStatus enum value
         """
-        logger.debug(f"get_status: tail_lines={tail_lines}")
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
-
         # No output indicates a terminal error
         if not output:
             return TerminalStatus.ERROR
 
+        self._prompt_missing = False
         # Strip ANSI codes once for all pattern matching
         # This simplifies regex patterns and improves reliability
         clean_output = re.sub(ANSI_CODE_PATTERN, "", output)
@@ -335,9 +362,10 @@ class KiroCliProvider(BaseProvider):
             if not idle_after_working:
                 return TerminalStatus.PROCESSING
 
-        # Check 3: If no idle prompt found, determine if kiro is still running.
-        # Compare current pane command against the shell captured before kiro launched.
-        # If they match, kiro has exited and the shell is showing again → IDLE.
+        # Check 3: If no idle prompt found, kiro is still running — unless it
+        # has exited and the shell is showing again. That depends on the
+        # pane's current command, which _classify_memoized compares against
+        # the shell captured before kiro launched (→ IDLE).
         #
         # Gated on self._initialized: between send_keys("kiro-cli chat ...")
         # and the moment kiro-cli exec's, the pane's current command still
@@ -346,12 +374,7 @@ class KiroCliProvider(BaseProvider):
         # immediately after launch, which lets pre-init pastes get absorbed
         # by Kiro's boot screen and silently dropped.
         if not has_idle_prompt and not has_new_tui_idle:
-            if self._initialized and self.shell_baseline:
-                current_cmd = tmux_client.get_pane_current_command(
-                    self.session_name, self.window_name
-                )
-                if current_cmd == self.shell_baseline:
-                    return TerminalStatus.IDLE
+            self._prompt_missing = True
             return TerminalStatus.PROCESSING
 
         # Check 2: Look for known error messages in the output
@@ -173,7 +173,10 @@ class OpenCodeCliProvider(BaseProvider):
         # env vars are shell words; join cmd parts with shlex for proper quoting
         return " ".join(env_pairs) + " " + shlex.join(cmd_parts)
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+
+    def _classify_status(self, output: str) -> TerminalStatus:
         """Detect current TUI state from the tmux capture buffer.
 
         Priority order:
@@ -186,12 +189,11 @@ class OpenCodeCliProvider(BaseProvider):
         5. ERROR — fallback
 
         Args:
-            tail_lines: Lines to capture; None uses the tmux_client default.
+            output: Captured tmux buffer (see ``_capture_status_output``).
 
         Returns:
             Current TerminalStatus.
         """
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
         if not output:
             return TerminalStatus.ERROR
 
@@ -65,11 +65,12 @@ class QCliProvider(BaseProvider):
         self._initialized = True
         return True
 
-    def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
-        """Get Q CLI status by analyzing terminal output."""
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
         logger.debug(f"get_status: tail_lines={tail_lines}")
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+        return tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
 
+    def _classify_status(self, output: str) -> TerminalStatus:
+        """Get Q CLI status by analyzing terminal output."""
         if not output:
             return TerminalStatus.ERROR
 
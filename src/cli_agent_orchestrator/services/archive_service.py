@@ -0,0 +1,204 @@
+"""Background archival of deleted terminals.
+
+``terminal_service.delete_terminal`` used to write the scrollback and the
+snapshot files before it could kill the window. Now it only streams one
+plain-text ``capture-pane -S -`` of the pane to ``<id>.scrollback.capture``
+(chunk by chunk, so the history is never held in memory), records the
+snapshot metadata and queues an archive job; a single worker thread then
+writes, off the request path:
+
+- ``<id>.snapshot.json`` — metadata for ``cao terminal restore``
+- ``<id>.scrollback.gz`` — the terminal's output as gzip-compressed plain
+  text: the captured scrollback, which reads the same for full-screen TUIs
+  as it did on screen, compressed from the capture file, which is then
+  removed. Only if the capture failed is it rebuilt from the
+  raw pipe-pane output: the rotated log segments plus the live
+  ``<id>.log`` (file sink), or the in-memory ring buffer handed over by the
+  caller (memory sink without spill). For line-oriented output this is
+  equivalent; for TUIs it also contains every repaint.
+
+Jobs survive the window being gone because the worker never reads tmux.
+Pending jobs are lost if the server process dies; ``flush()`` waits for
+them.
+"""
+
+import codecs
+import gzip
+import json
+import logging
+import queue
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from cli_agent_orchestrator.constants import TERMINAL_LOG_DIR, TERMINAL_LOG_SEGMENTS
+from cli_agent_orchestrator.utils.log_sink import segment_path
+from cli_agent_orchestrator.utils.terminal import strip_ansi
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_BYTES = 64 * 1024
+# Undecoded text kept back waiting for a newline before it is stripped anyway
+MAX_PARTIAL_LINE_CHARS = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveJob:
+    """A deleted terminal waiting to be archived.
+
+    Attributes:
+        terminal_id: Terminal being archived
+        snapshot: Metadata written to ``<id>.snapshot.json``
+        output: Raw pane output to archive if ``scrollback`` is None; if
+            also None it is read from the terminal's pipe-pane log files
+        scrollback_path: File holding the plain-text ``capture-pane -S -``
+            of the pane, archived as is when given and removed afterwards
+    """
+
+    terminal_id: str
+    snapshot: Dict[str, Any]
+    output: Optional[bytes] = None
+    scrollback_path: Optional[Path] = None
+
+
+_queue: "queue.Queue[Any]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def scrollback_archive_path(terminal_id: str) -> Path:
+    return TERMINAL_LOG_DIR / f"{terminal_id}.scrollback.gz"
+
+
+def write_scrollback_capture(terminal_id: str, chunks: Iterator[bytes]) -> Path:
+    """Stream a pane capture to disk for the worker, one chunk at a time.
+
+    The partial file is removed if the capture fails.
+    """
+    path = TERMINAL_LOG_DIR / f"{terminal_id}.scrollback.capture"
+    try:
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _iter_log_output(terminal_id: str) -> Iterator[bytes]:
+    """Yield a terminal's logged output, oldest rotated segment first."""
+    log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
+    for index in range(TERMINAL_LOG_SEGMENTS, 0, -1):
+        segment = segment_path(log_path, index)
+        if segment.exists():
+            with gzip.open(segment, "rb") as f:
+                while chunk := f.read(READ_CHUNK_BYTES):
+                    yield chunk
+    if log_path.exists():
+        with open(log_path, "rb") as f:
+            while chunk := f.read(READ_CHUNK_BYTES):
+                yield chunk
+
+
+def iter_plain_text(chunks: Iterator[bytes]) -> Iterator[str]:
+    """Decode raw pane output and strip escape sequences, chunk by chunk.
+
+    Text is held back until the next newline so escape sequences split
+    across chunks are still recognised.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        cut = pending.rfind("\n") + 1
+        if not cut and len(pending) > MAX_PARTIAL_LINE_CHARS:
+            cut = len(pending)
+        if cut:
+            yield strip_ansi(pending[:cut])
+            pending = pending[cut:]
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield strip_ansi(pending)
+
+
+def archive_terminal(job: ArchiveJob) -> None:
+    """Write a terminal's snapshot and compressed scrollback (runs on the worker)."""
+    target = scrollback_archive_path(job.terminal_id)
+    tmp = target.with_suffix(".gz.tmp")
+    if job.scrollback_path is not None:
+        try:
+            with open(job.scrollback_path, "rb") as src, gzip.open(tmp, "wb") as f:
+                shutil.copyfileobj(src, f, READ_CHUNK_BYTES)
+        finally:
+            job.scrollback_path.unlink(missing_ok=True)
+    else:
+        chunks = iter([job.output]) if job.output is not None else _iter_log_output(job.terminal_id)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for text in iter_plain_text(chunks):
+                f.write(text)
+    tmp.replace(target)
+
+    snapshot_path = TERMINAL_LOG_DIR / f"{job.terminal_id}.snapshot.json"
+    snapshot_path.write_text(json.dumps(job.snapshot, indent=2), encoding="utf-8")
+    logger.info(f"Archived terminal {job.terminal_id}")
+
+
+def _run() -> None:
+    while True:
+        job = _queue.get()
+        try:
+            if isinstance(job, threading.Event):
+                job.set()
+            else:
+                archive_terminal(job)
+        except Exception as e:
+            logger.warning(f"Failed to archive terminal {job.terminal_id}: {e}")
+        finally:
+            _queue.task_done()
+
+
+def enqueue(job: ArchiveJob) -> None:
+    """Queue a terminal for archival; returns immediately."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="cao-archiver", daemon=True)
+            _worker.start()
+    _queue.put(job)
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Wait until every job queued so far is archived; False on timeout."""
+    with _worker_lock:
+        if _worker is None:
+            return True
+    done = threading.Event()
+    _queue.put(done)
+    return done.wait(timeout)
+
+
+def iter_archived_scrollback(terminal_id: str) -> Optional[Iterator[bytes]]:
+    """Chunks of a deleted terminal's archived scrollback, or None if there is none.
+
+    Also reads the uncompressed ``<id>.scrollback`` written by older versions.
+    """
+    archive = scrollback_archive_path(terminal_id)
+    legacy = TERMINAL_LOG_DIR / f"{terminal_id}.scrollback"
+    if archive.exists():
+        opener: Any = gzip.open
+        path = archive
+    elif legacy.exists():
+        opener = open
+        path = legacy
+    else:
+        return None
+
+    def chunks() -> Iterator[bytes]:
+        with opener(path, "rb") as f:
+            while chunk := f.read(READ_CHUNK_BYTES):
+                yield chunk
+
+    return chunks()
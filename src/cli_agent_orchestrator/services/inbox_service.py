@@ -39,7 +39,7 @@ from cli_agent_orchestrator.models.provider import ProviderType
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.plugins import PluginRegistry
 from cli_agent_orchestrator.providers.manager import provider_manager
-from cli_agent_orchestrator.services import terminal_service
+from cli_agent_orchestrator.services import output_stream_service, terminal_service
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +49,13 @@ def _get_log_tail(terminal_id: str, lines: int = 100) -> str:
 
     Default of 100 lines covers full-screen TUI providers where the idle
     prompt sits mid-screen with 30+ padding lines below it.
-    Reading 100 lines via tail is still sub-millisecond.
+    Reading 100 lines via tail is still sub-millisecond. In memory output
+    mode the terminal's ring buffer is read instead of the file.
     """
+    stream = output_stream_service.get_stream(terminal_id)
+    if stream is not None:
+        return stream.buffer.tail_text(lines)
+
     log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
     try:
         result = subprocess.run(
@@ -175,9 +180,21 @@ class LogFileHandler(FileSystemEventHandler):
         if isinstance(event, FileModifiedEvent) and event.src_path.endswith(".log"):
             log_path = Path(event.src_path)
             terminal_id = log_path.stem
+            if output_stream_service.get_stream(terminal_id) is not None:
+                # Spilled log of an in-memory stream; the stream daemon
+                # already calls handle_output_change() for this terminal.
+                return
             logger.debug(f"Log file modified: {terminal_id}.log")
             self._handle_log_change(terminal_id)
 
+    def handle_output_change(self, terminal_id: str) -> None:
+        """Attempt inbox delivery for a terminal that printed new output.
+
+        Entry point for output sources other than the log file watcher,
+        such as in-memory output streams.
+        """
+        self._handle_log_change(terminal_id)
+
     def _handle_log_change(self, terminal_id: str):
         """Handle log file change and attempt message delivery."""
         try:
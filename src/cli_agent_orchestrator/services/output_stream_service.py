@@ -0,0 +1,289 @@
+"""In-memory terminal output streams (``CAO_TERMINAL_OUTPUT_SINK=memory``).
+
+In the default "file" mode tmux pipe-pane appends every byte a terminal
+prints to ``<id>.log`` and readers go back to disk for it. In "memory" mode
+each terminal instead gets a FIFO owned by cao-server:
+
+- tmux pipe-pane writes pane output into ``<id>.pipe``
+- a reader thread drains the FIFO into a bounded ``OutputRingBuffer``
+- subscribers (e.g. WebSocket viewers) get each chunk as it arrives
+- the inbox idle check reads the ring buffer tail instead of the log file
+- optionally (``CAO_TERMINAL_OUTPUT_SPILL=true``) chunks are also written to
+  the rotating ``<id>.log`` from a background thread
+
+Streams only live as long as the cao-server process that created them.
+"""
+
+import logging
+import os
+import queue
+import select
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from cli_agent_orchestrator.constants import (
+    TERMINAL_LOG_DIR,
+    TERMINAL_LOG_SEGMENT_BYTES,
+    TERMINAL_LOG_SEGMENTS,
+    TERMINAL_RING_BUFFER_BYTES,
+)
+from cli_agent_orchestrator.utils.log_sink import RotatingLogWriter
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_BYTES = 64 * 1024
+# Seconds the reader waits for FIFO data before re-checking for shutdown
+READ_POLL_SECONDS = 0.5
+# Chunks buffered for the spill writer before new ones are dropped
+SPILL_QUEUE_CHUNKS = 1024
+
+OutputListener = Callable[[bytes], None]
+
+
+class OutputRingBuffer:
+    """Thread-safe bounded byte buffer addressed by absolute stream offsets.
+
+    Offsets count every byte ever appended, so a reader can resume with
+    ``read_since(offset)`` and learn whether it fell behind the buffer.
+    Bytes live in a fixed ``capacity``-sized array written circularly, so
+    appending never moves what is already buffered.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._buf = bytearray(capacity)
+        self._end = 0
+        self._lock = threading.Lock()
+
+    @property
+    def end_offset(self) -> int:
+        """Absolute offset just past the last byte appended."""
+        with self._lock:
+            return self._end
+
+    def append(self, data: bytes) -> None:
+        with self._lock:
+            self._end += len(data)
+            # Only the last ``capacity`` bytes of an oversized chunk survive.
+            data = memoryview(data)[-self.capacity :]
+            pos = (self._end - len(data)) % self.capacity
+            first = min(len(data), self.capacity - pos)
+            self._buf[pos : pos + first] = data[:first]
+            self._buf[: len(data) - first] = data[first:]
+
+    def _start(self) -> int:
+        return max(0, self._end - self.capacity)
+
+    def _copy(self, start: int, stop: int) -> bytes:
+        """Return the buffered bytes between absolute offsets ``start`` and ``stop``."""
+        if stop <= start:
+            return b""
+        pos = start % self.capacity
+        size = stop - start
+        if pos + size <= self.capacity:
+            return bytes(self._buf[pos : pos + size])
+        return bytes(self._buf[pos:]) + bytes(self._buf[: pos + size - self.capacity])
+
+    def snapshot(self) -> Tuple[bytes, int]:
+        """Return everything still buffered and the end offset it reaches."""
+        with self._lock:
+            return self._copy(self._start(), self._end), self._end
+
+    def read_since(self, offset: int, max_bytes: Optional[int] = None) -> Tuple[bytes, int]:
+        """Return bytes from ``offset`` (clamped to what is still buffered) onwards.
+
+        At most ``max_bytes`` are returned if given. The second element is
+        the offset just past the returned bytes, i.e. where to resume.
+        """
+        with self._lock:
+            first = min(max(offset, self._start()), self._end)
+            last = self._end if max_bytes is None else min(self._end, first + max_bytes)
+            return self._copy(first, last), last
+
+    def tail_text(self, lines: int) -> str:
+        """Decode the buffered bytes and return the last ``lines`` lines."""
+        data, _ = self.snapshot()
+        text = data.decode("utf-8", errors="replace")
+        return "\n".join(text.splitlines()[-lines:])
+
+
+class TerminalOutputStream:
+    """FIFO reader that feeds a terminal's pane output into a ring buffer."""
+
+    def __init__(
+        self,
+        terminal_id: str,
+        fifo_path: Path,
+        capacity: int = TERMINAL_RING_BUFFER_BYTES,
+        spill_path: Optional[Path] = None,
+        on_activity: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.terminal_id = terminal_id
+        self.fifo_path = fifo_path
+        self.buffer = OutputRingBuffer(capacity)
+        self._listeners: List[OutputListener] = []
+        self._listeners_lock = threading.Lock()
+        self._on_activity = on_activity
+        self._stop = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self._spill_path = spill_path
+        self._spill_queue: Optional[queue.Queue] = None
+        self._spill_thread: Optional[threading.Thread] = None
+        self.spill_dropped_chunks = 0
+
+    def start(self) -> None:
+        """Create the FIFO and start draining it."""
+        if self.fifo_path.exists():
+            self.fifo_path.unlink()
+        os.mkfifo(self.fifo_path, 0o600)
+        # O_RDWR keeps a writer end open ourselves, so opening never blocks
+        # and the FIFO doesn't hit EOF when tmux restarts its pipe command.
+        fd = os.open(self.fifo_path, os.O_RDWR | os.O_NONBLOCK)
+
+        if self._spill_path is not None:
+            self._spill_queue = queue.Queue(maxsize=SPILL_QUEUE_CHUNKS)
+            self._spill_thread = threading.Thread(
+                target=self._spill_loop, name=f"cao-spill-{self.terminal_id}", daemon=True
+            )
+            self._spill_thread.start()
+
+        self._reader = threading.Thread(
+            target=self._read_loop, args=(fd,), name=f"cao-pipe-{self.terminal_id}", daemon=True
+        )
+        self._reader.start()
+
+    def stop(self) -> None:
+        """Stop the reader and spill threads and remove the FIFO."""
+        self._stop.set()
+        if self._reader is not None:
+            self._reader.join(timeout=READ_POLL_SECONDS * 4)
+        if self._spill_queue is not None:
+            self._spill_queue.put(None)
+            if self._spill_thread is not None:
+                self._spill_thread.join(timeout=5)
+        self.fifo_path.unlink(missing_ok=True)
+
+    def subscribe(self, listener: OutputListener) -> Callable[[], None]:
+        """Call ``listener`` with every new chunk; returns an unsubscribe function.
+
+        Listeners run on the reader thread and must not block; async
+        consumers should hand off with ``loop.call_soon_threadsafe``.
+        """
+        with self._listeners_lock:
+            self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            with self._listeners_lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def feed(self, data: bytes) -> None:
+        """Publish a chunk of pane output to the buffer, listeners and spill."""
+        self.buffer.append(data)
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(data)
+            except Exception as e:
+                logger.debug(f"Output listener for {self.terminal_id} failed: {e}")
+        if self._spill_queue is not None:
+            try:
+                self._spill_queue.put_nowait(data)
+            except queue.Full:
+                self.spill_dropped_chunks += 1
+        if self._on_activity is not None:
+            self._on_activity(self.terminal_id)
+
+    def _read_loop(self, fd: int) -> None:
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd], [], [], READ_POLL_SECONDS)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(fd, READ_CHUNK_BYTES)
+                except BlockingIOError:
+                    continue
+                if data:
+                    self.feed(data)
+        except Exception as e:
+            logger.error(f"Output stream reader for {self.terminal_id} failed: {e}")
+        finally:
+            os.close(fd)
+
+    def _spill_loop(self) -> None:
+        assert self._spill_queue is not None and self._spill_path is not None
+        writer = RotatingLogWriter(
+            self._spill_path, TERMINAL_LOG_SEGMENT_BYTES, TERMINAL_LOG_SEGMENTS
+        )
+        try:
+            while True:
+                chunk = self._spill_queue.get()
+                if chunk is None:
+                    break
+                writer.write(chunk)
+        except Exception as e:
+            logger.error(f"Output spill for {self.terminal_id} failed: {e}")
+        finally:
+            writer.close()
+
+
+# Active streams keyed by terminal ID, plus terminals with output since the
+# last ``pop_active_terminals()`` call.
+_streams: Dict[str, TerminalOutputStream] = {}
+_active_terminals: Set[str] = set()
+_lock = threading.Lock()
+
+
+def _mark_active(terminal_id: str) -> None:
+    with _lock:
+        _active_terminals.add(terminal_id)
+
+
+def start_stream(terminal_id: str, spill: bool = False) -> Path:
+    """Create and start the output stream for a terminal; returns the FIFO path."""
+    fifo_path = TERMINAL_LOG_DIR / f"{terminal_id}.pipe"
+    stream = TerminalOutputStream(
+        terminal_id,
+        fifo_path,
+        spill_path=TERMINAL_LOG_DIR / f"{terminal_id}.log" if spill else None,
+        on_activity=_mark_active,
+    )
+    stream.start()
+    with _lock:
+        previous = _streams.pop(terminal_id, None)
+        _streams[terminal_id] = stream
+    if previous is not None:
+        previous.stop()
+    logger.info(f"Started in-memory output stream for {terminal_id}")
+    return fifo_path
+
+
+def get_stream(terminal_id: str) -> Optional[TerminalOutputStream]:
+    """Return the terminal's output stream, or None in file mode / if unknown."""
+    with _lock:
+        return _streams.get(terminal_id)
+
+
+def stop_stream(terminal_id: str) -> bool:
+    """Stop and forget a terminal's output stream."""
+    with _lock:
+        stream = _streams.pop(terminal_id, None)
+        _active_terminals.discard(terminal_id)
+    if stream is None:
+        return False
+    stream.stop()
+    logger.info(f"Stopped in-memory output stream for {terminal_id}")
+    return True
+
+
+def pop_active_terminals() -> Set[str]:
+    """Return terminals that produced output since the previous call."""
+    global _active_terminals
+    with _lock:
+        active, _active_terminals = _active_terminals, set()
+    return active
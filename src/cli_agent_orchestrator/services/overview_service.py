@@ -0,0 +1,120 @@
+"""Dashboard overview: every session, terminal, status and inbox count at once.
+
+Building the same picture from the per-resource endpoints costs one request
+per session plus one per terminal, each status check running its own
+capture-pane. ``get_overview()`` instead uses:
+
+- the shared session list cache (``session_service.get_sessions_snapshot``)
+- one database query for terminals and their pending inbox counts
+- one tmux invocation capturing every terminal's pane tail
+  (``TmuxClient.capture_panes``), classified by each provider
+
+The result is cached for ``OVERVIEW_CACHE_SECONDS`` so concurrent dashboards
+share it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from cli_agent_orchestrator.clients.database import list_terminals_with_pending_counts
+from cli_agent_orchestrator.clients.tmux import tmux_client
+from cli_agent_orchestrator.constants import OVERVIEW_CACHE_SECONDS
+from cli_agent_orchestrator.providers.base import BaseProvider
+from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.services import session_service
+
+logger = logging.getLogger(__name__)
+
+_overview: Optional[Dict[str, Any]] = None
+_overview_at = 0.0
+_overview_lock = threading.Lock()
+
+
+def _provider_for(terminal_id: str) -> Optional[BaseProvider]:
+    try:
+        return provider_manager.get_provider(terminal_id)
+    except Exception as e:
+        logger.debug(f"No provider for terminal {terminal_id}: {e}")
+        return None
+
+
+def _statuses(terminals: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Status of each terminal, from one batched capture where possible."""
+    providers = {t["id"]: _provider_for(t["id"]) for t in terminals}
+    batched: Set[str] = set()
+    targets: List[Tuple[str, str, Optional[int]]] = []
+    for t in terminals:
+        provider = providers[t["id"]]
+        if provider is None:
+            continue
+        lines = provider.status_capture_lines()
+        if lines is not None:
+            batched.add(t["id"])
+            targets.append((t["tmux_session"], t["tmux_window"], lines))
+
+    captures = tmux_client.capture_panes(targets) if targets else {}
+    if captures is None:
+        # A window vanished mid-batch; fall back to per-terminal checks
+        batched = set()
+        captures = {}
+
+    statuses: Dict[str, Optional[str]] = {}
+    for t in terminals:
+        provider = providers[t["id"]]
+        statuses[t["id"]] = None
+        if provider is None:
+            continue
+        try:
+            if t["id"] in batched:
+                capture = captures[(t["tmux_session"], t["tmux_window"])]
+                statuses[t["id"]] = provider.classify_captured_status(capture).value
+            else:
+                statuses[t["id"]] = provider.get_status().value
+        except Exception as e:
+            logger.warning(f"Failed to get status for terminal {t['id']}: {e}")
+    return statuses
+
+
+def _build_overview() -> Dict[str, Any]:
+    sessions = session_service.get_sessions_snapshot().sessions
+    live = {s["id"] for s in sessions}
+    terminals = [t for t in list_terminals_with_pending_counts() if t["tmux_session"] in live]
+    statuses = _statuses(terminals)
+
+    by_session: Dict[str, List[Dict[str, Any]]] = {s["id"]: [] for s in sessions}
+    for t in terminals:
+        by_session[t["tmux_session"]].append(
+            {
+                "id": t["id"],
+                "name": t["tmux_window"],
+                "provider": t["provider"],
+                "agent_profile": t["agent_profile"],
+                "status": statuses[t["id"]],
+                "last_active": t["last_active"].isoformat() if t["last_active"] else None,
+                "pending_messages": t["pending_messages"],
+            }
+        )
+    return {
+        "sessions": [
+            {
+                "id": s["id"],
+                "name": s["name"],
+                "status": s["status"],
+                "terminals": by_session[s["id"]],
+            }
+            for s in sessions
+        ]
+    }
+
+
+def get_overview(max_age: float = OVERVIEW_CACHE_SECONDS) -> Dict[str, Any]:
+    """Return all sessions with their terminals, statuses and inbox counts."""
+    global _overview, _overview_at
+    with _overview_lock:
+        if _overview is not None and time.monotonic() - _overview_at < max_age:
+            return _overview
+        _overview = _build_overview()
+        _overview_at = time.monotonic()
+        return _overview
@@ -10,8 +10,14 @@ Session Hierarchy:
 
 Key Operations:
 - list_sessions(): Get all CAO-managed sessions (filtered by SESSION_PREFIX)
+- get_sessions_snapshot(): Cached list_sessions() result with an ETag, shared
+  by every dashboard so polling and push clients don't each enumerate tmux
+- subscribe_sessions_changed(): Get called whenever a session is created or
+  deleted, so push clients need not poll
 - get_session(): Get session details including all terminal metadata
 - delete_session(): Clean up session, providers, database records, and tmux session
+- delete_sessions(): delete_session() for many sessions at once, with provider
+  cleanups and session kills spread over a bounded thread pool
 
 Session Lifecycle:
 1. create_terminal() with new_session=True creates a new tmux session
@@ -19,15 +25,25 @@ Session Lifecycle:
 3. delete_session() removes the entire session and all contained terminals
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
 
 from cli_agent_orchestrator.clients.database import (
     delete_terminals_by_session,
     list_terminals_by_session,
 )
 from cli_agent_orchestrator.clients.tmux import tmux_client
-from cli_agent_orchestrator.constants import SESSION_PREFIX
+from cli_agent_orchestrator.constants import (
+    SESSION_LIST_CACHE_SECONDS,
+    SESSION_PREFIX,
+    SHUTDOWN_MAX_WORKERS,
+)
 from cli_agent_orchestrator.models.terminal import Terminal
 from cli_agent_orchestrator.plugins import (
     PluginRegistry,
@@ -35,6 +51,7 @@ from cli_agent_orchestrator.plugins import (
     PostKillSessionEvent,
 )
 from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.services import output_stream_service
 from cli_agent_orchestrator.services.plugin_dispatch import dispatch_plugin_event
 from cli_agent_orchestrator.services.session_env import clear_session_env
 from cli_agent_orchestrator.services.terminal_service import create_terminal
@@ -43,6 +60,21 @@ from cli_agent_orchestrator.utils.agent_profiles import resolve_provider
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SessionsSnapshot:
+    """A session list plus an ETag derived from its content."""
+
+    etag: str
+    sessions: List[Dict]
+
+
+_snapshot: Optional[SessionsSnapshot] = None
+_snapshot_at = 0.0
+_snapshot_lock = threading.Lock()
+# Called by invalidate_sessions_snapshot(); see subscribe_sessions_changed()
+_change_listeners: List[Callable[[], None]] = []
+
+
 def create_session(
     provider: str | None,
     agent_profile: str,
@@ -73,6 +105,7 @@ def create_session(
         registry=registry,
         env_vars=env_vars,
     )
+    invalidate_sessions_snapshot()
     dispatch_plugin_event(
         registry,
         "post_create_session",
@@ -94,6 +127,61 @@ def list_sessions() -> List[Dict]:
         return []
 
 
+def _sessions_etag(sessions: List[Dict]) -> str:
+    encoded = json.dumps(sessions, sort_keys=True).encode("utf-8")
+    return f'"{hashlib.blake2b(encoded, digest_size=8).hexdigest()}"'
+
+
+def get_sessions_snapshot(max_age: float = SESSION_LIST_CACHE_SECONDS) -> SessionsSnapshot:
+    """Return the session list, re-enumerating tmux at most every ``max_age`` seconds.
+
+    The ETag is a content hash, so it only changes when the list does and
+    stays valid across cao-server restarts.
+    """
+    global _snapshot, _snapshot_at
+    with _snapshot_lock:
+        if _snapshot is not None and time.monotonic() - _snapshot_at < max_age:
+            return _snapshot
+        sessions = list_sessions()
+        _snapshot = SessionsSnapshot(etag=_sessions_etag(sessions), sessions=sessions)
+        _snapshot_at = time.monotonic()
+        return _snapshot
+
+
+def invalidate_sessions_snapshot() -> None:
+    """Drop the cached session list after creating or deleting a session.
+
+    Change listeners are notified after the cache is dropped.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+        listeners = list(_change_listeners)
+    for listener in listeners:
+        try:
+            listener()
+        except Exception as e:
+            logger.debug(f"Session change listener failed: {e}")
+
+
+def subscribe_sessions_changed(listener: Callable[[], None]) -> Callable[[], None]:
+    """Call ``listener`` whenever the session list is invalidated; returns an unsubscribe function.
+
+    Listeners run on the thread that created or deleted the session and
+    must not block; async consumers should hand off with
+    ``loop.call_soon_threadsafe``.
+    """
+    with _snapshot_lock:
+        _change_listeners.append(listener)
+
+    def unsubscribe() -> None:
+        with _snapshot_lock:
+            if listener in _change_listeners:
+                _change_listeners.remove(listener)
+
+    return unsubscribe
+
+
 def get_session(session_name: str) -> Dict:
     """Get session with terminals."""
     try:
@@ -114,6 +202,54 @@ def get_session(session_name: str) -> Dict:
         raise
 
 
+def _cleanup_terminal(terminal_id: str) -> None:
+    """Release a terminal's provider and in-memory output stream (never raises)."""
+    try:
+        provider_manager.cleanup_provider(terminal_id)
+    except Exception as e:
+        logger.warning(f"Provider cleanup failed for {terminal_id}: {e}")
+    try:
+        output_stream_service.stop_stream(terminal_id)
+    except Exception as e:
+        logger.warning(f"Failed to stop output stream for {terminal_id}: {e}")
+
+
+def _cleanup_terminals(terminal_ids: List[str]) -> None:
+    """Clean up terminals concurrently; provider cleanup often shells out or walks files.
+
+    Providers serialize the parts of cleanup that rewrite config shared by
+    all their terminals (e.g. Gemini's ``~/.gemini/settings.json``) on their
+    own lock, so only per-terminal work overlaps.
+    """
+    if len(terminal_ids) <= 1:
+        for terminal_id in terminal_ids:
+            _cleanup_terminal(terminal_id)
+        return
+    workers = min(SHUTDOWN_MAX_WORKERS, len(terminal_ids))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cao-cleanup") as pool:
+        list(pool.map(_cleanup_terminal, terminal_ids))
+
+
+def _kill_session(session_name: str) -> None:
+    """Kill a tmux session and drop its terminal records and forwarded env."""
+    tmux_client.kill_session(session_name)
+
+    # Delete terminal metadata
+    delete_terminals_by_session(session_name)
+
+    # Drop the per-session forwarded-env mapping (issue #248). Safe
+    # even when no vars were forwarded — the helper is a no-op then.
+    clear_session_env(session_name)
+
+
+def _dispatch_post_kill(registry: PluginRegistry | None, session_name: str) -> None:
+    dispatch_plugin_event(
+        registry,
+        "post_kill_session",
+        PostKillSessionEvent(session_id=session_name, session_name=session_name),
+    )
+
+
 def delete_session(session_name: str, registry: PluginRegistry | None = None) -> Dict:
     """Delete session and cleanup.
 
@@ -128,31 +264,70 @@ def delete_session(session_name: str, registry: PluginRegistry | None = None) ->
         terminals = list_terminals_by_session(session_name)
 
         # Cleanup providers (non-blocking — don't let failures stop deletion)
-        for terminal in terminals:
-            try:
-                provider_manager.cleanup_provider(terminal["id"])
-            except Exception as e:
-                logger.warning(f"Provider cleanup failed for {terminal['id']}: {e}")
-
-        # Kill tmux session
-        tmux_client.kill_session(session_name)
+        _cleanup_terminals([terminal["id"] for terminal in terminals])
 
-        # Delete terminal metadata
-        delete_terminals_by_session(session_name)
-
-        # Drop the per-session forwarded-env mapping (issue #248). Safe
-        # even when no vars were forwarded — the helper is a no-op then.
-        clear_session_env(session_name)
+        _kill_session(session_name)
+        invalidate_sessions_snapshot()
 
         result["deleted"].append(session_name)
         logger.info(f"Deleted session: {session_name}")
-        dispatch_plugin_event(
-            registry,
-            "post_kill_session",
-            PostKillSessionEvent(session_id=session_name, session_name=session_name),
-        )
+        _dispatch_post_kill(registry, session_name)
         return result
 
     except Exception as e:
         logger.error(f"Failed to delete session {session_name}: {e}")
         raise
+
+
+def delete_sessions(
+    session_names: Optional[List[str]] = None, registry: PluginRegistry | None = None
+) -> Dict:
+    """Delete many sessions at once; ``None`` means every CAO session.
+
+    Tearing sessions down one ``delete_session`` call at a time serialises
+    every provider cleanup. Here all terminals of all sessions are cleaned up
+    on one pool of ``SHUTDOWN_MAX_WORKERS`` threads, then the sessions are
+    killed on the same pool. A session that is missing or fails to die is
+    reported in 'errors' and does not stop the others.
+
+    Returns:
+        Dict with 'deleted' (list of deleted session names) and 'errors'
+        (list of {'session', 'error'} dicts).
+    """
+    result: Dict = {"deleted": [], "errors": []}
+    existing = [s["id"] for s in tmux_client.list_sessions()]
+    if session_names is None:
+        targets = [name for name in existing if name.startswith(SESSION_PREFIX)]
+    else:
+        targets = []
+        for name in dict.fromkeys(session_names):
+            if name in existing:
+                targets.append(name)
+            else:
+                result["errors"].append({"session": name, "error": f"Session '{name}' not found"})
+    if not targets:
+        return result
+
+    terminal_ids = [t["id"] for name in targets for t in list_terminals_by_session(name)]
+    workers = min(SHUTDOWN_MAX_WORKERS, max(len(terminal_ids), len(targets)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cao-shutdown") as pool:
+        list(pool.map(_cleanup_terminal, terminal_ids))
+        kills = {name: pool.submit(_kill_session, name) for name in targets}
+
+    for name, future in kills.items():
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Failed to delete session {name}: {e}")
+            result["errors"].append({"session": name, "error": str(e)})
+        else:
+            result["deleted"].append(name)
+    invalidate_sessions_snapshot()
+
+    logger.info(
+        f"Deleted {len(result['deleted'])} sessions ({len(terminal_ids)} terminals), "
+        f"{len(result['errors'])} errors"
+    )
+    for name in result["deleted"]:
+        _dispatch_post_kill(registry, name)
+    return result
@@ -17,22 +17,44 @@ Terminal Workflow:
 4. delete_terminal() → Cleans up provider, database record, and logging
 """
 
+import codecs
 import logging
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
 
+from cli_agent_orchestrator.clients.database import (
+    append_terminal_turn_status,
+    complete_terminal_turn,
+)
 from cli_agent_orchestrator.clients.database import create_terminal as db_create_terminal
+from cli_agent_orchestrator.clients.database import (
+    create_terminal_turn,
+)
 from cli_agent_orchestrator.clients.database import delete_terminal as db_delete_terminal
 from cli_agent_orchestrator.clients.database import (
     get_terminal_metadata,
+    get_terminal_turn,
+    list_all_terminals,
     update_last_active,
     update_terminal_shell_command,
 )
-from cli_agent_orchestrator.clients.tmux import tmux_client
-from cli_agent_orchestrator.constants import SESSION_PREFIX, TERMINAL_LOG_DIR
+from cli_agent_orchestrator.clients.tmux import ScrollbackMark, tmux_client
+from cli_agent_orchestrator.constants import (
+    MEMORY_CURATED_WAIT_SECONDS,
+    MEMORY_INJECTION_WORKERS,
+    MEMORY_PREFETCH_WORKERS,
+    SESSION_PREFIX,
+    TERMINAL_LOG_DIR,
+    TERMINAL_OUTPUT_SINK,
+    TERMINAL_OUTPUT_SPILL,
+)
 from cli_agent_orchestrator.models.inbox import OrchestrationType
 from cli_agent_orchestrator.models.provider import ProviderType
 from cli_agent_orchestrator.models.terminal import Terminal, TerminalStatus
@@ -42,7 +64,10 @@ from cli_agent_orchestrator.plugins import (
     PostKillTerminalEvent,
     PostSendMessageEvent,
 )
+from cli_agent_orchestrator.providers.base import BaseProvider
 from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.services import archive_service, output_stream_service
+from cli_agent_orchestrator.services.archive_service import ArchiveJob
 from cli_agent_orchestrator.services.memory_service import MemoryService
 from cli_agent_orchestrator.services.plugin_dispatch import dispatch_plugin_event
 from cli_agent_orchestrator.services.session_env import (
@@ -56,6 +81,7 @@ from cli_agent_orchestrator.utils.terminal import (
     generate_session_name,
     generate_terminal_id,
     generate_window_name,
+    strip_ansi,
 )
 
 logger = logging.getLogger(__name__)
@@ -65,15 +91,47 @@ _memory_injected_terminals: set = set()
 _memory_injected_lock = threading.Lock()
 
 
+# Curated requests to a memory_manager can take seconds; they run here so the
+# first message never waits longer than MEMORY_CURATED_WAIT_SECONDS for them.
+_memory_executor = ThreadPoolExecutor(
+    max_workers=MEMORY_INJECTION_WORKERS, thread_name_prefix="cao-memory"
+)
+# Prefetches get their own pool so they never queue ahead of a curated request.
+_memory_prefetch_executor = ThreadPoolExecutor(
+    max_workers=MEMORY_PREFETCH_WORKERS, thread_name_prefix="cao-memory-prefetch"
+)
+
+
+def _prefetch_memory_context(terminal_id: str) -> None:
+    try:
+        MemoryService().get_memory_context_for_terminal(terminal_id)
+    except Exception as e:
+        logger.debug(f"Memory context prefetch failed for terminal {terminal_id}: {e}")
+
+
+def prefetch_memory_context(terminal_id: str) -> None:
+    """Build a new terminal's deterministic memory block in the background.
+
+    The block lands in MemoryService's context cache, so the fallback in
+    ``inject_memory_context`` is a cache hit by the time the first message
+    arrives.
+    """
+    _memory_prefetch_executor.submit(_prefetch_memory_context, terminal_id)
+
+
 def inject_memory_context(first_message: str, terminal_id: str) -> str:
     """Prepend <cao-memory> context block to the first user message.
 
     Tracks which terminals have already been injected so that only the very
     first user message after init receives the memory block.
 
-    Calls MemoryService.get_memory_context_for_terminal() which returns
-    a formatted <cao-memory>...</cao-memory> block (or empty string if
-    no memories exist). Stateless — no file mutation, no backup/restore.
+    The curated block (MemoryService.get_curated_memory_context) is requested
+    in the background and used only if it is ready within
+    ``MEMORY_CURATED_WAIT_SECONDS``; otherwise the deterministic block from
+    get_memory_context_for_terminal() is sent and the late curated result is
+    discarded. Either returns a formatted <cao-memory>...</cao-memory> block
+    (or empty string if no memories exist). Stateless — no file mutation, no
+    backup/restore.
     """
     with _memory_injected_lock:
         if terminal_id in _memory_injected_terminals:
@@ -82,7 +140,20 @@ def inject_memory_context(first_message: str, terminal_id: str) -> str:
 
     try:
         svc = MemoryService()
-        context = svc.get_curated_memory_context(terminal_id, task_description=first_message[:200])
+        curated = _memory_executor.submit(
+            svc.get_curated_memory_context, terminal_id, task_description=first_message[:200]
+        )
+        try:
+            context = curated.result(timeout=MEMORY_CURATED_WAIT_SECONDS)
+        except FutureTimeoutError:
+            # Frees the worker if the request has not started yet; a running
+            # one finishes in the background and its result is dropped.
+            curated.cancel()
+            logger.info(
+                f"Curated memory context for terminal {terminal_id} not ready after "
+                f"{MEMORY_CURATED_WAIT_SECONDS}s, using deterministic context"
+            )
+            context = svc.get_memory_context_for_terminal(terminal_id)
         if context:
             return context + "\n\n" + first_message
     except Exception as e:
@@ -90,6 +161,169 @@ def inject_memory_context(first_message: str, terminal_id: str) -> str:
     return first_message
 
 
+@dataclass(frozen=True)
+class TurnBoundary:
+    """Where the most recent user turn began in a terminal's output.
+
+    Recorded by ``send_input()`` just before the message is pasted.
+
+    Attributes:
+        scrollback: The pane cursor's scrollback line (see
+            ``TmuxClient.mark_cursor_line``), or None if the pane position
+            could not be tracked.
+    """
+
+    scrollback: Optional[ScrollbackMark]
+
+
+# Most recent turn boundary per terminal, used by LAST-mode extraction.
+_turn_boundaries: Dict[str, TurnBoundary] = {}
+_turn_boundaries_lock = threading.Lock()
+
+
+def _record_turn_boundary(terminal_id: str, session_name: str, window_name: str) -> None:
+    """Record the scrollback line at which a new turn starts."""
+    mark = tmux_client.mark_cursor_line(session_name, window_name)
+    boundary = TurnBoundary(scrollback=mark if isinstance(mark, ScrollbackMark) else None)
+    with _turn_boundaries_lock:
+        _turn_boundaries[terminal_id] = boundary
+
+
+def get_turn_boundary(terminal_id: str) -> Optional[TurnBoundary]:
+    """Return the boundary of the most recent turn sent to a terminal, if any."""
+    with _turn_boundaries_lock:
+        return _turn_boundaries.get(terminal_id)
+
+
+@dataclass
+class _OpenTurn:
+    """A transcript turn awaiting its response.
+
+    Attributes:
+        turn: The turn's number in the terminal's transcript.
+        status: Last status recorded for the turn, so get_terminal() writes a
+            transition only when the status actually changes.
+    """
+
+    turn: int
+    status: Optional[str] = None
+
+
+# Terminals with a transcript turn awaiting its response.
+_open_turns: Dict[str, _OpenTurn] = {}
+_open_turns_lock = threading.Lock()
+
+# Statuses at which the agent has finished responding to the turn.
+TURN_DONE_STATUSES = {TerminalStatus.COMPLETED, TerminalStatus.IDLE}
+
+# Transcript writes and response extraction run here rather than in the
+# status poll that observed them; one worker keeps each turn's writes in order.
+_transcript_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cao-transcript")
+
+
+def _start_transcript_turn(terminal_id: str, provider: Optional[str], message: str) -> None:
+    """Open a transcript turn for a message just sent to the terminal."""
+    try:
+        turn = create_terminal_turn(terminal_id, provider, message)
+    except Exception as e:
+        logger.warning(f"Failed to record transcript turn for {terminal_id}: {e}")
+        return
+    with _open_turns_lock:
+        _open_turns[terminal_id] = _OpenTurn(turn)
+
+
+def _record_transcript_status(
+    terminal_id: str, status: str, metadata: Dict, provider: BaseProvider
+) -> None:
+    """Queue a status transition on the terminal's open transcript turn.
+
+    Only the in-memory check runs in the caller; the transcript write and
+    any response extraction happen on the transcript worker (see
+    ``_write_transcript_status``).
+    """
+    with _open_turns_lock:
+        open_turn = _open_turns.get(terminal_id)
+        if open_turn is None or open_turn.status == status:
+            return
+        previous = open_turn.status
+        open_turn.status = status
+        turn = open_turn.turn
+    _transcript_executor.submit(
+        _write_transcript_status, terminal_id, turn, status, previous, metadata, provider
+    )
+
+
+def _write_transcript_status(
+    terminal_id: str,
+    turn: int,
+    status: str,
+    previous: Optional[str],
+    metadata: Dict,
+    provider: BaseProvider,
+) -> None:
+    """Record ``status`` on ``turn`` and complete the turn once the agent is done.
+
+    A turn is completed when the agent moves from working to a done status,
+    or when its first observed status is already done (the agent finished
+    between polls) and the response can be told apart from the previous
+    turn's (see ``_extract_new_turn_message``).
+    """
+    try:
+        append_terminal_turn_status(terminal_id, status, turn=turn)
+    except Exception as e:
+        logger.warning(f"Failed to record transcript status for {terminal_id}: {e}")
+
+    if status not in TURN_DONE_STATUSES or previous in TURN_DONE_STATUSES:
+        return
+    try:
+        if previous is None:
+            response = _extract_new_turn_message(terminal_id, turn, metadata, provider)
+            if response is None:
+                return
+        else:
+            response = _extract_last_message(terminal_id, metadata, provider, retry=False)
+    except Exception as e:
+        logger.warning(f"Failed to extract transcript response for {terminal_id}: {e}")
+        return
+    _complete_transcript_turn(terminal_id, turn, response)
+
+
+def _extract_new_turn_message(
+    terminal_id: str, turn: int, metadata: Dict, provider: BaseProvider
+) -> Optional[str]:
+    """Response to ``turn`` if the pane shows one, else None.
+
+    Used when the turn is first seen already done, which is also what an
+    idle pane looks like before it picks up the message. With a turn
+    boundary only output written since the message is parsed; without one
+    the tail's response counts only if it differs from the previous turn's.
+    """
+    turn_output = _get_turn_output(terminal_id, metadata["tmux_session"], metadata["tmux_window"])
+    try:
+        if turn_output:
+            return provider.extract_last_message_from_script(turn_output)
+        response = _extract_last_message(terminal_id, metadata, provider, retry=False)
+    except ValueError:
+        return None
+    previous = get_terminal_turn(terminal_id, turn - 1) if turn > 1 else None
+    if previous is not None and previous.response == response:
+        return None
+    return response
+
+
+def _complete_transcript_turn(terminal_id: str, turn: int, response: str) -> None:
+    """Store the extracted response on ``turn`` if it is still the open turn."""
+    with _open_turns_lock:
+        open_turn = _open_turns.get(terminal_id)
+        if open_turn is None or open_turn.turn != turn:
+            return
+        del _open_turns[terminal_id]
+    try:
+        complete_terminal_turn(terminal_id, response, turn=turn)
+    except Exception as e:
+        logger.warning(f"Failed to record transcript response for {terminal_id}: {e}")
+
+
 class OutputMode(str, Enum):
     """Output mode for terminal history retrieval.
 
@@ -132,6 +366,7 @@ def create_terminal(
     3. Save terminal metadata to database
     4. Initialize the CLI provider (starts the agent)
     5. Set up terminal logging via tmux pipe-pane
+    6. Prefetch the memory context block for the first message
 
     Args:
         provider: Provider type string (e.g., "kiro_cli", "claude_code")
@@ -258,10 +493,12 @@ def create_terminal(
             update_terminal_shell_command(terminal_id, shell_command)
 
         # Step 5: Set up terminal logging via tmux pipe-pane
-        # This captures all terminal output to a log file for inbox monitoring
-        log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
-        log_path.touch()  # Ensure file exists before watching
-        tmux_client.pipe_pane(session_name, window_name, str(log_path))
+        # This captures all terminal output for inbox monitoring, either to a
+        # log file or (memory mode) through a FIFO into an in-process buffer
+        start_output_pipe(terminal_id, session_name, window_name)
+
+        # Step 6: Warm the memory context block for the first message
+        prefetch_memory_context(terminal_id)
 
         # Build and return the Terminal object
         terminal = Terminal(
@@ -309,6 +546,41 @@ def create_terminal(
         raise
 
 
+def start_output_pipe(terminal_id: str, session_name: str, window_name: str) -> None:
+    """Pipe a terminal's pane output to its log file or in-memory stream."""
+    if TERMINAL_OUTPUT_SINK == "memory":
+        fifo_path = output_stream_service.start_stream(terminal_id, spill=TERMINAL_OUTPUT_SPILL)
+        tmux_client.pipe_pane(session_name, window_name, str(fifo_path), fifo=True)
+        return
+
+    log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
+    log_path.touch()  # Ensure file exists before watching
+    tmux_client.pipe_pane(session_name, window_name, str(log_path))
+
+
+def resume_output_streams() -> int:
+    """Re-attach in-memory output streams for terminals that outlived a server restart.
+
+    In memory mode the FIFO reader lives in cao-server, so a restart leaves
+    existing panes without a reader (tmux's pipe command exits on the broken
+    pipe). Returns the number of terminals re-piped.
+    """
+    resumed = 0
+    for terminal in list_all_terminals():
+        terminal_id = terminal["id"]
+        if output_stream_service.get_stream(terminal_id) is not None:
+            continue
+        if not tmux_client.session_exists(terminal["tmux_session"]):
+            continue
+        try:
+            tmux_client.stop_pipe_pane(terminal["tmux_session"], terminal["tmux_window"])
+            start_output_pipe(terminal_id, terminal["tmux_session"], terminal["tmux_window"])
+            resumed += 1
+        except Exception as e:
+            logger.warning(f"Failed to resume output stream for {terminal_id}: {e}")
+    return resumed
+
+
 def get_terminal(terminal_id: str) -> Dict:
     """Get terminal data."""
     try:
@@ -321,6 +593,7 @@ def get_terminal(terminal_id: str) -> Dict:
         if provider is None:
             raise ValueError(f"Provider not found for terminal {terminal_id}")
         status = provider.get_status().value
+        _record_transcript_status(terminal_id, status, metadata, provider)
 
         return {
             "id": metadata["id"],
@@ -400,6 +673,11 @@ def send_input(
         provider = provider_manager.get_provider(terminal_id)
         enter_count = provider.paste_enter_count if provider else 1
 
+        try:
+            _record_turn_boundary(terminal_id, metadata["tmux_session"], metadata["tmux_window"])
+        except Exception as e:
+            logger.debug(f"Failed to record turn boundary for {terminal_id}: {e}")
+
         tmux_client.send_keys(
             metadata["tmux_session"],
             metadata["tmux_window"],
@@ -415,6 +693,8 @@ def send_input(
         if provider:
             provider.mark_input_received()
 
+        _start_transcript_turn(terminal_id, metadata.get("provider"), original_message)
+
         update_last_active(terminal_id)
         logger.info(f"Sent input to terminal: {terminal_id}")
         if registry is not None and sender_id is not None and orchestration_type is not None:
@@ -468,10 +748,35 @@ def send_special_key(terminal_id: str, key: str) -> bool:
         raise
 
 
-def get_output(terminal_id: str, mode: OutputMode = OutputMode.FULL) -> str:
+def get_output(
+    terminal_id: str,
+    mode: OutputMode = OutputMode.FULL,
+    turn: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    strip_escapes: bool = False,
+) -> str:
     """Get terminal output.
 
-    For ``LAST`` mode, if the provider declares ``extraction_retries > 0``,
+    ``tail_lines`` limits the result to its last N lines (in ``FULL`` mode
+    only that many lines are captured) and ``strip_escapes`` removes ANSI
+    escape sequences.
+
+    If ``turn`` is given, the response recorded for that transcript turn is
+    returned from the database without touching tmux; this also works after
+    the terminal has been deleted. ``LAST`` mode on a terminal that no longer
+    exists likewise returns the latest recorded response.
+
+    For ``LAST`` mode on a live terminal, the turn boundary recorded by
+    ``send_input()`` is tried first: only the scrollback from the line where
+    the last message was pasted is captured and handed to the provider's
+    extractor, so the cost scales with the turn rather than the window
+    height and responses that scrolled past the tail window are still found.
+    If no boundary is available or extraction from that slice fails, the
+    tail-capture path below is used. The transcript response itself is
+    stored by ``get_terminal()`` when the turn's status moves to done, so
+    this getter makes no status capture of its own.
+
+    On the tail-capture path, if the provider declares ``extraction_retries > 0``,
     retries extraction with 10 s delays between attempts.  This handles
     TUI-based providers (e.g. Gemini CLI's Ink renderer) whose notification
     spinners can temporarily obscure response text in the tmux capture buffer.
@@ -483,54 +788,237 @@ def get_output(terminal_id: str, mode: OutputMode = OutputMode.FULL) -> str:
     get_output invocation.
     """
     try:
+        if turn is not None:
+            recorded = get_terminal_turn(terminal_id, turn)
+            if recorded is None or recorded.response is None:
+                raise ValueError(f"Turn {turn} of terminal '{terminal_id}' has no recorded output")
+            return _trim_output(recorded.response, tail_lines, strip_escapes)
+
         metadata = get_terminal_metadata(terminal_id)
         if not metadata:
+            if mode == OutputMode.LAST:
+                recorded = get_terminal_turn(terminal_id)
+                if recorded is not None and recorded.response is not None:
+                    return _trim_output(recorded.response, tail_lines, strip_escapes)
             raise ValueError(f"Terminal '{terminal_id}' not found")
 
         if mode == OutputMode.FULL:
-            return tmux_client.get_history(metadata["tmux_session"], metadata["tmux_window"])
+            return tmux_client.get_history(
+                metadata["tmux_session"],
+                metadata["tmux_window"],
+                tail_lines=tail_lines,
+                strip_escapes=strip_escapes,
+            )
         elif mode == OutputMode.LAST:
             provider = provider_manager.get_provider(terminal_id)
             if provider is None:
                 raise ValueError(f"Provider not found for terminal {terminal_id}")
 
-            # Capability check: providers that need deeper scrollback for extraction
-            # opt in by defining ``extraction_tail_lines``. Base providers don't.
-            extract_lines = getattr(provider, "extraction_tail_lines", None)
-            full_output = tmux_client.get_history(
-                metadata["tmux_session"],
-                metadata["tmux_window"],
-                tail_lines=extract_lines,
-            )
-
-            retries = provider.extraction_retries
-            last_err: Exception | None = None
-            for attempt in range(1 + retries):
-                try:
-                    if attempt > 0:
-                        time.sleep(10.0)
-                        full_output = tmux_client.get_history(
-                            metadata["tmux_session"],
-                            metadata["tmux_window"],
-                            tail_lines=extract_lines,
-                        )
-                    return provider.extract_last_message_from_script(full_output)
-                except ValueError as exc:
-                    last_err = exc
-                    logger.debug(
-                        "Output extraction attempt %d/%d for %s failed: %s",
-                        attempt + 1,
-                        1 + retries,
-                        terminal_id,
-                        exc,
-                    )
-            raise last_err  # type: ignore[misc]
+            message = _extract_last_message(terminal_id, metadata, provider)
+            return _trim_output(message, tail_lines, strip_escapes)
 
     except Exception as e:
         logger.error(f"Failed to get output from terminal {terminal_id}: {e}")
         raise
 
 
+def _trim_output(output: str, tail_lines: Optional[int], strip_escapes: bool) -> str:
+    if strip_escapes:
+        output = strip_ansi(output)
+    if tail_lines is not None:
+        output = "\n".join(output.split("\n")[-tail_lines:])
+    return output
+
+
+@dataclass(frozen=True)
+class OutputChunk:
+    """Raw pane output read from a cursor (see ``get_output_since``).
+
+    Attributes:
+        output: Output written since the cursor, decoded as UTF-8
+        cursor: Pass as ``since`` to continue where this chunk ends
+        truncated: True if output between the given cursor and this chunk
+            is no longer available (ring buffer wrapped or log rotated)
+    """
+
+    output: str
+    cursor: str
+    truncated: bool
+
+
+# Upper bound on raw bytes returned by one get_output_since() call
+OUTPUT_CHUNK_MAX_BYTES = 1024 * 1024
+
+
+def _parse_output_cursor(cursor: str) -> Tuple[str, int]:
+    source, sep, offset = cursor.rpartition(":")
+    if not sep or not offset.isdigit():
+        raise ValueError(f"Invalid output cursor '{cursor}'")
+    return source, int(offset)
+
+
+def _read_output_bytes(terminal_id: str, source: str, offset: int) -> Tuple[bytes, str, int]:
+    """Read raw output from ``offset`` of ``source``.
+
+    Returns (data, current source, offset of the first returned byte). The
+    source names what offsets count into: ``mem`` for the in-memory ring
+    buffer, otherwise the inode of the live ``<id>.log``, which changes
+    whenever the log rotates. An unknown source restarts from the oldest
+    available byte.
+    """
+    stream = output_stream_service.get_stream(terminal_id)
+    if stream is not None:
+        if source != "mem" or offset > stream.buffer.end_offset:
+            offset = 0
+        data, end = stream.buffer.read_since(offset, OUTPUT_CHUNK_MAX_BYTES)
+        return data, "mem", end - len(data)
+
+    log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
+    try:
+        with open(log_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            inode = str(st.st_ino)
+            if source != inode or offset > st.st_size:
+                offset = 0
+            f.seek(offset)
+            return f.read(OUTPUT_CHUNK_MAX_BYTES), inode, offset
+    except FileNotFoundError:
+        return b"", "none", 0
+
+
+def get_output_since(
+    terminal_id: str,
+    cursor: str,
+    tail_lines: Optional[int] = None,
+    strip_escapes: bool = False,
+) -> OutputChunk:
+    """Return raw pane output written since ``cursor``.
+
+    Reads the terminal's output stream (its in-memory ring buffer or its
+    live pipe-pane log) from the byte offset encoded in the cursor, so a
+    client tailing a terminal only transfers new output. Use the cursor
+    returned by ``get_output_cursor()`` or a previous chunk; ``"0:0"`` starts
+    from the oldest available output. At most ``OUTPUT_CHUNK_MAX_BYTES`` are
+    read per call, never splitting a UTF-8 character.
+    """
+    source, offset = _parse_output_cursor(cursor)
+    if not get_terminal_metadata(terminal_id):
+        raise ValueError(f"Terminal '{terminal_id}' not found")
+
+    data, source_now, start = _read_output_bytes(terminal_id, source, offset)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    text = decoder.decode(data)
+    # Leave a trailing partial character for the next read
+    end = start + len(data) - len(decoder.getstate()[0])
+    truncated = offset > 0 and (source_now != source or start != offset)
+    return OutputChunk(
+        output=_trim_output(text, tail_lines, strip_escapes),
+        cursor=f"{source_now}:{end}",
+        truncated=truncated,
+    )
+
+
+def get_output_cursor(terminal_id: str) -> str:
+    """Cursor at the current end of the terminal's output stream."""
+    stream = output_stream_service.get_stream(terminal_id)
+    if stream is not None:
+        return f"mem:{stream.buffer.end_offset}"
+    try:
+        st = (TERMINAL_LOG_DIR / f"{terminal_id}.log").stat()
+    except FileNotFoundError:
+        return "none:0"
+    return f"{st.st_ino}:{st.st_size}"
+
+
+def _extract_last_message(
+    terminal_id: str, metadata: Dict, provider: BaseProvider, retry: bool = True
+) -> str:
+    """Extract the last agent response from the live tmux pane.
+
+    ``retry=False`` skips the provider's delayed extraction retries.
+    """
+    turn_output = _get_turn_output(terminal_id, metadata["tmux_session"], metadata["tmux_window"])
+    if turn_output:
+        try:
+            return provider.extract_last_message_from_script(turn_output)
+        except ValueError as exc:
+            logger.debug(
+                "Turn-scoped extraction for %s failed, falling back to tail capture: %s",
+                terminal_id,
+                exc,
+            )
+
+    # Capability check: providers that need deeper scrollback for extraction
+    # opt in by defining ``extraction_tail_lines``. Base providers don't.
+    extract_lines = getattr(provider, "extraction_tail_lines", None)
+    full_output = tmux_client.get_history(
+        metadata["tmux_session"],
+        metadata["tmux_window"],
+        tail_lines=extract_lines,
+    )
+
+    retries = provider.extraction_retries if retry else 0
+    last_err: Exception | None = None
+    for attempt in range(1 + retries):
+        try:
+            if attempt > 0:
+                time.sleep(10.0)
+                full_output = tmux_client.get_history(
+                    metadata["tmux_session"],
+                    metadata["tmux_window"],
+                    tail_lines=extract_lines,
+                )
+            return provider.extract_last_message_from_script(full_output)
+        except ValueError as exc:
+            last_err = exc
+            logger.debug(
+                "Output extraction attempt %d/%d for %s failed: %s",
+                attempt + 1,
+                1 + retries,
+                terminal_id,
+                exc,
+            )
+    raise last_err  # type: ignore[misc]
+
+
+def _get_turn_output(terminal_id: str, session_name: str, window_name: str) -> Optional[str]:
+    """Capture the scrollback of the most recent turn, or None if unavailable."""
+    boundary = get_turn_boundary(terminal_id)
+    if boundary is None or boundary.scrollback is None:
+        return None
+    try:
+        output = tmux_client.get_history_from_mark(session_name, window_name, boundary.scrollback)
+    except Exception as e:
+        logger.debug(f"Failed to capture turn output for {terminal_id}: {e}")
+        return None
+    return output if isinstance(output, str) else None
+
+
+def stream_scrollback(terminal_id: str, strip_escapes: bool = True) -> Iterator[bytes]:
+    """Stream a terminal's full scrollback in chunks.
+
+    Live terminals are captured from tmux; deleted ones are served from the
+    archive written by ``archive_service``. Neither is loaded into memory
+    whole. Archived scrollback is always plain text.
+
+    Raises:
+        ValueError: If the terminal is neither live nor archived
+    """
+    metadata = get_terminal_metadata(terminal_id)
+    if metadata:
+        try:
+            return tmux_client.iter_history(
+                metadata["tmux_session"], metadata["tmux_window"], strip_escapes=strip_escapes
+            )
+        except ValueError as e:
+            logger.debug(f"Live scrollback of {terminal_id} unavailable: {e}")
+
+    archived = archive_service.iter_archived_scrollback(terminal_id)
+    if archived is None:
+        raise ValueError(f"No scrollback for terminal '{terminal_id}'")
+    return archived
+
+
 def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) -> bool:
     """Delete terminal and kill its tmux window."""
     try:
@@ -538,20 +1026,10 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
         metadata = get_terminal_metadata(terminal_id)
 
         if metadata:
-            # Snapshot scrollback + metadata before killing (for debugging/restore)
+            # Record restore metadata and the rendered scrollback while the
+            # pane still exists; compressing and writing them happens later.
+            snapshot = None
             try:
-                # Capture plain text full scrollback (no -e, no line cap)
-                scrollback = tmux_client.get_history(
-                    metadata["tmux_session"],
-                    metadata["tmux_window"],
-                    strip_escapes=True,
-                    full_history=True,
-                )
-                scrollback_path = TERMINAL_LOG_DIR / f"{terminal_id}.scrollback"
-                scrollback_path.write_text(scrollback, encoding="utf-8")
-
-                import json as _json
-
                 snapshot = {
                     "terminal_id": terminal_id,
                     "session_name": metadata["tmux_session"],
@@ -563,16 +1041,34 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
                     ),
                     "allowed_tools": metadata.get("allowed_tools"),
                 }
-                snapshot_path = TERMINAL_LOG_DIR / f"{terminal_id}.snapshot.json"
-                snapshot_path.write_text(_json.dumps(snapshot, indent=2), encoding="utf-8")
             except Exception as e:
                 logger.warning(f"Failed to snapshot terminal {terminal_id}: {e}")
 
+            # Streamed to a file so a long history is never held in memory
+            scrollback_path = None
+            if snapshot is not None:
+                try:
+                    scrollback_path = archive_service.write_scrollback_capture(
+                        terminal_id,
+                        tmux_client.iter_history(
+                            metadata["tmux_session"], metadata["tmux_window"], strip_escapes=True
+                        ),
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to capture scrollback of {terminal_id}: {e}")
+
             # Stop pipe-pane logging
             try:
                 tmux_client.stop_pipe_pane(metadata["tmux_session"], metadata["tmux_window"])
             except Exception as e:
                 logger.warning(f"Failed to stop pipe-pane for {terminal_id}: {e}")
+            # If the capture failed and there is no spilled log, the ring
+            # buffer is the only copy of the output
+            output = None
+            stream = output_stream_service.get_stream(terminal_id)
+            if scrollback_path is None and stream is not None and not TERMINAL_OUTPUT_SPILL:
+                output, _ = stream.buffer.snapshot()
+            output_stream_service.stop_stream(terminal_id)
 
             # Kill the tmux window (this terminates the agent process)
             try:
@@ -580,10 +1076,17 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
             except Exception as e:
                 logger.warning(f"Failed to kill tmux window for {terminal_id}: {e}")
 
+            if snapshot is not None:
+                archive_service.enqueue(ArchiveJob(terminal_id, snapshot, output, scrollback_path))
+
         # Cleanup provider state and database record
         provider_manager.cleanup_provider(terminal_id)
         with _memory_injected_lock:
             _memory_injected_terminals.discard(terminal_id)
+        with _turn_boundaries_lock:
+            _turn_boundaries.pop(terminal_id, None)
+        with _open_turns_lock:
+            _open_turns.pop(terminal_id, None)
         # Drop any per-curator dispatch lock so the registry doesn't grow
         # forever as memory_manager terminals come and go.
         from cli_agent_orchestrator.services.memory_service import _curator_locks
@@ -0,0 +1,110 @@
+"""Bounded, rotating sink for tmux pipe-pane output.
+
+Run by ``tmux pipe-pane`` in place of ``cat >> <id>.log``::
+
+    python -m cli_agent_orchestrator.utils.log_sink <log_path> <segment_bytes> <segments>
+
+Bytes from stdin are appended to ``<log_path>``, which always holds the most
+recent output so tail readers (inbox idle checks, the watchdog on ``*.log``)
+see the same file they always did. Once the live file exceeds
+``segment_bytes`` it is rotated to ``<log_path>.1.gz`` (gzip-compressed),
+older segments shift to ``.2.gz`` and so on, and anything beyond
+``segments`` is deleted. Disk use per terminal is therefore bounded by one
+live segment plus ``segments`` compressed ones.
+
+Kept free of package imports so the per-pane process starts quickly.
+"""
+
+import gzip
+import shutil
+import sys
+from pathlib import Path
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def segment_path(log_path: Path, index: int) -> Path:
+    """Path of the ``index``-th rotated segment (1 = newest)."""
+    return log_path.with_name(f"{log_path.name}.{index}.gz")
+
+
+def rotate(log_path: Path, segments: int) -> None:
+    """Compress the live log into segment 1 and shift older segments down."""
+    oldest = segment_path(log_path, segments)
+    if oldest.exists():
+        oldest.unlink()
+    for index in range(segments - 1, 0, -1):
+        src = segment_path(log_path, index)
+        if src.exists():
+            src.rename(segment_path(log_path, index + 1))
+
+    if segments < 1:
+        log_path.unlink(missing_ok=True)
+        return
+
+    # Rename first so the sink can reopen a fresh live file immediately;
+    # compression then works on the detached copy.
+    detached = log_path.with_name(f"{log_path.name}.rotating")
+    log_path.rename(detached)
+    tmp = segment_path(log_path, 1).with_suffix(".gz.tmp")
+    with open(detached, "rb") as src_f, gzip.open(tmp, "wb") as dst_f:
+        shutil.copyfileobj(src_f, dst_f)
+    tmp.rename(segment_path(log_path, 1))
+    detached.unlink()
+
+
+class RotatingLogWriter:
+    """Append bytes to a live log, rotating it into gzip segments past a size cap."""
+
+    def __init__(self, log_path: Path, segment_bytes: int, segments: int) -> None:
+        self.log_path = log_path
+        self.segment_bytes = segment_bytes
+        self.segments = segments
+        self._out = open(log_path, "ab")
+        self._size = self._out.tell()
+
+    def write(self, chunk: bytes) -> None:
+        self._out.write(chunk)
+        self._out.flush()
+        self._size += len(chunk)
+        if self._size >= self.segment_bytes:
+            self._out.close()
+            rotate(self.log_path, self.segments)
+            self._out = open(self.log_path, "ab")
+            self._size = 0
+
+    def close(self) -> None:
+        self._out.close()
+
+
+def run(log_path: Path, segment_bytes: int, segments: int, stream=None) -> None:
+    """Copy ``stream`` (default: stdin) into ``log_path`` until EOF, rotating as needed."""
+    stream = stream if stream is not None else sys.stdin.buffer
+    writer = RotatingLogWriter(log_path, segment_bytes, segments)
+    try:
+        while True:
+            # read1 returns as soon as any bytes are available, so output
+            # reaches the live log without waiting for a full chunk.
+            chunk = stream.read1(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            writer.write(chunk)
+    finally:
+        writer.close()
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 3:
+        print(
+            "usage: python -m cli_agent_orchestrator.utils.log_sink "
+            "<log_path> <segment_bytes> <segments>",
+            file=sys.stderr,
+        )
+        return 2
+    log_path = Path(argv[0])
+    run(log_path, int(argv[1]), int(argv[2]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
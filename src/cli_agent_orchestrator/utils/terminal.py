@@ -23,6 +23,15 @@ logger = logging.getLogger(__name__)
 # safe characters only. The 64-char cap matches typical tmux name lengths.
 _VALID_TMUX_NAME = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_\-]{0,63}$")
 
+# Terminal escape sequences in raw pane output: CSI (colours, cursor moves),
+# OSC (titles, hyperlinks; BEL or ST terminated) and other ESC sequences
+# such as charset selection (``ESC ( B``) and keypad modes (``ESC =``).
+_ANSI_ESCAPE = re.compile(
+    r"\x1b\[[0-?]*[ -/]*[@-~]"  # CSI
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC
+    r"|\x1b[ -/]*[0-~]"  # everything else
+)
+
 
 def validate_tmux_name(name: str, kind: str = "name") -> str:
     """Validate a tmux session or window name against an allowlist.
@@ -53,6 +62,11 @@ def validate_tmux_name(name: str, kind: str = "name") -> str:
     return name
 
 
+def strip_ansi(text: str) -> str:
+    """Remove terminal escape sequences and carriage returns from raw output."""
+    return _ANSI_ESCAPE.sub("", text).replace("\r\n", "\n").replace("\r", "")
+
+
 def generate_session_name() -> str:
     """Generate a unique session name with SESSION_PREFIX."""
     session_uuid = uuid.uuid4().hex[:8]
@@ -13,6 +13,8 @@ import pytest
 
 from cli_agent_orchestrator.api.main import app, flow_daemon, opencode_inbox_delivery_daemon
 from cli_agent_orchestrator.models.terminal import Terminal
+from cli_agent_orchestrator.services.session_service import SessionsSnapshot
+from cli_agent_orchestrator.services.terminal_service import OutputChunk, OutputMode
 from cli_agent_orchestrator.utils.skills import SkillNameError
 
 # ── Health endpoint ──────────────────────────────────────────────────
@@ -452,28 +454,40 @@ class TestListSessions:
             {"id": "cao-session-2", "windows": 1},
         ]
         with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
-            mock_svc.list_sessions.return_value = mock_sessions
+            mock_svc.get_sessions_snapshot.return_value = SessionsSnapshot('"e1"', mock_sessions)
 
             response = client.get("/sessions")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
+        assert response.headers["etag"] == '"e1"'
 
     def test_list_sessions_empty(self, client):
         """GET /sessions returns empty list."""
         with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
-            mock_svc.list_sessions.return_value = []
+            mock_svc.get_sessions_snapshot.return_value = SessionsSnapshot('"e0"', [])
 
             response = client.get("/sessions")
 
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_list_sessions_not_modified(self, client):
+        """GET /sessions returns 304 when If-None-Match matches the current ETag."""
+        with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
+            mock_svc.get_sessions_snapshot.return_value = SessionsSnapshot('"e1"', [{"id": "x"}])
+
+            response = client.get("/sessions", headers={"If-None-Match": '"e1"'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == '"e1"'
+
     def test_list_sessions_server_error(self, client):
         """GET /sessions returns 500 on error."""
         with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
-            mock_svc.list_sessions.side_effect = Exception("TMux not running")
+            mock_svc.get_sessions_snapshot.side_effect = Exception("TMux not running")
 
             response = client.get("/sessions")
 
@@ -481,6 +495,43 @@ class TestListSessions:
         assert "Failed to list sessions" in response.json()["detail"]
 
 
+class TestOverview:
+    """Tests for GET /overview endpoint."""
+
+    OVERVIEW = {
+        "sessions": [
+            {"id": "cao-a", "name": "cao-a", "status": "detached", "terminals": []},
+            {"id": "cao-b", "name": "cao-b", "status": "detached", "terminals": []},
+        ]
+    }
+
+    def test_overview_success(self, client):
+        with patch("cli_agent_orchestrator.api.main.overview_service") as mock_svc:
+            mock_svc.get_overview.return_value = self.OVERVIEW
+
+            response = client.get("/overview")
+
+        assert response.status_code == 200
+        assert response.json() == self.OVERVIEW
+
+    def test_overview_filtered_by_session(self, client):
+        with patch("cli_agent_orchestrator.api.main.overview_service") as mock_svc:
+            mock_svc.get_overview.return_value = self.OVERVIEW
+
+            response = client.get("/overview", params={"session": "cao-b"})
+
+        assert [s["name"] for s in response.json()["sessions"]] == ["cao-b"]
+
+    def test_overview_server_error(self, client):
+        with patch("cli_agent_orchestrator.api.main.overview_service") as mock_svc:
+            mock_svc.get_overview.side_effect = Exception("tmux down")
+
+            response = client.get("/overview")
+
+        assert response.status_code == 500
+        assert "Failed to build overview" in response.json()["detail"]
+
+
 class TestGetSession:
     """Tests for GET /sessions/{session_name} endpoint."""
 
@@ -561,6 +612,52 @@ class TestDeleteSession:
         assert "Failed to delete session" in response.json()["detail"]
 
 
+class TestShutdownSessions:
+    """Tests for POST /sessions/shutdown endpoint."""
+
+    def test_shutdown_all(self, client):
+        with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
+            mock_svc.delete_sessions.return_value = {"deleted": ["cao-a"], "errors": []}
+
+            response = client.post("/sessions/shutdown", params={"all": "true"})
+
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "deleted": ["cao-a"], "errors": []}
+        mock_svc.delete_sessions.assert_called_once_with(None, registry=ANY)
+
+    def test_shutdown_named_sessions(self, client):
+        with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
+            mock_svc.delete_sessions.return_value = {
+                "deleted": ["cao-a"],
+                "errors": [{"session": "cao-b", "error": "Session 'cao-b' not found"}],
+            }
+
+            response = client.post("/sessions/shutdown?session=cao-a&session=cao-b")
+
+        assert response.status_code == 200
+        assert response.json()["errors"][0]["session"] == "cao-b"
+        mock_svc.delete_sessions.assert_called_once_with(["cao-a", "cao-b"], registry=ANY)
+
+    @pytest.mark.parametrize(
+        "params", [{}, {"all": "true", "session": "cao-a"}, {"session": "bad;name"}]
+    )
+    def test_shutdown_rejects_bad_params(self, client, params):
+        with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
+            response = client.post("/sessions/shutdown", params=params)
+
+        assert response.status_code == 400
+        mock_svc.delete_sessions.assert_not_called()
+
+    def test_shutdown_server_error(self, client):
+        with patch("cli_agent_orchestrator.api.main.session_service") as mock_svc:
+            mock_svc.delete_sessions.side_effect = Exception("tmux down")
+
+            response = client.post("/sessions/shutdown", params={"all": "true"})
+
+        assert response.status_code == 500
+        assert "Failed to shut down sessions" in response.json()["detail"]
+
+
 # ── Terminals in sessions ────────────────────────────────────────────
 
 
@@ -803,6 +900,7 @@ class TestGetTerminalOutput:
         """GET /terminals/{id}/output returns full output by default."""
         with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
             mock_svc.get_output.return_value = "Hello from terminal"
+            mock_svc.get_output_cursor.return_value = "123:456"
 
             response = client.get("/terminals/abcd1234/output")
 
@@ -810,6 +908,7 @@ class TestGetTerminalOutput:
         data = response.json()
         assert data["output"] == "Hello from terminal"
         assert data["mode"] == "full"
+        assert data["cursor"] == "123:456"
 
     def test_get_output_last_mode(self, client):
         """GET /terminals/{id}/output with mode=last returns last response."""
@@ -822,6 +921,55 @@ class TestGetTerminalOutput:
         data = response.json()
         assert data["output"] == "Last response"
         assert data["mode"] == "last"
+        assert "cursor" not in data
+
+    def test_get_output_tail_and_strip_ansi(self, client):
+        with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.get_output.return_value = "x"
+            mock_svc.get_output_cursor.return_value = "mem:0"
+
+            client.get("/terminals/abcd1234/output?tail=20&strip_ansi=true")
+
+        mock_svc.get_output.assert_called_once_with(
+            "abcd1234", OutputMode.FULL, turn=None, tail_lines=20, strip_escapes=True
+        )
+
+    def test_get_output_since_cursor(self, client):
+        with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.get_output_since.return_value = OutputChunk("new", "mem:42", False)
+
+            response = client.get("/terminals/abcd1234/output?since=mem:40")
+
+        assert response.json() == {
+            "output": "new",
+            "mode": "full",
+            "cursor": "mem:42",
+            "truncated": False,
+        }
+        mock_svc.get_output_since.assert_called_once_with(
+            "abcd1234", "mem:40", tail_lines=None, strip_escapes=False
+        )
+        mock_svc.get_output.assert_not_called()
+
+    def test_get_output_since_rejects_last_mode(self, client):
+        response = client.get("/terminals/abcd1234/output?since=mem:0&mode=last")
+
+        assert response.status_code == 400
+
+    def test_get_output_since_rejects_malformed_cursor(self, client):
+        response = client.get("/terminals/abcd1234/output?since=garbage")
+
+        assert response.status_code == 422
+
+    def test_get_output_gzip(self, client):
+        with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.get_output.return_value = "line\n" * 1000
+            mock_svc.get_output_cursor.return_value = "mem:0"
+
+            response = client.get("/terminals/abcd1234/output", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["output"] == "line\n" * 1000
 
     def test_get_output_terminal_not_found(self, client):
         """GET /terminals/{id}/output returns 404 for nonexistent terminal."""
@@ -844,6 +992,29 @@ class TestGetTerminalOutput:
         assert "Failed to get output" in response.json()["detail"]
 
 
+class TestGetTerminalScrollback:
+    """Tests for GET /terminals/{terminal_id}/scrollback endpoint."""
+
+    def test_streams_chunks(self, client):
+        with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.stream_scrollback.return_value = iter([b"line1\n", b"line2\n"])
+
+            response = client.get("/terminals/abcd1234/scrollback?strip_ansi=false")
+
+        assert response.status_code == 200
+        assert response.text == "line1\nline2\n"
+        assert response.headers["content-type"].startswith("text/plain")
+        mock_svc.stream_scrollback.assert_called_once_with("abcd1234", strip_escapes=False)
+
+    def test_not_found(self, client):
+        with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.stream_scrollback.side_effect = ValueError("No scrollback")
+
+            response = client.get("/terminals/abcd1234/scrollback")
+
+        assert response.status_code == 404
+
+
 class TestDeleteTerminal:
     """Tests for DELETE /terminals/{terminal_id} endpoint."""
 
@@ -995,6 +1166,27 @@ class TestOpenCodeInboxDeliveryDaemon:
         assert mock_to_thread.await_args.args[1] is registry
 
 
+class TestMemoryCleanupDaemon:
+    """Tests for the memory_cleanup_daemon() background task."""
+
+    @pytest.mark.asyncio
+    async def test_runs_cleanup_then_waits_for_the_interval(self):
+        from cli_agent_orchestrator.api.main import memory_cleanup_daemon
+        from cli_agent_orchestrator.constants import MEMORY_CLEANUP_INTERVAL_SECONDS
+
+        with (
+            patch(
+                "cli_agent_orchestrator.api.main.cleanup_expired_memories", new_callable=AsyncMock
+            ) as cleanup,
+            patch("asyncio.sleep", side_effect=asyncio.CancelledError) as sleep,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await memory_cleanup_daemon()
+
+        cleanup.assert_awaited_once()
+        sleep.assert_called_once_with(MEMORY_CLEANUP_INTERVAL_SECONDS)
+
+
 # ── lifespan ─────────────────────────────────────────────────────────
 
 
@@ -1066,7 +1258,24 @@ class TestMainEntryPoint:
 
             main()
 
-            mock_uvicorn.assert_called_once_with(app, host="0.0.0.0", port=9999)
+            mock_uvicorn.assert_called_once_with(
+                app, host="0.0.0.0", port=9999, ws_per_message_deflate=True
+            )
+
+    def test_main_can_disable_ws_compression(self):
+        """main() passes WS_PER_MESSAGE_DEFLATE through to uvicorn."""
+        with (
+            patch("argparse.ArgumentParser.parse_args") as mock_args,
+            patch("uvicorn.run") as mock_uvicorn,
+            patch("cli_agent_orchestrator.api.main.WS_PER_MESSAGE_DEFLATE", False),
+        ):
+            mock_args.return_value = MagicMock(agents_dir=None, host=None, port=None)
+
+            from cli_agent_orchestrator.api.main import main
+
+            main()
+
+            assert mock_uvicorn.call_args.kwargs["ws_per_message_deflate"] is False
 
     def test_main_with_agents_dir(self):
         """main() sets KIRO_AGENTS_DIR when --agents-dir is provided."""
@@ -1105,5 +1314,5 @@ class TestMainEntryPoint:
 
             assert parent.mock_calls == [
                 call.add_cors("0.0.0.0", 9999),
-                call.uvicorn_run(app, host="0.0.0.0", port=9999),
+                call.uvicorn_run(app, host="0.0.0.0", port=9999, ws_per_message_deflate=True),
             ]
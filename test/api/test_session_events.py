@@ -0,0 +1,84 @@
+"""Tests for the server-sent session list updates."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.api import session_events
+from cli_agent_orchestrator.api.session_events import session_event, stream_session_events
+from cli_agent_orchestrator.services import session_service
+from cli_agent_orchestrator.services.session_service import SessionsSnapshot
+
+
+def _snapshot(etag, *sessions):
+    return SessionsSnapshot(etag, [{"id": s, "name": s, "status": "detached"} for s in sessions])
+
+
+class TestSessionEvent:
+    def test_first_event_is_full_snapshot(self):
+        event = session_event(None, _snapshot('"a"', "cao-1"))
+
+        assert event["type"] == "snapshot"
+        assert [s["id"] for s in event["sessions"]] == ["cao-1"]
+
+    def test_delta_lists_upserts_and_removals(self):
+        before = _snapshot('"a"', "cao-1", "cao-2")
+        after = SessionsSnapshot(
+            '"b"',
+            [
+                {"id": "cao-2", "name": "cao-2", "status": "active"},
+                {"id": "cao-3", "name": "cao-3", "status": "detached"},
+            ],
+        )
+
+        event = session_event(before, after)
+
+        assert event["etag"] == '"b"'
+        assert [s["id"] for s in event["upserted"]] == ["cao-2", "cao-3"]
+        assert event["removed"] == ["cao-1"]
+
+
+class TestStreamSessionEvents:
+    @pytest.mark.asyncio
+    async def test_pushes_on_invalidate(self):
+        snapshots = iter([_snapshot('"a"', "cao-1"), _snapshot('"b"')])
+
+        async def is_disconnected():
+            return False
+
+        with patch.object(
+            session_events.session_service,
+            "get_sessions_snapshot",
+            side_effect=lambda: next(snapshots),
+        ):
+            events = stream_session_events(is_disconnected)
+            first = await events.__anext__()
+            await asyncio.to_thread(session_service.invalidate_sessions_snapshot)
+            second = await asyncio.wait_for(events.__anext__(), timeout=1)
+            await events.aclose()
+
+        assert first.startswith('id: "a"\ndata: {"type": "snapshot"')
+        assert '"removed": ["cao-1"]' in second
+        assert session_service._change_listeners == []
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_only_gets_keepalives(self):
+        checks = iter([False, False, False, True])
+
+        async def is_disconnected():
+            return next(checks)
+
+        with (
+            patch.object(
+                session_events.session_service,
+                "get_sessions_snapshot",
+                return_value=_snapshot('"a"', "cao-1"),
+            ) as mock_snapshot,
+            patch.object(session_events, "SESSION_EVENTS_KEEPALIVE_SECONDS", 0.01),
+        ):
+            messages = [m async for m in stream_session_events(is_disconnected)]
+
+        assert messages[0].startswith('id: "a"')
+        assert messages[1:] == [": keepalive\n\n"] * 3
+        assert mock_snapshot.call_count == 3
@@ -0,0 +1,251 @@
+"""Tests for the per-terminal WebSocket fan-out hub."""
+
+import asyncio
+import json
+import os
+import struct
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from cli_agent_orchestrator.api import terminal_hub
+from cli_agent_orchestrator.api.terminal_hub import HubSubscriber, TerminalHub
+
+
+def _drain(subscriber):
+    items = list(subscriber.messages)
+    subscriber.messages.clear()
+    if subscriber.pending:
+        items.append(subscriber.take(len(subscriber.pending)))
+    if subscriber.closed:
+        items.append(None)
+    return items
+
+
+def _owner_flags(items):
+    return [json.loads(i)["owner"] for i in items if isinstance(i, str)]
+
+
+@pytest.fixture
+def hub():
+    hub = TerminalHub("abcd1234", "cao-s", "w", env={})
+    with patch.object(hub, "request_redraw") as redraw:
+        hub.redraw = redraw
+        yield hub
+
+
+class TestHubSubscriber:
+    @pytest.mark.asyncio
+    async def test_chunks_coalesce_into_one_buffer(self):
+        subscriber = HubSubscriber(max_bytes=16)
+        subscriber.push(b"ab")
+        subscriber.push(b"cd")
+
+        assert subscriber.take(3) == b"abc"
+        assert subscriber.take(3) == b"d"
+
+    @pytest.mark.asyncio
+    async def test_overflow_discards_backlog_and_flags_resync(self):
+        subscriber = HubSubscriber(max_bytes=4)
+        subscriber.push(b"abc")
+        subscriber.push(b"de")
+        subscriber.push(b"f")
+
+        assert subscriber.needs_resync is True
+        assert subscriber.resyncs == 1
+        assert subscriber.pending == b""
+
+
+def _recording_websocket():
+    ws = MagicMock()
+    ws.sent = []
+
+    async def send_bytes(data):
+        ws.sent.append(data)
+
+    async def send_text(data):
+        ws.sent.append(data)
+
+    ws.send_bytes = AsyncMock(side_effect=send_bytes)
+    ws.send_text = AsyncMock(side_effect=send_text)
+    return ws
+
+
+class TestPumpToWebsocket:
+    @pytest.mark.asyncio
+    async def test_batches_output_within_frame_budget(self):
+        subscriber = HubSubscriber()
+        ws = _recording_websocket()
+        for chunk in (b"a", b"b", b"c"):
+            subscriber.push(chunk)
+        subscriber.push('{"type": "input_owner", "owner": true}')
+        subscriber.push(None)
+
+        with patch.object(terminal_hub, "WS_FRAME_MAX_BYTES", 2):
+            await terminal_hub.pump_to_websocket(ws, subscriber, lambda: False, AsyncMock())
+
+        assert ws.sent == ['{"type": "input_owner", "owner": true}', b"ab", b"c"]
+
+    @pytest.mark.asyncio
+    async def test_waits_briefly_to_fill_partial_frame(self):
+        subscriber = HubSubscriber()
+        ws = _recording_websocket()
+        subscriber.push(b"first ")
+
+        async def later():
+            await asyncio.sleep(0.005)
+            subscriber.push(b"second")
+            subscriber.push(None)
+
+        with patch.object(terminal_hub, "WS_FRAME_INTERVAL_SECONDS", 0.05):
+            await asyncio.gather(
+                terminal_hub.pump_to_websocket(ws, subscriber, lambda: False, AsyncMock()),
+                later(),
+            )
+
+        assert ws.sent == [b"first second"]
+
+    @pytest.mark.asyncio
+    async def test_lagging_subscriber_gets_snapshot(self):
+        subscriber = HubSubscriber(max_bytes=4)
+        ws = _recording_websocket()
+        subscriber.push(b"abcdef")
+        resync = AsyncMock(return_value=b"SCREEN")
+
+        async def after_resync():
+            await asyncio.sleep(0.01)
+            subscriber.push(b"new")
+            subscriber.push(None)
+
+        await asyncio.gather(
+            terminal_hub.pump_to_websocket(ws, subscriber, lambda: False, resync),
+            after_resync(),
+        )
+
+        resync.assert_awaited_once()
+        assert ws.sent == [b"SCREEN", b"new"]
+
+
+class TestTerminalHub:
+    @pytest.mark.asyncio
+    async def test_first_subscriber_owns_input(self, hub):
+        first = hub.subscribe()
+        second = hub.subscribe()
+
+        assert _owner_flags(_drain(first)) == [True]
+        assert _owner_flags(_drain(second)) == [False]
+        hub.redraw.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ownership_passes_on_leave(self, hub):
+        first = hub.subscribe()
+        second = hub.subscribe()
+        _drain(second)
+
+        hub.unsubscribe(first)
+
+        assert hub.is_owner(second)
+        assert _owner_flags(_drain(second)) == [True]
+
+    @pytest.mark.asyncio
+    async def test_output_broadcast_to_all(self, hub):
+        read_fd, write_fd = os.pipe()
+        hub._master_fd = read_fd
+        first = hub.subscribe()
+        second = hub.subscribe()
+        os.write(write_fd, b"screen")
+
+        hub._on_pty_data()
+
+        assert _drain(first)[-1] == b"screen"
+        assert _drain(second)[-1] == b"screen"
+        os.close(write_fd)
+        os.close(read_fd)
+        hub._master_fd = None
+
+    @pytest.mark.asyncio
+    async def test_only_owner_can_type_or_resize(self, hub):
+        read_fd, write_fd = os.pipe()
+        hub._master_fd = write_fd
+        owner = hub.subscribe()
+        viewer = hub.subscribe()
+
+        assert await hub.write_input(viewer, b"nope") is False
+        assert hub.resize(viewer, 40, 120) is False
+        assert await hub.write_input(owner, b"ls\r") is True
+        assert os.read(read_fd, 100) == b"ls\r"
+        os.close(write_fd)
+        os.close(read_fd)
+        hub._master_fd = None
+
+    @pytest.mark.asyncio
+    async def test_binary_and_json_frames(self, hub):
+        read_fd, write_fd = os.pipe()
+        hub._master_fd = write_fd
+        owner = hub.subscribe()
+
+        with patch.object(hub, "resize") as resize:
+            await hub.handle_client_frame(owner, None, bytes([terminal_hub.FRAME_INPUT]) + b"ls")
+            await hub.handle_client_frame(owner, '{"type": "input", "data": "\\r"}', None)
+            await hub.handle_client_frame(
+                owner, None, bytes([terminal_hub.FRAME_RESIZE]) + struct.pack("!HH", 40, 120)
+            )
+            await hub.handle_client_frame(owner, '{"type": "resize", "rows": 30, "cols": 90}', None)
+
+        assert os.read(read_fd, 100) == b"ls\r"
+        assert resize.call_args_list == [call(owner, 40, 120), call(owner, 30, 90)]
+        os.close(write_fd)
+        os.close(read_fd)
+        hub._master_fd = None
+
+    @pytest.mark.asyncio
+    async def test_malformed_binary_frames_ignored(self, hub):
+        owner = hub.subscribe()
+
+        with patch.object(hub, "resize") as resize, patch.object(hub, "write_input") as write:
+            await hub.handle_client_frame(owner, None, b"")
+            await hub.handle_client_frame(owner, None, bytes([terminal_hub.FRAME_RESIZE, 1]))
+            await hub.handle_client_frame(owner, None, b"\x7fzz")
+
+        resize.assert_not_called()
+        write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_last_unsubscribe_closes_hub(self, hub):
+        proc = MagicMock()
+        proc.poll.return_value = None
+        hub._proc = proc
+        terminal_hub._hubs["abcd1234"] = hub
+        subscriber = hub.subscribe()
+
+        hub.unsubscribe(subscriber)
+
+        assert hub.closed
+        proc.terminate.assert_called_once()
+        assert "abcd1234" not in terminal_hub._hubs
+
+    @pytest.mark.asyncio
+    async def test_pty_eof_releases_subscribers(self, hub):
+        read_fd, write_fd = os.pipe()
+        hub._master_fd = read_fd
+        subscriber = hub.subscribe()
+        os.close(write_fd)
+
+        hub._on_pty_data()
+
+        assert hub.closed
+        assert _drain(subscriber)[-1] is None
+
+
+class TestGetOrCreateHub:
+    @pytest.mark.asyncio
+    async def test_reuses_running_hub(self):
+        with patch.object(TerminalHub, "start") as start:
+            first = terminal_hub.get_or_create_hub("abcd1234", "cao-s", "w", {})
+            first._proc = MagicMock()
+            first._proc.poll.return_value = None
+            second = terminal_hub.get_or_create_hub("abcd1234", "cao-s", "w", {})
+
+        assert first is second
+        start.assert_called_once()
+        first.close()
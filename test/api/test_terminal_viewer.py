@@ -0,0 +1,190 @@
+"""Tests for read-only WebSocket viewers (``?mode=view``)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from cli_agent_orchestrator.api import terminal_viewer
+from cli_agent_orchestrator.api.terminal_viewer import (
+    LOG_FOLLOW_READ_BYTES,
+    log_end_offset,
+    read_new_log_bytes,
+    render_snapshot,
+)
+from cli_agent_orchestrator.services.output_stream_service import TerminalOutputStream
+
+
+class TestRenderSnapshot:
+    def test_clears_screen_and_restores_cursor(self):
+        data = render_snapshot("a\nb", cursor_x=3, cursor_y=1)
+
+        assert data == b"\x1b[2J\x1b[Ha\r\nb\x1b[2;4H"
+
+
+class TestReadNewLogBytes:
+    def test_reads_appended_bytes(self, tmp_path):
+        log = tmp_path / "t.log"
+        log.write_bytes(b"hello")
+
+        assert read_new_log_bytes(log, 2) == (b"llo", 5)
+        assert read_new_log_bytes(log, 5) == (b"", 5)
+
+    def test_restarts_after_rotation(self, tmp_path):
+        log = tmp_path / "t.log"
+        log.write_bytes(b"new")
+
+        assert read_new_log_bytes(log, 100) == (b"new", 3)
+
+    def test_missing_file(self, tmp_path):
+        assert read_new_log_bytes(tmp_path / "missing.log", 7) == (b"", 0)
+
+
+class TestLogEndOffset:
+    def test_size_of_log(self, tmp_path):
+        log = tmp_path / "t.log"
+        log.write_bytes(b"hello")
+
+        assert log_end_offset(log) == 5
+
+    def test_missing_file(self, tmp_path):
+        assert log_end_offset(tmp_path / "missing.log") == 0
+
+
+def _websocket(sent, disconnect: asyncio.Event):
+    ws = MagicMock()
+
+    async def send_bytes(data):
+        sent.append(data)
+
+    async def receive():
+        await disconnect.wait()
+        raise WebSocketDisconnect()
+
+    ws.send_bytes = AsyncMock(side_effect=send_bytes)
+    ws.send_text = AsyncMock()
+    ws.receive = AsyncMock(side_effect=receive)
+    ws.close = AsyncMock()
+    return ws
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+class TestServeView:
+    @pytest.mark.asyncio
+    async def test_snapshot_then_live_stream_output(self, tmp_path):
+        stream = TerminalOutputStream("abcd1234", tmp_path / "abcd1234.pipe")
+        sent: list = []
+        disconnect = asyncio.Event()
+        ws = _websocket(sent, disconnect)
+
+        with (
+            patch.object(terminal_viewer.output_stream_service, "get_stream", return_value=stream),
+            patch.object(
+                terminal_viewer.tmux_client, "get_screen_snapshot", return_value=("$ ", 2, 0)
+            ),
+        ):
+            task = asyncio.ensure_future(terminal_viewer.serve_view(ws, "abcd1234", "cao-s", "w"))
+            await _wait_for(lambda: len(sent) == 1)
+            stream.feed(b"live")
+            await _wait_for(lambda: len(sent) == 2)
+            disconnect.set()
+            await asyncio.wait_for(task, timeout=2.0)
+
+        assert sent == [render_snapshot("$ ", 2, 0), b"live"]
+        assert stream._listeners == []
+
+    @pytest.mark.asyncio
+    async def test_follows_log_file_without_stream(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        log.write_bytes(b"old output")
+        sent: list = []
+        disconnect = asyncio.Event()
+        ws = _websocket(sent, disconnect)
+
+        with (
+            patch.object(terminal_viewer, "TERMINAL_LOG_DIR", tmp_path),
+            patch.object(terminal_viewer, "LOG_FOLLOW_INTERVAL", 0.01),
+            patch.object(terminal_viewer.output_stream_service, "get_stream", return_value=None),
+            patch.object(
+                terminal_viewer.tmux_client, "get_screen_snapshot", return_value=("", 0, 0)
+            ),
+        ):
+            task = asyncio.ensure_future(terminal_viewer.serve_view(ws, "abcd1234", "cao-s", "w"))
+            await _wait_for(lambda: len(sent) == 1)
+            with open(log, "ab") as f:
+                f.write(b" new")
+            await _wait_for(lambda: len(sent) == 2)
+            disconnect.set()
+            await asyncio.wait_for(task, timeout=2.0)
+
+        # Only bytes written after the viewer connected are streamed
+        assert sent[1] == b" new"
+
+    @pytest.mark.asyncio
+    async def test_follow_starts_at_end_of_large_log(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        log.write_bytes(b"x" * (3 * LOG_FOLLOW_READ_BYTES))
+        sent: list = []
+        disconnect = asyncio.Event()
+        ws = _websocket(sent, disconnect)
+
+        with (
+            patch.object(terminal_viewer, "TERMINAL_LOG_DIR", tmp_path),
+            patch.object(terminal_viewer, "LOG_FOLLOW_INTERVAL", 0.01),
+            patch.object(terminal_viewer.output_stream_service, "get_stream", return_value=None),
+            patch.object(
+                terminal_viewer.tmux_client, "get_screen_snapshot", return_value=("", 0, 0)
+            ),
+        ):
+            task = asyncio.ensure_future(terminal_viewer.serve_view(ws, "abcd1234", "cao-s", "w"))
+            await _wait_for(lambda: len(sent) == 1)
+            with open(log, "ab") as f:
+                f.write(b"new")
+            await _wait_for(lambda: len(sent) == 2)
+            disconnect.set()
+            await asyncio.wait_for(task, timeout=2.0)
+
+        assert sent[1] == b"new"
+
+    @pytest.mark.asyncio
+    async def test_never_starts_attach_client(self, tmp_path):
+        from cli_agent_orchestrator.api import main as main_module
+
+        ws = MagicMock()
+        ws.client = MagicMock(host="127.0.0.1")
+        ws.accept = AsyncMock()
+
+        with (
+            patch.object(
+                main_module,
+                "get_terminal_metadata",
+                return_value={"tmux_session": "cao-s", "tmux_window": "w"},
+            ),
+            patch.object(main_module.terminal_viewer, "serve_view", AsyncMock()) as serve_view,
+            patch.object(main_module.terminal_hub, "get_or_create_hub") as get_hub,
+        ):
+            await main_module.terminal_ws(ws, "abcd1234", mode="view")
+
+        serve_view.assert_awaited_once_with(ws, "abcd1234", "cao-s", "w")
+        get_hub.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode_rejected(self):
+        from cli_agent_orchestrator.api import main as main_module
+
+        ws = MagicMock()
+        ws.client = MagicMock(host="127.0.0.1")
+        ws.accept = AsyncMock()
+        ws.close = AsyncMock()
+
+        await main_module.terminal_ws(ws, "abcd1234", mode="bogus")
+
+        ws.close.assert_awaited_once()
+        assert ws.close.call_args.kwargs["code"] == 1008
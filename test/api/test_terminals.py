@@ -573,6 +573,7 @@ class TestWebSocketSubprocessTerm:
         before touching the real PTY/asyncio loop.
         """
         from cli_agent_orchestrator.api import main as main_module
+        from cli_agent_orchestrator.api import terminal_hub
 
         ws = MagicMock()
         ws.client = MagicMock(host="127.0.0.1")
@@ -593,11 +594,11 @@ class TestWebSocketSubprocessTerm:
                 "get_terminal_metadata",
                 return_value={"tmux_session": "cao-s", "tmux_window": "w"},
             ),
-            patch.object(main_module.subprocess, "Popen", side_effect=capture_and_stop),
-            patch.object(main_module.pty, "openpty", return_value=(100, 101)),
-            patch.object(main_module.fcntl, "ioctl"),
-            patch.object(main_module.fcntl, "fcntl"),
-            patch.object(main_module.os, "close"),
+            patch.object(terminal_hub.subprocess, "Popen", side_effect=capture_and_stop),
+            patch.object(terminal_hub.pty, "openpty", return_value=(100, 101)),
+            patch.object(terminal_hub.fcntl, "ioctl"),
+            patch.object(terminal_hub.fcntl, "fcntl"),
+            patch.object(terminal_hub.os, "close"),
         ):
             with pytest.raises(_StopHere):
                 await main_module.terminal_ws(ws, "abcd1234")
@@ -610,6 +611,64 @@ class TestWebSocketSubprocessTerm:
         assert passed_env["TERM"] == "xterm-256color"
 
 
+class TestWebSocketDisconnectCleanup:
+    """A viewer disconnecting must tear down the shared attach client."""
+
+    def test_disconnect_closes_hub_and_terminates_attach(self, client):
+        import json
+        import os
+        import pty
+
+        from cli_agent_orchestrator.api import main as main_module
+        from cli_agent_orchestrator.api import terminal_hub
+
+        proc = MagicMock()
+        proc.poll.return_value = None
+        # Hold a spare handle on the PTY's child end, standing in for the
+        # attach client, so the hub only closes when the viewer leaves.
+        held_fds = []
+        real_openpty = pty.openpty
+
+        def openpty():
+            master_fd, slave_fd = real_openpty()
+            held_fds.append(os.dup(slave_fd))
+            return master_fd, slave_fd
+
+        started = []
+        create_hub = terminal_hub.get_or_create_hub
+
+        def get_or_create_hub(*args):
+            started.append(create_hub(*args))
+            return started[-1]
+
+        try:
+            with (
+                patch.object(main_module, "WS_ALLOWED_CLIENTS", ["testclient"]),
+                patch.object(
+                    main_module,
+                    "get_terminal_metadata",
+                    return_value={"tmux_session": "cao-s", "tmux_window": "w"},
+                ),
+                patch.object(terminal_hub.pty, "openpty", side_effect=openpty),
+                patch.object(terminal_hub.subprocess, "Popen", return_value=proc),
+                patch.object(terminal_hub, "get_or_create_hub", side_effect=get_or_create_hub),
+            ):
+                with client.websocket_connect(
+                    "/terminals/abcd1234/ws", headers={"Host": "localhost"}
+                ) as ws:
+                    assert json.loads(ws.receive_text()) == {"type": "input_owner", "owner": True}
+                    assert not started[0].closed
+        finally:
+            for fd in held_fds:
+                os.close(fd)
+
+        hub = started[0]
+        assert hub.closed
+        assert hub.subscribers == []
+        assert "abcd1234" not in terminal_hub._hubs
+        proc.terminate.assert_called_once()
+
+
 class _StopHere(Exception):
     """Sentinel raised by the wiring test once Popen args are captured."""
 
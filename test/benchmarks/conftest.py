@@ -0,0 +1,136 @@
+"""Shared fixtures and reporting for the memory benchmarks.
+
+Each benchmark runs against a synthetic wiki store (see memory_corpus.py) in
+a temporary MEMORY_BASE_DIR with its own SQLite database, and records
+p50/p95 latency plus the process's peak RSS. Results are printed in the
+terminal summary; set ``CAO_BENCH_OUTPUT`` to also write them as JSON.
+
+Benchmarks are deselected by default. ``CAO_BENCH_SIZES`` picks the corpus
+sizes (default: 1000,10000,100000). Run without ``-n`` so the results reach
+the summary:
+
+    CAO_BENCH_SIZES=1000,10000 uv run pytest -m benchmark test/benchmarks/ --no-cov
+"""
+
+import json
+import math
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from test.benchmarks.memory_corpus import Corpus, build_corpus
+from typing import Callable
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from cli_agent_orchestrator.clients import database
+from cli_agent_orchestrator.services import cleanup_service, memory_service
+from cli_agent_orchestrator.services.memory_service import MemoryService
+
+BENCH_SIZES = tuple(
+    int(size) for size in os.environ.get("CAO_BENCH_SIZES", "1000,10000,100000").split(",")
+)
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Latency summary of one operation against one corpus size."""
+
+    size: int
+    operation: str
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    peak_rss_mib: float
+
+
+_results: list[BenchResult] = []
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _peak_rss_mib() -> float:
+    """High-water mark of this process's resident set size."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _record(size: int, operation: str, samples: list[float]) -> BenchResult:
+    ordered = sorted(samples)
+    result = BenchResult(
+        size=size,
+        operation=operation,
+        samples=len(ordered),
+        p50_ms=_percentile(ordered, 0.50) * 1000,
+        p95_ms=_percentile(ordered, 0.95) * 1000,
+        peak_rss_mib=_peak_rss_mib(),
+    )
+    _results.append(result)
+    return result
+
+
+@pytest.fixture
+def record_benchmark() -> Callable[[int, str, list[float]], BenchResult]:
+    """Record latency samples (seconds) for the summary table."""
+    return _record
+
+
+@pytest.fixture(scope="module", params=BENCH_SIZES, ids=lambda size: f"{size}-memories")
+def memory_corpus(request, tmp_path_factory):
+    """A synthetic store of ``size`` memories, shared by one module's benchmarks.
+
+    The store is mutated by store and cleanup benchmarks; modules order their
+    tests so destructive ones run last.
+    """
+    size = request.param
+    workdir = tmp_path_factory.mktemp(f"memory-bench-{size}")
+    base_dir = workdir / "memory"
+    base_dir.mkdir()
+    engine = create_engine(
+        f"sqlite:///{workdir / 'cao.db'}", connect_args={"check_same_thread": False}
+    )
+    database.Base.metadata.create_all(engine)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            database,
+            "SessionLocal",
+            sessionmaker(autocommit=False, autoflush=False, bind=engine),
+        )
+        mp.setattr(memory_service, "MEMORY_BASE_DIR", base_dir)
+        mp.setattr(cleanup_service, "MEMORY_BASE_DIR", base_dir)
+        mp.setattr(memory_service, "_is_memory_enabled", lambda: True)
+
+        started = time.perf_counter()
+        corpus: Corpus = build_corpus(MemoryService(base_dir=base_dir), size, workdir)
+        _record(size, "build corpus", [time.perf_counter() - started])
+        yield corpus
+
+    engine.dispose()
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not _results:
+        return
+    terminalreporter.section("memory benchmarks")
+    terminalreporter.write_line(
+        f"{'memories':>9}  {'operation':<32} {'n':>4} {'p50 ms':>10} {'p95 ms':>10} "
+        f"{'peak RSS MiB':>13}"
+    )
+    for r in _results:
+        terminalreporter.write_line(
+            f"{r.size:>9}  {r.operation:<32} {r.samples:>4} {r.p50_ms:>10.2f} "
+            f"{r.p95_ms:>10.2f} {r.peak_rss_mib:>13.1f}"
+        )
+    output = os.environ.get("CAO_BENCH_OUTPUT")
+    if output:
+        Path(output).write_text(json.dumps([asdict(r) for r in _results], indent=2) + "\n")
+        terminalreporter.write_line(f"wrote {output}")
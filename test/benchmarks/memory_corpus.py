@@ -0,0 +1,177 @@
+"""Synthetic wiki stores for the memory benchmarks.
+
+``build_corpus`` writes wiki files, one ``index.md`` per container and the
+matching ``memory_metadata`` rows directly, in the same formats store()
+produces, then rebuilds the search index. Storing 100k memories one at a
+time would take far longer than the operations being measured.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from cli_agent_orchestrator.clients.database import MemoryMetadataModel
+from cli_agent_orchestrator.models.memory import MemoryScope, MemoryType
+from cli_agent_orchestrator.services.cleanup_service import (
+    PERMANENT_MEMORY_TYPES,
+    SCOPE_RETENTION_DAYS,
+)
+from cli_agent_orchestrator.services.memory_service import MemoryService
+
+# Share of memories per scope.
+SCOPE_MIX = (
+    (MemoryScope.GLOBAL.value, 0.1),
+    (MemoryScope.PROJECT.value, 0.6),
+    (MemoryScope.SESSION.value, 0.2),
+    (MemoryScope.AGENT.value, 0.1),
+)
+# Memories per project container, and session / agent scope ids in use.
+MEMORIES_PER_PROJECT = 1000
+SESSIONS = 10
+AGENT_PROFILES = 5
+# Share of memories in expiring scopes that are older than their retention.
+EXPIRED_FRACTION = 0.01
+VOCABULARY_SIZE = 4000
+METADATA_BATCH_SIZE = 5000
+
+_SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "sa", "to", "vi", "ze", "po", "qu", "di", "fa", "gu")
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """A generated store and the terminal the benchmarks act as."""
+
+    size: int
+    base_dir: Path
+    terminal_context: dict
+    vocabulary: tuple[str, ...]
+    expired: int
+
+
+def _vocabulary(rng: random.Random) -> tuple[str, ...]:
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return tuple(sorted(words))
+
+
+def build_corpus(svc: MemoryService, size: int, workdir: Path, seed: int = 0) -> Corpus:
+    """Write ``size`` memories under ``svc.base_dir`` and index them.
+
+    The benchmark terminal's session, project and agent each hold their
+    share of a scope; the rest is spread over other scope ids. Ages are
+    spread over each scope's retention window, except ``EXPIRED_FRACTION``
+    of session and project memories, which are past it.
+    """
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    # Zipf-like word frequencies, so queries see both rare and common terms.
+    weights = [1.0 / rank for rank in range(1, len(vocabulary) + 1)]
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    cwd = workdir / "project-0"
+    cwd.mkdir(parents=True, exist_ok=True)
+    terminal_context = {
+        "terminal_id": "bench000",
+        "session_name": "cao-bench-0",
+        "agent_profile": "agent-0",
+        "provider": "claude_code",
+        "cwd": str(cwd),
+    }
+    own_project = svc.resolve_scope_id(MemoryScope.PROJECT.value, terminal_context)
+    projects = max(1, int(size * 0.6) // MEMORIES_PER_PROJECT)
+    project_ids = [own_project] + [f"{i:012x}" for i in range(1, projects)]
+    scope_ids: dict[str, list[Optional[str]]] = {
+        MemoryScope.GLOBAL.value: [None],
+        MemoryScope.PROJECT.value: project_ids,
+        MemoryScope.SESSION.value: [f"cao-bench-{i}" for i in range(SESSIONS)],
+        MemoryScope.AGENT.value: [f"agent-{i}" for i in range(AGENT_PROFILES)],
+    }
+    scopes = [scope for scope, _ in SCOPE_MIX]
+    scope_weights = [share for _, share in SCOPE_MIX]
+    memory_types = [t.value for t in MemoryType]
+
+    index_lines: dict[Path, dict[str, list[str]]] = {}
+    metadata: list[dict[str, Any]] = []
+    expired = 0
+    for i in range(size):
+        scope = rng.choices(scopes, scope_weights)[0]
+        scope_id = rng.choice(scope_ids[scope])
+        memory_type = rng.choice(memory_types)
+        words = rng.choices(vocabulary, weights, k=rng.randint(20, 60))
+        content = " ".join(words)
+        key = f"{words[0]}-{i}"
+        tags = ",".join(sorted(set(rng.sample(vocabulary[:50], rng.randint(0, 3)))))
+
+        retention = SCOPE_RETENTION_DAYS[scope]
+        if retention is not None and rng.random() < EXPIRED_FRACTION:
+            age = timedelta(days=retention + 2 + rng.randint(0, 30))
+            if memory_type not in PERMANENT_MEMORY_TYPES:
+                expired += 1
+        else:
+            age = timedelta(seconds=rng.randint(0, (retention or 365) * 86400 - 86400))
+        updated = now - age
+        timestamp = updated.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        wiki_path = svc.get_wiki_path(scope, scope_id, key)
+        wiki_path.parent.mkdir(parents=True, exist_ok=True)
+        memory_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        wiki_path.write_text(
+            f"# {key}\n"
+            f"<!-- id: {memory_id} | scope: {scope} | type: {memory_type} | tags: {tags} -->\n"
+            f"\n## {timestamp}\n{content}\n",
+            encoding="utf-8",
+        )
+
+        if scope in (MemoryScope.SESSION.value, MemoryScope.AGENT.value):
+            relative_path = f"{scope}/{scope_id}/{key}.md"
+        else:
+            relative_path = f"{scope}/{key}.md"
+        sections = index_lines.setdefault(svc.get_index_path(scope, scope_id), {})
+        sections.setdefault(scope, []).append(
+            f"- [{key}]({relative_path}) — type:{memory_type} tags:{tags} "
+            f"~{int(len(words) * 1.3)}tok updated:{timestamp}"
+        )
+        metadata.append(
+            {
+                "id": memory_id,
+                "key": key,
+                "memory_type": memory_type,
+                "scope": scope,
+                "scope_id": scope_id,
+                "file_path": str(wiki_path),
+                "tags": tags,
+                "source_provider": "claude_code",
+                "source_terminal_id": None,
+                "token_estimate": len(content) // 4,
+                "created_at": updated,
+                "updated_at": updated,
+            }
+        )
+
+    stamp = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    for index_path, sections in index_lines.items():
+        lines = ["# CAO Memory Index", f"<!-- Updated: {stamp} -->", ""]
+        for scope, entries in sections.items():
+            lines += ["", f"## {scope}", *entries]
+        index_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    with svc._get_db_session() as db:
+        table = MemoryMetadataModel.__table__
+        for start in range(0, len(metadata), METADATA_BATCH_SIZE):
+            db.execute(table.insert(), metadata[start : start + METADATA_BATCH_SIZE])
+        db.commit()
+    svc.rebuild_search_index()
+
+    return Corpus(
+        size=size,
+        base_dir=svc.base_dir,
+        terminal_context=terminal_context,
+        vocabulary=vocabulary,
+        expired=expired,
+    )
@@ -0,0 +1,118 @@
+"""Latency of the memory hot paths on synthetic stores.
+
+Numbers go to the terminal summary (see conftest.py); assertions only check
+that each operation did real work. Tests run in file order against one
+corpus per size, so the destructive cleanup benchmark comes last.
+"""
+
+import asyncio
+import random
+import time
+from test.benchmarks.memory_corpus import Corpus
+from typing import Awaitable, Callable
+
+import pytest
+
+from cli_agent_orchestrator.services import memory_service
+from cli_agent_orchestrator.services.cleanup_service import cleanup_expired_memories
+from cli_agent_orchestrator.services.memory_service import VALID_SEARCH_MODES, MemoryService
+
+pytestmark = pytest.mark.benchmark
+
+STORE_SAMPLES = 50
+RECALL_SAMPLES = 30
+CONTEXT_SAMPLES = 30
+IDLE_CLEANUP_SAMPLES = 5
+
+
+def _time_async(calls: list[Callable[[], Awaitable[object]]]) -> tuple[list[float], list]:
+    """Await each call in turn on one event loop; return durations and results."""
+
+    async def run() -> tuple[list[float], list]:
+        samples: list[float] = []
+        results: list = []
+        for call in calls:
+            started = time.perf_counter()
+            results.append(await call())
+            samples.append(time.perf_counter() - started)
+        return samples, results
+
+    return asyncio.run(run())
+
+
+def _queries(corpus: Corpus, count: int) -> list[str]:
+    """Two-word queries drawn from mid-frequency vocabulary."""
+    rng = random.Random(1)
+    return [" ".join(rng.sample(corpus.vocabulary[10:500], 2)) for _ in range(count)]
+
+
+def _service(corpus: Corpus) -> MemoryService:
+    svc = MemoryService(base_dir=corpus.base_dir)
+    svc._get_terminal_context = lambda terminal_id: corpus.terminal_context  # type: ignore[method-assign]
+    return svc
+
+
+@pytest.mark.parametrize("search_mode", VALID_SEARCH_MODES)
+def test_recall(memory_corpus, record_benchmark, search_mode):
+    svc = _service(memory_corpus)
+    calls = [
+        lambda query=query: svc.recall(
+            query=query,
+            search_mode=search_mode,
+            terminal_context=memory_corpus.terminal_context,
+        )
+        for query in _queries(memory_corpus, RECALL_SAMPLES)
+    ]
+
+    samples, results = _time_async(calls)
+
+    record_benchmark(memory_corpus.size, f"recall ({search_mode})", samples)
+    assert any(results)
+
+
+def test_memory_context_for_terminal(memory_corpus, record_benchmark):
+    svc = _service(memory_corpus)
+
+    cold: list[float] = []
+    for _ in range(CONTEXT_SAMPLES):
+        with memory_service._context_cache_lock:
+            memory_service._context_cache.clear()
+        started = time.perf_counter()
+        block = svc.get_memory_context_for_terminal("bench000")
+        cold.append(time.perf_counter() - started)
+    warm: list[float] = []
+    for _ in range(CONTEXT_SAMPLES):
+        started = time.perf_counter()
+        svc.get_memory_context_for_terminal("bench000")
+        warm.append(time.perf_counter() - started)
+
+    record_benchmark(memory_corpus.size, "memory context (cold)", cold)
+    record_benchmark(memory_corpus.size, "memory context (cached)", warm)
+    assert "<cao-memory>" in block
+
+
+def test_store(memory_corpus, record_benchmark):
+    svc = _service(memory_corpus)
+    calls = [
+        lambda query=query, i=i: svc.store(
+            content=f"benchmark note {i}: {query}",
+            scope="project",
+            key=f"bench-store-{i}",
+            terminal_context=memory_corpus.terminal_context,
+        )
+        for i, query in enumerate(_queries(memory_corpus, STORE_SAMPLES))
+    ]
+
+    samples, results = _time_async(calls)
+
+    record_benchmark(memory_corpus.size, "store", samples)
+    assert all(memory.action == "created" for memory in results)
+
+
+def test_cleanup_expired_memories(memory_corpus, record_benchmark):
+    samples, results = _time_async([cleanup_expired_memories])
+    idle, _ = _time_async([cleanup_expired_memories] * IDLE_CLEANUP_SAMPLES)
+
+    record_benchmark(memory_corpus.size, "cleanup_expired_memories", samples)
+    record_benchmark(memory_corpus.size, "cleanup_expired_memories (idle)", idle)
+    assert results[0].expired == memory_corpus.expired
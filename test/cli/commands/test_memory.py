@@ -8,7 +8,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from click.testing import CliRunner
 
-from cli_agent_orchestrator.cli.commands.memory import clear, delete, list_memories, show
+from cli_agent_orchestrator.cli.commands.memory import (
+    clear,
+    delete,
+    list_memories,
+    reindex,
+    show,
+)
 from cli_agent_orchestrator.models.memory import Memory
 
 # ---------------------------------------------------------------------------
@@ -308,3 +314,29 @@ class TestMemoryClearRequiresScope:
 
         assert result.exit_code == 0
         assert "No session-scoped memories to clear" in result.output
+
+
+class TestMemoryReindex:
+    """cao memory reindex — rebuilds the search index."""
+
+    @patch("cli_agent_orchestrator.cli.commands.memory._get_memory_service")
+    def test_memory_reindex_reports_count(self, mock_get_svc):
+        mock_svc = MagicMock()
+        mock_svc.rebuild_search_index.return_value = 42
+        mock_get_svc.return_value = mock_svc
+
+        result = CliRunner().invoke(reindex)
+
+        assert result.exit_code == 0
+        assert "Indexed 42 memory(ies)." in result.output
+
+    @patch("cli_agent_orchestrator.cli.commands.memory._get_memory_service")
+    def test_memory_reindex_error(self, mock_get_svc):
+        mock_svc = MagicMock()
+        mock_svc.rebuild_search_index.side_effect = RuntimeError("SQLite FTS5 is not available")
+        mock_get_svc.return_value = mock_svc
+
+        result = CliRunner().invoke(reindex)
+
+        assert result.exit_code != 0
+        assert "FTS5 is not available" in result.output
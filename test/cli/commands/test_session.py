@@ -216,12 +216,26 @@ class TestStatus:
         }
         output_resp = MagicMock(status_code=200)
         output_resp.json.return_value = {"output": None}
-        mock_get.side_effect = [terminals_resp, terminal_resp, output_resp]
+        overview_resp = MagicMock(status_code=200)
+        overview_resp.json.return_value = {
+            "sessions": [
+                {
+                    "name": "cao-test",
+                    "terminals": [
+                        {"id": "cond1234", "status": "idle"},
+                        {"id": "work5678", "status": "completed"},
+                    ],
+                }
+            ]
+        }
+        mock_get.side_effect = [terminals_resp, terminal_resp, output_resp, overview_resp]
 
         result = runner.invoke(session, ["status", "cao-test", "--workers"])
 
         assert result.exit_code == 0
         assert "work5678" in result.output
+        assert "completed" in result.output
+        assert mock_get.call_args_list[-1].kwargs["params"] == {"session": "cao-test"}
 
     @patch("cli_agent_orchestrator.cli.commands.session.requests.get")
     def test_status_workers_json(self, mock_get, runner):
@@ -250,7 +264,12 @@ class TestStatus:
         }
         output_resp = MagicMock(status_code=200)
         output_resp.json.return_value = {"output": None}
-        mock_get.side_effect = [terminals_resp, terminal_resp, output_resp]
+        mock_get.side_effect = [
+            terminals_resp,
+            terminal_resp,
+            output_resp,
+            requests.exceptions.ConnectionError("no overview"),
+        ]
 
         result = runner.invoke(session, ["status", "cao-test", "--workers", "--json"])
 
@@ -31,30 +31,33 @@ class TestShutdownCommand:
         assert result.exit_code != 0
         assert "Cannot use --all and --session together" in result.output
 
-    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.get")
-    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.delete")
-    def test_shutdown_all_success(self, mock_delete, mock_get, runner):
-        """Test shutdown all sessions successfully."""
-        mock_get.return_value = MagicMock(
+    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.post")
+    def test_shutdown_all_success(self, mock_post, runner):
+        """Test shutdown all sessions successfully in one bulk request."""
+        mock_post.return_value = MagicMock(
             status_code=200,
-            json=lambda: [
-                {"name": "cao-session1"},
-                {"name": "cao-session2"},
-            ],
+            json=lambda: {
+                "success": True,
+                "deleted": ["cao-session1", "cao-session2"],
+                "errors": [],
+            },
         )
-        mock_delete.return_value = MagicMock(status_code=200)
 
         result = runner.invoke(shutdown, ["--all"])
 
         assert result.exit_code == 0
         assert "Shutdown session 'cao-session1'" in result.output
         assert "Shutdown session 'cao-session2'" in result.output
-        assert mock_delete.call_count == 2
+        mock_post.assert_called_once()
+        assert mock_post.call_args[0][0].endswith("/sessions/shutdown")
+        assert mock_post.call_args[1]["params"] == {"all": "true"}
 
-    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.get")
-    def test_shutdown_all_no_sessions(self, mock_get, runner):
+    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.post")
+    def test_shutdown_all_no_sessions(self, mock_post, runner):
         """Test shutdown all when no sessions exist."""
-        mock_get.return_value = MagicMock(status_code=200, json=lambda: [])
+        mock_post.return_value = MagicMock(
+            status_code=200, json=lambda: {"success": True, "deleted": [], "errors": []}
+        )
 
         result = runner.invoke(shutdown, ["--all"])
 
@@ -71,10 +74,10 @@ class TestShutdownCommand:
         assert result.exit_code == 0
         assert "Shutdown session 'cao-test'" in result.output
 
-    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.get")
-    def test_shutdown_all_server_not_running(self, mock_get, runner):
+    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.post")
+    def test_shutdown_all_server_not_running(self, mock_post, runner):
         """Test shutdown all when server is not running raises ClickException."""
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
 
         result = runner.invoke(shutdown, ["--all"])
 
@@ -102,32 +105,24 @@ class TestShutdownCommand:
         assert "already removed" in result.output
         assert "Shutdown session" not in result.output
 
-    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.get")
-    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.delete")
-    def test_shutdown_all_partial_failure(self, mock_delete, mock_get, runner):
-        """Test --all continues on per-session failures, reporting mixed results."""
-        mock_get.return_value = MagicMock(
+    @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.post")
+    def test_shutdown_all_partial_failure(self, mock_post, runner):
+        """Test --all reports per-session failures alongside deleted sessions."""
+        mock_post.return_value = MagicMock(
             status_code=200,
-            json=lambda: [
-                {"name": "session-1"},
-                {"name": "session-2"},
-                {"name": "session-3"},
-            ],
+            json=lambda: {
+                "success": True,
+                "deleted": ["session-1", "session-3"],
+                "errors": [{"session": "session-2", "error": "kill failed"}],
+            },
         )
-        ok_response = MagicMock(status_code=200)
-        err_response = MagicMock(status_code=500)
-        err_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "500 Server Error"
-        )
-        mock_delete.side_effect = [ok_response, err_response, ok_response]
 
         result = runner.invoke(shutdown, ["--all"])
 
-        assert mock_delete.call_count == 3
         assert result.exit_code == 0
         assert "Shutdown session 'session-1'" in result.output
         assert "Shutdown session 'session-3'" in result.output
-        assert "Failed to connect to cao-server" in result.output
+        assert "Failed to shutdown session 'session-2': kill failed" in result.output
 
     @patch("cli_agent_orchestrator.cli.commands.shutdown.requests.delete")
     def test_shutdown_session_http_error(self, mock_delete, runner):
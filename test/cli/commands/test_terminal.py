@@ -1,5 +1,6 @@
 """Tests for terminal snapshot-on-delete and restore command."""
 
+import gzip
 import json
 import tempfile
 from pathlib import Path
@@ -21,14 +22,13 @@ class TestSnapshotOnDelete:
     @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
     @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
     @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
-    @patch("cli_agent_orchestrator.services.terminal_service.TERMINAL_LOG_DIR")
     def test_snapshot_written_on_delete(
-        self, mock_log_dir, mock_db_delete, mock_pm, mock_meta, mock_tmux, tmp_path
+        self, mock_db_delete, mock_pm, mock_meta, mock_tmux, tmp_path
     ):
-        """Snapshot files are written before the window is killed."""
+        """The rendered scrollback is captured, then archived in the background."""
+        from cli_agent_orchestrator.services import archive_service
         from cli_agent_orchestrator.services.terminal_service import delete_terminal
 
-        mock_log_dir.__truediv__ = lambda self, name: tmp_path / name
         mock_meta.return_value = {
             "id": "abc12345",
             "tmux_session": "cao-test",
@@ -37,17 +37,20 @@ class TestSnapshotOnDelete:
             "agent_profile": "developer",
             "allowed_tools": None,
         }
-        mock_tmux.get_history.return_value = "line1\nline2\nline3"
+        (tmp_path / "abc12345.log").write_bytes(b"\x1b[2Jrepaint noise")
+        mock_tmux.iter_history.return_value = iter([b"line1\nline2\n", b"line3"])
         mock_tmux.get_pane_working_directory.return_value = "/home/user/project"
         mock_db_delete.return_value = True
 
-        delete_terminal("abc12345")
+        with patch.object(archive_service, "TERMINAL_LOG_DIR", tmp_path):
+            delete_terminal("abc12345")
+            assert archive_service.flush(timeout=5)
 
-        mock_tmux.get_history.assert_called_once_with(
-            "cao-test", "dev-abc1", strip_escapes=True, full_history=True
-        )
-        scrollback = (tmp_path / "abc12345.scrollback").read_text()
-        assert scrollback == "line1\nline2\nline3"
+        # One plain-text capture, before the window is killed
+        mock_tmux.iter_history.assert_called_once_with("cao-test", "dev-abc1", strip_escapes=True)
+        mock_tmux.kill_window.assert_called_once()
+        with gzip.open(tmp_path / "abc12345.scrollback.gz", "rt") as f:
+            assert f.read() == "line1\nline2\nline3"
 
         snapshot = json.loads((tmp_path / "abc12345.snapshot.json").read_text())
         assert snapshot["terminal_id"] == "abc12345"
@@ -59,14 +62,42 @@ class TestSnapshotOnDelete:
     @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
     @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
     @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
-    @patch("cli_agent_orchestrator.services.terminal_service.TERMINAL_LOG_DIR")
-    def test_snapshot_failure_is_nonfatal(
-        self, mock_log_dir, mock_db_delete, mock_pm, mock_meta, mock_tmux, tmp_path
+    def test_snapshot_falls_back_to_log_when_capture_fails(
+        self, mock_db_delete, mock_pm, mock_meta, mock_tmux, tmp_path
     ):
+        """Without a capture the scrollback is rebuilt from the pipe-pane log."""
+        from cli_agent_orchestrator.services import archive_service
+        from cli_agent_orchestrator.services.terminal_service import delete_terminal
+
+        mock_meta.return_value = {
+            "id": "abc12345",
+            "tmux_session": "cao-test",
+            "tmux_window": "dev-abc1",
+            "provider": "kiro_cli",
+            "agent_profile": "developer",
+            "allowed_tools": None,
+        }
+        (tmp_path / "abc12345.log").write_bytes(b"line1\r\n\x1b[1mline2\x1b[0m\r\nline3")
+        mock_tmux.iter_history.side_effect = ValueError("can't find window")
+        mock_tmux.get_pane_working_directory.return_value = "/home/user/project"
+        mock_db_delete.return_value = True
+
+        with patch.object(archive_service, "TERMINAL_LOG_DIR", tmp_path):
+            delete_terminal("abc12345")
+            assert archive_service.flush(timeout=5)
+
+        with gzip.open(tmp_path / "abc12345.scrollback.gz", "rt") as f:
+            assert f.read() == "line1\nline2\nline3"
+
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
+    def test_snapshot_failure_is_nonfatal(self, mock_db_delete, mock_pm, mock_meta, mock_tmux):
         """Snapshot failure does not prevent terminal deletion."""
+        from cli_agent_orchestrator.services import archive_service
         from cli_agent_orchestrator.services.terminal_service import delete_terminal
 
-        mock_log_dir.__truediv__ = lambda self, name: tmp_path / name
         mock_meta.return_value = {
             "id": "abc12345",
             "tmux_session": "cao-test",
@@ -75,13 +106,15 @@ class TestSnapshotOnDelete:
             "agent_profile": "developer",
             "allowed_tools": None,
         }
-        mock_tmux.get_history.side_effect = RuntimeError("tmux error")
+        mock_tmux.get_pane_working_directory.side_effect = RuntimeError("tmux error")
         mock_db_delete.return_value = True
 
-        # Should not raise
-        result = delete_terminal("abc12345")
+        with patch.object(archive_service, "enqueue") as mock_enqueue:
+            # Should not raise
+            result = delete_terminal("abc12345")
         assert result is True
         mock_tmux.kill_window.assert_called_once()
+        mock_enqueue.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -300,6 +333,29 @@ class TestRestoreCommand:
             window_shell=f"cat '{scrollback_path}'; exec /bin/zsh -l",
         )
 
+    def test_restore_compressed_scrollback(self, runner, tmp_path):
+        """Archived .scrollback.gz files are decompressed into the window."""
+        snapshot = {"terminal_id": "abc12345", "session_name": "cao-test", "window_name": "w"}
+        (tmp_path / "abc12345.snapshot.json").write_text(json.dumps(snapshot))
+        scrollback_path = tmp_path / "abc12345.scrollback.gz"
+        with gzip.open(scrollback_path, "wt") as f:
+            f.write("prior output")
+        mock_resp = MagicMock(status_code=200)
+        mock_tmux = MagicMock()
+
+        with patch("cli_agent_orchestrator.cli.commands.terminal.TERMINAL_LOG_DIR", tmp_path):
+            with patch(
+                "cli_agent_orchestrator.cli.commands.terminal.requests.get", return_value=mock_resp
+            ):
+                with patch("cli_agent_orchestrator.cli.commands.terminal.tmux_client", mock_tmux):
+                    with patch.dict("os.environ", {"SHELL": "/bin/zsh"}):
+                        result = runner.invoke(terminal, ["restore", "abc12345"])
+
+        assert result.exit_code == 0, result.output
+        assert mock_tmux.create_window.call_args.kwargs["window_shell"] == (
+            f"gzip -dc '{scrollback_path}'; exec /bin/zsh -l"
+        )
+
     def test_restore_scrollback_missing_still_succeeds(self, runner, tmp_path):
         """Restore succeeds with no window_shell when scrollback file is missing."""
         snapshot = {
@@ -14,9 +14,12 @@ from cli_agent_orchestrator.clients.database import (
     FlowModel,
     InboxModel,
     TerminalModel,
+    append_terminal_turn_status,
+    complete_terminal_turn,
     create_flow,
     create_inbox_message,
     create_terminal,
+    create_terminal_turn,
     delete_flow,
     delete_terminal,
     delete_terminals_by_session,
@@ -24,10 +27,12 @@ from cli_agent_orchestrator.clients.database import (
     get_inbox_messages,
     get_pending_messages,
     get_terminal_metadata,
+    get_terminal_turn,
     init_db,
     list_flows,
     list_pending_receiver_ids_by_provider,
     list_terminals_by_session,
+    list_terminals_with_pending_counts,
     update_flow_enabled,
     update_flow_run_times,
     update_last_active,
@@ -595,6 +600,62 @@ class TestFlowOperations:
         mock_session.commit.assert_called_once()
 
 
+class TestTerminalTurnOperations:
+    """Tests for the per-turn transcript store."""
+
+    def test_turn_lifecycle(self, test_db):
+        with patch("cli_agent_orchestrator.clients.database.SessionLocal", test_db):
+            assert create_terminal_turn("abc12345", "claude_code", "first task") == 1
+            assert append_terminal_turn_status("abc12345", "processing") is True
+            assert append_terminal_turn_status("abc12345", "processing") is False
+            assert append_terminal_turn_status("abc12345", "completed") is True
+            assert complete_terminal_turn("abc12345", "first answer") is True
+            assert create_terminal_turn("abc12345", "claude_code", "second task") == 2
+
+            first = get_terminal_turn("abc12345", 1)
+            assert first.input == "first task"
+            assert first.response == "first answer"
+            assert [s for s, _ in first.status_transitions] == ["processing", "completed"]
+            # Latest *completed* turn, not the still-open second one
+            assert get_terminal_turn("abc12345").turn == 1
+            assert get_terminal_turn("abc12345", 3) is None
+
+    def test_turn_number_targets_an_older_turn(self, test_db):
+        with patch("cli_agent_orchestrator.clients.database.SessionLocal", test_db):
+            create_terminal_turn("abc12345", "claude_code", "first task")
+            create_terminal_turn("abc12345", "claude_code", "second task")
+
+            assert append_terminal_turn_status("abc12345", "completed", turn=1) is True
+            assert complete_terminal_turn("abc12345", "first answer", turn=1) is True
+            assert complete_terminal_turn("abc12345", "answer", turn=7) is False
+
+            assert get_terminal_turn("abc12345", 1).response == "first answer"
+            assert get_terminal_turn("abc12345", 2).response is None
+
+    def test_no_turn_yet(self, test_db):
+        with patch("cli_agent_orchestrator.clients.database.SessionLocal", test_db):
+            assert append_terminal_turn_status("abc12345", "processing") is False
+            assert complete_terminal_turn("abc12345", "answer") is False
+            assert get_terminal_turn("abc12345") is None
+
+
+class TestPendingCounts:
+    def test_counts_only_pending_messages(self, test_db):
+        with patch("cli_agent_orchestrator.clients.database.SessionLocal", test_db):
+            create_terminal("aaaa1111", "cao-s", "w1", "kiro_cli", "dev")
+            create_terminal("bbbb2222", "cao-s", "w2", "kiro_cli", "dev")
+            create_inbox_message("bbbb2222", "aaaa1111", "one")
+            create_inbox_message("bbbb2222", "aaaa1111", "two")
+            delivered = create_inbox_message("bbbb2222", "aaaa1111", "three")
+            update_message_status(delivered.id, MessageStatus.DELIVERED)
+
+            rows = {r["id"]: r for r in list_terminals_with_pending_counts()}
+
+        assert rows["aaaa1111"]["pending_messages"] == 2
+        assert rows["bbbb2222"]["pending_messages"] == 0
+        assert rows["aaaa1111"]["tmux_window"] == "w1"
+
+
 class TestInitDb:
     """Tests for init_db function."""
 
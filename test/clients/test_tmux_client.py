@@ -1,10 +1,13 @@
 """Tests for TmuxClient methods (mocked libtmux — no real tmux required)."""
 
+import io
 import os
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
+from cli_agent_orchestrator.clients.tmux import ScrollbackMark
+
 
 @pytest.fixture
 def tmux():
@@ -447,6 +450,228 @@ class TestGetHistory:
         mock_pane.cmd.assert_called_once_with("capture-pane", "-p", "-S", "-")
 
 
+class TestIterHistory:
+    def _proc(self, stdout=b"", stderr=b"", returncode=0):
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(stdout)
+        proc.stderr = io.BytesIO(stderr)
+        proc.wait.return_value = returncode
+        proc.poll.return_value = returncode
+        return proc
+
+    def test_streams_capture_in_chunks(self, tmux):
+        proc = self._proc(b"line1\nline2\n")
+        with (
+            patch(
+                "cli_agent_orchestrator.clients.tmux.subprocess.Popen", return_value=proc
+            ) as popen,
+            patch("cli_agent_orchestrator.clients.tmux.SCROLLBACK_CHUNK_BYTES", 4),
+        ):
+            chunks = list(tmux.iter_history("ses", "win"))
+
+        assert chunks == [b"line", b"1\nli", b"ne2\n"]
+        assert popen.call_args.args[0] == ["tmux", "capture-pane", "-p", "-S", "-", "-t", "ses:win"]
+        assert proc.stdout.closed
+
+    def test_keeps_escapes_on_request(self, tmux):
+        with patch(
+            "cli_agent_orchestrator.clients.tmux.subprocess.Popen", return_value=self._proc(b"x")
+        ) as popen:
+            list(tmux.iter_history("ses", "win", strip_escapes=False))
+
+        assert popen.call_args.args[0][2] == "-e"
+
+    def test_missing_window_raises_before_iteration(self, tmux):
+        proc = self._proc(stderr=b"can't find window: win", returncode=1)
+        with patch("cli_agent_orchestrator.clients.tmux.subprocess.Popen", return_value=proc):
+            with pytest.raises(ValueError, match="can't find window"):
+                tmux.iter_history("ses", "win")
+
+    def test_abandoned_stream_kills_capture(self, tmux):
+        proc = self._proc(b"a" * 10)
+        proc.poll.return_value = None
+        with (
+            patch("cli_agent_orchestrator.clients.tmux.subprocess.Popen", return_value=proc),
+            patch("cli_agent_orchestrator.clients.tmux.SCROLLBACK_CHUNK_BYTES", 4),
+        ):
+            chunks = tmux.iter_history("ses", "win")
+            next(chunks)
+            chunks.close()
+
+        proc.kill.assert_called_once()
+
+
+class TestCapturePanes:
+    def _run(self, tmux, stdout, stderr=None):
+        def cmd(*args):
+            marker = args[args.index("display-message") + 2] if "display-message" in args else ""
+            result = MagicMock()
+            result.stdout = [line.replace("MARK", marker) for line in stdout]
+            result.stderr = stderr or []
+            return result
+
+        tmux.server.cmd.side_effect = cmd
+        return tmux.capture_panes([("s", "a", 10), ("s", "b", None)])
+
+    def test_splits_one_invocation_per_target(self, tmux):
+        result = self._run(tmux, ["a1", "a2", "", "MARK", "b1"])
+
+        assert result == {("s", "a"): "a1\na2", ("s", "b"): "b1"}
+        tmux.server.cmd.assert_called_once()
+        args = tmux.server.cmd.call_args.args
+        assert args[:7] == ("capture-pane", "-e", "-p", "-S", "-10", "-t", "s:a")
+        assert args[-3:] == ("-200", "-t", "s:b")
+
+    def test_missing_window_fails_batch(self, tmux):
+        assert self._run(tmux, ["a1"], stderr=["can't find window: b"]) is None
+
+    def test_segment_mismatch_fails_batch(self, tmux):
+        assert self._run(tmux, ["a1"]) is None
+
+    def test_no_targets(self, tmux):
+        assert tmux.capture_panes([]) == {}
+        tmux.server.cmd.assert_not_called()
+
+
+# ── mark_cursor_line / get_history_from_mark ─────────────────────────
+
+
+def _pane_with_state(tmux, state_line, capture_lines=None, full_history=None):
+    """Wire a pane whose display-message returns ``state_line``.
+
+    With ``full_history`` (every line from the top of the scrollback),
+    ranged ``capture-pane -S a -E b`` calls return the matching slice;
+    other captures return ``capture_lines``. Like libtmux, trailing blank
+    lines are dropped.
+    """
+    mock_pane = MagicMock()
+
+    def cmd(name, *args):
+        result = MagicMock()
+        if name == "display-message":
+            result.stdout = [state_line]
+        elif full_history is not None and "-E" in args:
+            history_size = int(state_line.split()[0])
+            first = history_size + int(args[args.index("-S") + 1])
+            last = history_size + int(args[args.index("-E") + 1])
+            lines = list(full_history[first : last + 1])
+            while lines and lines[-1] == "":
+                lines.pop()
+            result.stdout = lines
+        else:
+            result.stdout = capture_lines or []
+        return result
+
+    mock_pane.cmd.side_effect = cmd
+    mock_window = MagicMock()
+    mock_window.panes = [mock_pane]
+    mock_session = MagicMock()
+    mock_session.windows.get.return_value = mock_window
+    tmux.server.sessions.get.return_value = mock_session
+    return mock_pane
+
+
+class TestTurnLines:
+    def test_mark_is_absolute_with_context(self, tmux):
+        history = [f"line {i}" for i in range(124)] + ["a", "b", "c"]
+        pane = _pane_with_state(tmux, "120 7 2000 0", full_history=history)
+
+        mark = tmux.mark_cursor_line("ses", "win")
+
+        assert mark == ScrollbackMark(line=127, history_limit=2000, context=("a", "b", "c"))
+        pane.cmd.assert_called_with("capture-pane", "-p", "-S", "-13", "-E", "6")
+
+    def test_mark_context_reaches_past_blank_lines(self, tmux):
+        history = [f"line {i}" for i in range(120)] + ["", "x", "", "y", "", ""]
+        _pane_with_state(tmux, "120 6 2000 0", full_history=history)
+
+        mark = tmux.mark_cursor_line("ses", "win")
+
+        assert mark.context == ("line 119", "", "x", "", "y", "", "")
+
+    def test_mark_none_on_alternate_screen(self, tmux):
+        _pane_with_state(tmux, "120 7 2000 1")
+
+        assert tmux.mark_cursor_line("ses", "win") is None
+
+    def test_mark_kept_when_history_full(self, tmux):
+        _pane_with_state(tmux, "2000 7 2000 0", ["a", "b", "c"])
+
+        assert tmux.mark_cursor_line("ses", "win").line == 2007
+
+    def test_history_from_mark_in_scrollback(self, tmux):
+        pane = _pane_with_state(tmux, "150 3 2000 0", ["> hi", "answer"])
+
+        result = tmux.get_history_from_mark("ses", "win", ScrollbackMark(127, 2000, ()))
+
+        assert result == "> hi\nanswer"
+        pane.cmd.assert_called_with("capture-pane", "-e", "-p", "-S", "-23")
+
+    def test_history_from_mark_on_visible_screen(self, tmux):
+        pane = _pane_with_state(tmux, "0 3 2000 0", ["> hi"])
+
+        tmux.get_history_from_mark("ses", "win", ScrollbackMark(2, 2000, ()), strip_escapes=True)
+
+        pane.cmd.assert_called_with("capture-pane", "-p", "-S", "2")
+
+    def test_history_from_mark_relocated_after_drop(self, tmux):
+        # One drop of 200 lines since the mark at 1900: it now sits at 1700.
+        history = [f"line {i}" for i in range(1880)]
+        mark = ScrollbackMark(1900, 2000, ("line 1697", "line 1698", "line 1699"))
+        pane = _pane_with_state(tmux, "1850 30 2000 0", ["turn"], history)
+
+        assert tmux.get_history_from_mark("ses", "win", mark) == "turn"
+        pane.cmd.assert_called_with("capture-pane", "-e", "-p", "-S", "-150")
+        # Only the context window is read, never the whole scrollback.
+        captures = [c.args for c in pane.cmd.call_args_list if c.args[0] == "capture-pane"]
+        assert captures == [
+            ("capture-pane", "-p", "-S", "-153", "-E", "-151"),
+            ("capture-pane", "-e", "-p", "-S", "-150"),
+        ]
+
+    def test_history_from_mark_relocated_with_blank_and_repeated_context(self, tmux):
+        # The prompt area above the mark is blank lines and repeated "ok"s;
+        # the mark's context reaches back to a distinctive line.
+        before = [f"line {i}" for i in range(1890)] + ["ok", "", "ok", "", "ok", "", "", ""]
+        mark_pane = _pane_with_state(tmux, "1893 5 2000 0", full_history=before)
+        mark = tmux.mark_cursor_line("ses", "win")
+        assert mark.line == 1898
+        mark_pane.cmd.reset_mock()
+
+        # One drop of 200 lines later, the marked line sits at 1698.
+        after = before[200:] + ["> question", "answer"] + ["ok", ""] * 100
+        pane = _pane_with_state(tmux, "1850 40 2000 0", ["turn"], after)
+
+        assert tmux.get_history_from_mark("ses", "win", mark) == "turn"
+        pane.cmd.assert_called_with("capture-pane", "-e", "-p", "-S", "-152")
+
+    def test_history_from_mark_scrolled_out_returns_everything(self, tmux):
+        history = [f"line {i}" for i in range(1910)]
+        mark = ScrollbackMark(100, 2000, ("gone 1", "gone 2", "gone 3"))
+        pane = _pane_with_state(tmux, "1900 10 2000 0", ["all of it"], history)
+
+        assert tmux.get_history_from_mark("ses", "win", mark) == "all of it"
+        pane.cmd.assert_called_with("capture-pane", "-e", "-p", "-S", "-1900")
+
+    def test_history_from_mark_none_on_alternate_screen(self, tmux):
+        _pane_with_state(tmux, "150 3 2000 1")
+
+        assert tmux.get_history_from_mark("ses", "win", ScrollbackMark(127, 2000, ())) is None
+
+
+class TestScreenSnapshot:
+    def test_returns_screen_and_cursor(self, tmux):
+        pane = _pane_with_state(tmux, "4 1", ["\x1b[1m$\x1b[0m ls", "a  b"])
+
+        assert tmux.get_screen_snapshot("ses", "win") == ("\x1b[1m$\x1b[0m ls\na  b", 4, 1)
+        pane.cmd.assert_any_call("capture-pane", "-e", "-p")
+
+    def test_unparseable_cursor_defaults_to_origin(self, tmux):
+        _pane_with_state(tmux, "", ["x"])
+
+        assert tmux.get_screen_snapshot("ses", "win") == ("x", 0, 0)
+
+
 # ── list_sessions ────────────────────────────────────────────────────
 
 
@@ -658,7 +883,10 @@ class TestPipePane:
 
         tmux.pipe_pane("ses", "win", "/tmp/log.txt")
 
-        mock_pane.cmd.assert_called_once_with("pipe-pane", "-o", "cat >> /tmp/log.txt")
+        mock_pane.cmd.assert_called_once()
+        args = mock_pane.cmd.call_args[0]
+        assert args[:2] == ("pipe-pane", "-o")
+        assert "-m cli_agent_orchestrator.utils.log_sink /tmp/log.txt" in args[2]
 
     def test_pipe_pane_session_not_found(self, tmux):
         tmux.server.sessions.get.return_value = None
@@ -1,5 +1,6 @@
 """Tests for base provider."""
 
+import threading
 from typing import Optional
 
 import pytest
@@ -17,6 +18,12 @@ class ConcreteProvider(BaseProvider):
     def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
         return self._status
 
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        return ""
+
+    def _classify_status(self, output: str) -> TerminalStatus:
+        return self._status
+
     def get_idle_pattern_for_log(self) -> str:
         return r"\[test\]>"
 
@@ -30,6 +37,98 @@ class ConcreteProvider(BaseProvider):
         pass
 
 
+class SplitProvider(ConcreteProvider):
+    """Provider using the default get_status capture/classify split."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.screen = "idle> "
+        self.captures = 0
+        self.classifications = 0
+        self.capture_gate: Optional[threading.Event] = None
+
+    get_status = BaseProvider.get_status
+
+    def _capture_status_output(self, tail_lines: Optional[int]) -> str:
+        self.captures += 1
+        if self.capture_gate is not None:
+            self.capture_gate.wait(timeout=5)
+        return self.screen
+
+    def _classify_status(self, output: str) -> TerminalStatus:
+        self.classifications += 1
+        return TerminalStatus.IDLE if output.endswith("> ") else TerminalStatus.PROCESSING
+
+
+class TestStatusMemoization:
+    """Tests for get_status memoization and single-flight capture."""
+
+    def test_unchanged_output_skips_classification(self):
+        provider = SplitProvider("term-123", "session-1", "window-0")
+
+        assert provider.get_status() == TerminalStatus.IDLE
+        assert provider.get_status() == TerminalStatus.IDLE
+        assert provider.captures == 2
+        assert provider.classifications == 1
+
+    def test_changed_output_reclassifies(self):
+        provider = SplitProvider("term-123", "session-1", "window-0")
+
+        assert provider.get_status() == TerminalStatus.IDLE
+        provider.screen = "thinking..."
+        assert provider.get_status() == TerminalStatus.PROCESSING
+        assert provider.classifications == 2
+
+    def test_tail_lines_is_part_of_memo_key(self):
+        provider = SplitProvider("term-123", "session-1", "window-0")
+
+        provider.get_status()
+        provider.get_status(tail_lines=5)
+        assert provider.classifications == 2
+
+    def test_concurrent_callers_share_one_capture(self):
+        provider = SplitProvider("term-123", "session-1", "window-0")
+        provider.capture_gate = threading.Event()
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(provider.get_status())) for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        # Give followers time to join the leader's in-flight capture.
+        for _ in range(100):
+            if provider._status_flight is not None:
+                break
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.05)
+        provider.capture_gate.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert results == [TerminalStatus.IDLE] * 4
+        assert provider.captures < 4
+
+    def test_capture_error_propagates(self):
+        provider = SplitProvider("term-123", "session-1", "window-0")
+
+        def boom(tail_lines):
+            raise RuntimeError("tmux gone")
+
+        provider._capture_status_output = boom
+        with pytest.raises(RuntimeError, match="tmux gone"):
+            provider.get_status()
+        assert provider._status_flight is None
+
+    def test_classify_captured_status_shares_memo(self):
+        provider = SplitProvider("term-123", "session-1", "window-0")
+
+        assert provider.classify_captured_status("idle> ") == TerminalStatus.IDLE
+        assert provider.get_status() == TerminalStatus.IDLE
+        assert provider.captures == 1
+        assert provider.classifications == 1
+
+
 class TestBaseProvider:
     """Tests for BaseProvider abstract class."""
 
@@ -95,3 +194,16 @@ class TestBaseProvider:
         assert provider.extract_last_message_from_script("test") == "extracted message"
         assert provider.exit_cli() == "/exit"
         provider.cleanup()  # Should not raise
+
+    def test_status_capture_and_classification_are_abstract(self):
+        """A provider without the status split cannot be instantiated."""
+
+        class NoStatusProvider(BaseProvider):
+            initialize = ConcreteProvider.initialize
+            get_idle_pattern_for_log = ConcreteProvider.get_idle_pattern_for_log
+            extract_last_message_from_script = ConcreteProvider.extract_last_message_from_script
+            exit_cli = ConcreteProvider.exit_cli
+            cleanup = ConcreteProvider.cleanup
+
+        with pytest.raises(TypeError, match="_capture_status_output"):
+            NoStatusProvider("term-123", "session-1", "window-0")
@@ -4,7 +4,9 @@ Covers initialization, status detection, message extraction, command building,
 pattern matching, and cleanup — targeting >90% code coverage.
 """
 
+import json
 import re
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -1127,6 +1129,41 @@ class TestGeminiCliProviderMisc:
         assert "server-b" not in settings["mcpServers"]
         assert "unrelated" in settings["mcpServers"]
 
+    def test_concurrent_register_and_cleanup_keep_settings_consistent(self, tmp_path):
+        """Parallel terminals must not lose each other's settings.json edits."""
+        settings_file = tmp_path / ".gemini" / "settings.json"
+        providers = [GeminiCliProvider(f"term-{i}", "session-1", f"window-{i}") for i in range(16)]
+        barrier = threading.Barrier(len(providers))
+
+        def register(index, provider):
+            barrier.wait()
+            provider._register_mcp_servers({f"server-{index}": {"command": "npx", "args": []}})
+
+        def cleanup(provider):
+            barrier.wait()
+            provider.cleanup()
+
+        with patch("cli_agent_orchestrator.providers.gemini_cli.Path.home", return_value=tmp_path):
+            threads = [
+                threading.Thread(target=register, args=(i, p)) for i, p in enumerate(providers)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            registered = set(json.loads(settings_file.read_text())["mcpServers"])
+
+            others = providers[1:]
+            barrier = threading.Barrier(len(others))
+            threads = [threading.Thread(target=cleanup, args=(p,)) for p in others]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert registered == {f"server-{i}" for i in range(16)}
+        assert set(json.loads(settings_file.read_text())["mcpServers"]) == {"server-0"}
+
     def test_cleanup_handles_mcp_removal_error(self, tmp_path):
         """Test cleanup handles errors when settings.json is malformed."""
         # Write invalid JSON to settings.json
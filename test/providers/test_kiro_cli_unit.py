@@ -1588,6 +1588,21 @@ class TestKiroCliCheck3ShellBaseline:
         assert status == TerminalStatus.IDLE
         mock_tmux.get_pane_current_command.assert_called_once_with("test-session", "window-0")
 
+    @patch("cli_agent_orchestrator.providers.kiro_cli.tmux_client")
+    def test_check3_rechecks_pane_command_for_unchanged_capture(self, mock_tmux):
+        """An unchanged screen must not keep a memoized PROCESSING after kiro exits."""
+        mock_tmux.get_history.return_value = "Some processing output without idle prompt"
+        mock_tmux.get_pane_current_command.return_value = "kiro-cli"
+
+        provider = KiroCliProvider("test1234", "test-session", "window-0", "developer")
+        provider.shell_baseline = "bash"
+        provider._initialized = True
+
+        assert provider.get_status() == TerminalStatus.PROCESSING
+        mock_tmux.get_pane_current_command.return_value = "bash"
+        assert provider.get_status() == TerminalStatus.IDLE
+        assert mock_tmux.get_pane_current_command.call_count == 2
+
     @patch("cli_agent_orchestrator.providers.kiro_cli.tmux_client")
     def test_check3_pre_init_shell_match_returns_processing(self, mock_tmux):
         """Pre-init (`_initialized=False`) + current command matches shell_baseline → PROCESSING.
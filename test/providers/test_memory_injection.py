@@ -5,13 +5,19 @@ message sent to each terminal, and that no provider-specific files are mutated.
 """
 
 import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
+from cli_agent_orchestrator.constants import MEMORY_INJECTION_WORKERS, MEMORY_PREFETCH_WORKERS
 from cli_agent_orchestrator.services.memory_service import MemoryService
 from cli_agent_orchestrator.services.terminal_service import (
     _memory_injected_terminals,
+    _memory_prefetch_executor,
     inject_memory_context,
+    prefetch_memory_context,
 )
 
 # ---------------------------------------------------------------------------
@@ -107,6 +113,97 @@ class TestInjectMemoryContextFunction:
         assert "<cao-memory>" in r1
         assert "<cao-memory>" in r2
 
+    @patch("cli_agent_orchestrator.services.terminal_service.MEMORY_CURATED_WAIT_SECONDS", 0.1)
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_slow_curator_falls_back_to_deterministic_context(self, mock_svc_cls):
+        """A curated block that misses the latency budget must not delay the message."""
+        release = threading.Event()
+
+        def slow_curated(*args, **kwargs):
+            release.wait(5)
+            return "<cao-memory>\ncurated\n</cao-memory>"
+
+        mock_svc = mock_svc_cls.return_value
+        mock_svc.get_curated_memory_context.side_effect = slow_curated
+        mock_svc.get_memory_context_for_terminal.return_value = SAMPLE_MEMORY_CONTEXT
+
+        start = time.monotonic()
+        try:
+            result = inject_memory_context(ORIGINAL_MESSAGE, "term-slow")
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 2
+        assert result == SAMPLE_MEMORY_CONTEXT + "\n\n" + ORIGINAL_MESSAGE
+        mock_svc.get_curated_memory_context.assert_called_once_with(
+            "term-slow", task_description=ORIGINAL_MESSAGE[:200]
+        )
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MEMORY_CURATED_WAIT_SECONDS", 0.1)
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_timed_out_curated_request_is_cancelled(self, mock_svc_cls):
+        """A curated request still queued when the budget expires never runs."""
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(release.wait, 5)
+        mock_svc_cls.return_value.get_memory_context_for_terminal.return_value = (
+            SAMPLE_MEMORY_CONTEXT
+        )
+
+        try:
+            with patch(
+                "cli_agent_orchestrator.services.terminal_service._memory_executor", executor
+            ):
+                result = inject_memory_context(ORIGINAL_MESSAGE, "term-queued")
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+        assert result == SAMPLE_MEMORY_CONTEXT + "\n\n" + ORIGINAL_MESSAGE
+        mock_svc_cls.return_value.get_curated_memory_context.assert_not_called()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_prefetches_do_not_delay_curated_requests(self, mock_svc_cls):
+        """A burst of slow prefetches leaves the curated workers free."""
+        release = threading.Event()
+        mock_svc = mock_svc_cls.return_value
+        mock_svc.get_memory_context_for_terminal.side_effect = lambda terminal_id: (
+            release.wait(5) and ""
+        )
+        mock_svc.get_curated_memory_context.return_value = SAMPLE_MEMORY_CONTEXT
+
+        try:
+            for i in range(MEMORY_INJECTION_WORKERS + MEMORY_PREFETCH_WORKERS):
+                prefetch_memory_context(f"term-burst-{i}")
+            result = inject_memory_context(ORIGINAL_MESSAGE, "term-burst-first")
+        finally:
+            release.set()
+            # Drain the prefetch pool before the MemoryService patch is undone.
+            barrier = threading.Barrier(MEMORY_PREFETCH_WORKERS)
+            drained = [
+                _memory_prefetch_executor.submit(barrier.wait, 5)
+                for _ in range(MEMORY_PREFETCH_WORKERS)
+            ]
+            for future in drained:
+                future.result()
+
+        assert result == SAMPLE_MEMORY_CONTEXT + "\n\n" + ORIGINAL_MESSAGE
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_prefetch_builds_deterministic_context(self, mock_svc_cls):
+        """Terminal creation warms the deterministic block in the background."""
+        done = threading.Event()
+        mock_svc_cls.return_value.get_memory_context_for_terminal.side_effect = (
+            lambda terminal_id: done.set() or ""
+        )
+
+        prefetch_memory_context("term-prefetch")
+
+        assert done.wait(5)
+        mock_svc_cls.return_value.get_memory_context_for_terminal.assert_called_once_with(
+            "term-prefetch"
+        )
+
     def test_cleanup_removes_terminal_from_tracking(self):
         """After cleanup, terminal should be eligible for injection again."""
         _memory_injected_terminals.add("term-cleanup")
@@ -0,0 +1,109 @@
+"""Tests for background archival of deleted terminals."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.services import archive_service
+from cli_agent_orchestrator.services.archive_service import (
+    ArchiveJob,
+    archive_terminal,
+    iter_archived_scrollback,
+    iter_plain_text,
+)
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    with patch.object(archive_service, "TERMINAL_LOG_DIR", tmp_path):
+        yield tmp_path
+
+
+def _read_archive(log_dir, terminal_id="abcd1234"):
+    with gzip.open(log_dir / f"{terminal_id}.scrollback.gz", "rt") as f:
+        return f.read()
+
+
+class TestIterPlainText:
+    def test_escape_split_across_chunks(self):
+        chunks = [b"a\x1b[3", b"1mred\x1b", b"[0m\r\nb"]
+
+        assert "".join(iter_plain_text(iter(chunks))) == "ared\nb"
+
+    def test_utf8_split_across_chunks(self):
+        data = "héllo\n".encode()
+
+        assert "".join(iter_plain_text(iter([data[:2], data[2:]]))) == "héllo\n"
+
+
+class TestArchiveTerminal:
+    def test_rebuilds_rotated_log_oldest_first(self, log_dir):
+        with gzip.open(log_dir / "abcd1234.log.2.gz", "wb") as f:
+            f.write(b"one\n")
+        with gzip.open(log_dir / "abcd1234.log.1.gz", "wb") as f:
+            f.write(b"two\n")
+        (log_dir / "abcd1234.log").write_bytes(b"three\n")
+
+        archive_terminal(ArchiveJob("abcd1234", {"terminal_id": "abcd1234"}))
+
+        assert _read_archive(log_dir) == "one\ntwo\nthree\n"
+        assert json.loads((log_dir / "abcd1234.snapshot.json").read_text()) == {
+            "terminal_id": "abcd1234"
+        }
+
+    def test_uses_handed_over_ring_buffer(self, log_dir):
+        (log_dir / "abcd1234.log").write_bytes(b"ignored")
+
+        archive_terminal(ArchiveJob("abcd1234", {}, output=b"\x1b[32mfrom memory\x1b[0m"))
+
+        assert _read_archive(log_dir) == "from memory"
+
+    def test_prefers_captured_scrollback(self, log_dir):
+        (log_dir / "abcd1234.log").write_bytes(b"\x1b[2Jrepaint\x1b[2Jrepaint")
+
+        capture = log_dir / "abcd1234.scrollback.capture"
+        capture.write_bytes(b"rendered screen\n")
+
+        archive_terminal(ArchiveJob("abcd1234", {}, output=b"ignored", scrollback_path=capture))
+
+        assert _read_archive(log_dir) == "rendered screen\n"
+        assert not capture.exists()
+
+    def test_no_output_still_archives_snapshot(self, log_dir):
+        archive_terminal(ArchiveJob("abcd1234", {"x": 1}))
+
+        assert _read_archive(log_dir) == ""
+        assert (log_dir / "abcd1234.snapshot.json").exists()
+
+
+class TestQueue:
+    def test_enqueue_then_flush(self, log_dir):
+        archive_service.enqueue(ArchiveJob("abcd1234", {}, output=b"queued"))
+
+        assert archive_service.flush(timeout=5)
+        assert _read_archive(log_dir) == "queued"
+
+    def test_failed_job_does_not_stop_worker(self, log_dir):
+        with patch.object(archive_service, "archive_terminal", side_effect=[OSError("disk"), None]):
+            archive_service.enqueue(ArchiveJob("aaaa1111", {}))
+            archive_service.enqueue(ArchiveJob("bbbb2222", {}))
+
+            assert archive_service.flush(timeout=5)
+
+
+class TestIterArchivedScrollback:
+    def test_reads_compressed_archive(self, log_dir):
+        with gzip.open(log_dir / "abcd1234.scrollback.gz", "wb") as f:
+            f.write(b"archived")
+
+        assert b"".join(iter_archived_scrollback("abcd1234")) == b"archived"
+
+    def test_reads_legacy_plain_scrollback(self, log_dir):
+        (log_dir / "abcd1234.scrollback").write_bytes(b"legacy")
+
+        assert b"".join(iter_archived_scrollback("abcd1234")) == b"legacy"
+
+    def test_missing(self, log_dir):
+        assert iter_archived_scrollback("abcd1234") is None
@@ -76,10 +76,16 @@ def make_wiki_file(
 def svc(tmp_path):
     """MemoryService with tmp_path as base_dir and test DB engine."""
     from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
 
     from cli_agent_orchestrator.clients.database import Base
 
-    eng = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    # One shared connection: metadata is written from the index writer thread.
+    eng = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     Base.metadata.create_all(eng)
     service = MemoryService(base_dir=tmp_path, db_engine=eng)
     return service
@@ -202,18 +208,20 @@ class TestSearchMode:
         )
         (tmp_path / "global" / "wiki").mkdir(parents=True, exist_ok=True)
 
-        # metadata mode: query "pytest" won't match key "hidden-gem" or empty tags
-        results = run_async(
-            svc.recall(
-                query="pytest",
-                search_mode="metadata",
-                terminal_context=None,
-                scan_all=True,
+        # The first search indexes the hand-written file and backfills its
+        # metadata row, so the body match comes from SQLite, not BM25.
+        with patch.object(svc, "_bm25_search") as bm25:
+            results = run_async(
+                svc.recall(
+                    query="pytest",
+                    search_mode="metadata",
+                    terminal_context=None,
+                    scan_all=True,
+                )
             )
-        )
 
-        # SQLite has no rows, so metadata returns nothing
-        assert len(results) == 0
+        bm25.assert_not_called()
+        assert [m.key for m in results] == ["hidden-gem"]
 
     def test_hybrid_mode_merges_results(self, svc, tmp_path):
         """Hybrid should return SQLite matches + BM25 fill."""
@@ -237,6 +245,8 @@ class TestSearchMode:
             tags="",
             scope_id="global",
         )
+        # Files written outside store() reach the search index via a rebuild
+        svc.rebuild_search_index()
 
         results = run_async(
             svc.recall(
@@ -253,6 +263,111 @@ class TestSearchMode:
         assert "legacy-tip" in keys
 
 
+# ---------------------------------------------------------------------------
+# Persistent FTS5 search index
+# ---------------------------------------------------------------------------
+
+
+class TestSearchIndex:
+    def _store(self, svc, key, content, **kwargs):
+        kwargs.setdefault("scope", "global")
+        return run_async(svc.store(content=content, key=key, **kwargs))
+
+    def _search(self, svc, query, **kwargs):
+        kwargs.setdefault("scan_all", True)
+        return run_async(svc.recall(query=query, search_mode="bm25", **kwargs))
+
+    def test_store_and_forget_update_index(self, svc):
+        self._store(svc, "deploy-notes", "Deploy with the blue green pipeline")
+        assert [m.key for m in self._search(svc, "pipeline")] == ["deploy-notes"]
+
+        self._store(svc, "deploy-notes", "Deploys now go through canary releases")
+        results = self._search(svc, "canary")
+        assert [m.key for m in results] == ["deploy-notes"]
+        assert results[0].content == "Deploys now go through canary releases"
+
+        run_async(svc.forget("deploy-notes", scope="global"))
+        assert self._search(svc, "canary") == []
+
+    def test_ranks_by_relevance(self, svc):
+        self._store(svc, "one-mention", "redis is used somewhere in the stack")
+        self._store(svc, "all-about-redis", "redis redis cache: redis cluster with redis sentinel")
+
+        assert [m.key for m in self._search(svc, "redis")][0] == "all-about-redis"
+
+    def test_only_matching_files_are_read(self, svc):
+        for i in range(30):
+            self._store(svc, f"filler-{i}", f"unrelated note number {i}")
+        self._store(svc, "needle", "the haystack hides a needle")
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read:
+            results = self._search(svc, "needle")
+
+        assert [m.key for m in results] == ["needle"]
+        assert read.call_count == 1
+
+    def test_project_scope_with_terminal_context(self, svc, tmp_path):
+        ctx = {"cwd": str(tmp_path)}
+        self._store(svc, "layout", "services live under src", scope="project", terminal_context=ctx)
+
+        results = self._search(
+            svc, "services", scope="project", terminal_context=ctx, scan_all=False
+        )
+
+        assert [m.key for m in results] == ["layout"]
+
+    def test_rebuild_reconciles_with_disk(self, svc, tmp_path):
+        stored = self._store(svc, "removed-by-hand", "obsolete kafka setup")
+        Path(stored.file_path).unlink()
+        make_wiki_file(tmp_path, key="added-by-hand", content="kafka topics are compacted")
+
+        assert svc.rebuild_search_index() == 1
+        assert [m.key for m in self._search(svc, "kafka")] == ["added-by-hand"]
+
+    def test_rebuild_backfills_missing_metadata(self, svc, tmp_path):
+        from cli_agent_orchestrator.clients.database import MemoryMetadataModel
+
+        self._store(
+            svc,
+            "stored",
+            "kafka brokers run on three hosts",
+            terminal_context={"provider": "kiro_cli"},
+        )
+        make_wiki_file(tmp_path, key="added-by-hand", content="kafka topics are compacted")
+
+        svc.rebuild_search_index()
+        svc.rebuild_search_index()
+
+        with svc._get_db_session() as db:
+            rows = {row.key: row for row in db.query(MemoryMetadataModel)}
+        assert sorted(rows) == ["added-by-hand", "stored"]
+        assert rows["stored"].source_provider == "kiro_cli"
+        assert rows["added-by-hand"].scope_id == "test-project"
+        results = run_async(svc.recall(query="kafka", search_mode="metadata", scan_all=True))
+        assert sorted(m.key for m in results) == ["added-by-hand", "stored"]
+
+    def test_metadata_recall_prefix_matches_body_words(self, svc):
+        self._store(svc, "parallel-tests", "Run the suite with pytest-xdist")
+
+        def keys(query):
+            return [
+                m.key
+                for m in run_async(svc.recall(query=query, search_mode="metadata", scan_all=True))
+            ]
+
+        assert keys("pyt") == ["parallel-tests"]
+        assert keys("xdist suite") == ["parallel-tests"]
+        assert keys("dist") == []
+
+    def test_falls_back_to_file_scan_without_fts5(self, svc, tmp_path):
+        make_wiki_file(tmp_path, key="scan-me", content="pytest content")
+
+        with patch.object(MemoryService, "_ensure_search_index", return_value=False):
+            results = self._search(svc, "pytest")
+
+        assert [m.key for m in results] == ["scan-me"]
+
+
 # ---------------------------------------------------------------------------
 # Graceful fallback when rank-bm25 not installed
 # ---------------------------------------------------------------------------
@@ -260,12 +375,12 @@ class TestSearchMode:
 
 class TestBm25GracefulFallback:
     def test_returns_empty_when_not_installed(self, svc, tmp_path):
-        """If rank-bm25 is not importable, _bm25_search returns []."""
+        """If rank-bm25 is not importable, the file-scan fallback returns []."""
         make_wiki_file(tmp_path, key="test", content="pytest content")
         (tmp_path / "global" / "wiki").mkdir(parents=True, exist_ok=True)
 
         with patch.dict("sys.modules", {"rank_bm25": None}):
-            results = svc._bm25_search(
+            results = svc._bm25_scan(
                 query="pytest",
                 scope=None,
                 scope_id=None,
@@ -57,9 +57,9 @@ class TestCleanupOldData:
         # Execute
         cleanup_old_data()
 
-        # Verify inbox cleanup was called (query called twice - once for terminals, once for inbox)
-        assert mock_db.query.call_count == 2
-        assert mock_db.commit.call_count == 2
+        # Verify inbox cleanup was called (one query each for terminals, inbox, transcript turns)
+        assert mock_db.query.call_count == 3
+        assert mock_db.commit.call_count == 3
 
     @patch("cli_agent_orchestrator.services.cleanup_service.SessionLocal")
     @patch("cli_agent_orchestrator.services.cleanup_service.RETENTION_DAYS", 7)
@@ -209,4 +209,4 @@ class TestCleanupOldData:
                 cleanup_old_data()
 
         # Verify filter was called (exact date comparison is tricky, just verify it was called)
-        assert len(filter_calls) == 2  # Once for terminals, once for inbox
+        assert len(filter_calls) == 3  # Terminals, inbox, transcript turns
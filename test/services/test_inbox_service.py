@@ -412,6 +412,32 @@ class TestLogFileHandler:
 
         mock_check_send.assert_called_once_with("test-terminal", registry=None)
 
+    @patch("cli_agent_orchestrator.services.inbox_service.output_stream_service")
+    @patch("cli_agent_orchestrator.services.inbox_service.get_pending_messages")
+    def test_on_modified_skips_streamed_terminal(self, mock_get_messages, mock_streams):
+        """Spilled logs of in-memory streams are left to the stream daemon."""
+        from watchdog.events import FileModifiedEvent
+
+        mock_streams.get_stream.return_value = MagicMock()
+
+        LogFileHandler().on_modified(FileModifiedEvent("/path/to/test-terminal.log"))
+
+        mock_get_messages.assert_not_called()
+
+    @patch("cli_agent_orchestrator.services.inbox_service.check_and_send_pending_messages")
+    @patch("cli_agent_orchestrator.services.inbox_service._has_idle_pattern")
+    @patch("cli_agent_orchestrator.services.inbox_service.get_pending_messages")
+    def test_handle_output_change_triggers_delivery(
+        self, mock_get_messages, mock_has_idle, mock_check_send
+    ):
+        """Test the public entry point used by the output stream daemon."""
+        mock_get_messages.return_value = [MagicMock()]
+        mock_has_idle.return_value = True
+
+        LogFileHandler().handle_output_change("test-terminal")
+
+        mock_check_send.assert_called_once_with("test-terminal", registry=None)
+
     @patch("cli_agent_orchestrator.services.inbox_service.get_pending_messages")
     def test_handle_log_change_no_pending_messages(self, mock_get_messages):
         """Test _handle_log_change with no pending messages (covers lines 105-107)."""
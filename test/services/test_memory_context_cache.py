@@ -0,0 +1,99 @@
+"""Context-block cache for `MemoryService.get_memory_context_for_terminal`.
+
+Terminals that resolve to the same session/project/global scope ids share one
+rendered block; store() and forget() — or an index.md rewritten by another
+process — invalidate it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from cli_agent_orchestrator.services.memory_service import MemoryService
+
+
+def _ctx(terminal_id: str) -> dict:
+    return {
+        "terminal_id": terminal_id,
+        "session_name": "sess-cache",
+        "agent_profile": "dev",
+        "provider": "claude_code",
+        "cwd": "/home/user/proj-cache",
+    }
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _make_svc(tmp_path: Path) -> MemoryService:
+    svc = MemoryService(base_dir=tmp_path)
+    svc._get_terminal_context = _ctx  # type: ignore[method-assign]
+    return svc
+
+
+def _store(svc: MemoryService, key: str, content: str, scope: str = "project") -> None:
+    _run(svc.store(content=content, scope=scope, key=key, terminal_context=_ctx("writer")))
+
+
+def test_fan_out_renders_block_once(tmp_path: Path) -> None:
+    svc = _make_svc(tmp_path)
+    _store(svc, "layout", "services live under src")
+    _store(svc, "style", "use black", scope="global")
+
+    with patch.object(svc, "_render_memory_context", wraps=svc._render_memory_context) as render:
+        blocks = {svc.get_memory_context_for_terminal(f"worker-{i}") for i in range(20)}
+
+    assert render.call_count == 1
+    assert len(blocks) == 1
+    assert "services live under src" in blocks.pop()
+
+
+def test_store_and_forget_invalidate(tmp_path: Path) -> None:
+    svc = _make_svc(tmp_path)
+    _store(svc, "layout", "services live under src")
+    assert "services live under src" in svc.get_memory_context_for_terminal("w1")
+
+    _store(svc, "testing", "run pytest with -n 8")
+    assert "run pytest with -n 8" in svc.get_memory_context_for_terminal("w2")
+
+    _run(svc.forget("testing", scope="project", terminal_context=_ctx("writer")))
+    assert "run pytest with -n 8" not in svc.get_memory_context_for_terminal("w3")
+
+
+def test_index_rewritten_by_another_process_invalidates(tmp_path: Path) -> None:
+    svc = _make_svc(tmp_path)
+    _store(svc, "layout", "services live under src")
+    assert "layout" in svc.get_memory_context_for_terminal("w1")
+
+    # Simulate a forget from another process: the generation counter here
+    # is untouched, only the files change.
+    index_path = svc.get_index_path("project", svc.resolve_scope_id("project", _ctx("w1")))
+    lines = index_path.read_text(encoding="utf-8").splitlines()
+    index_path.write_text(
+        "\n".join(ln for ln in lines if "[layout]" not in ln) + "\n", encoding="utf-8"
+    )
+    st = index_path.stat()
+    os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert svc.get_memory_context_for_terminal("w2") == ""
+
+
+def test_different_sessions_do_not_share_blocks(tmp_path: Path) -> None:
+    svc = _make_svc(tmp_path)
+    _run(
+        svc.store(
+            content="session only note",
+            scope="session",
+            key="note",
+            terminal_context=_ctx("writer"),
+        )
+    )
+    assert "session only note" in svc.get_memory_context_for_terminal("w1")
+
+    other = dict(_ctx("w2"), session_name="sess-other")
+    svc._get_terminal_context = lambda terminal_id: other  # type: ignore[method-assign]
+    assert "session only note" not in svc.get_memory_context_for_terminal("w2")
@@ -6,6 +6,7 @@ Integration tests are marked with @pytest.mark.integration.
 
 import asyncio
 import re
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -71,6 +72,18 @@ def _backdate_memory(
             new_lines.append(line)
         index_path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
 
+    # Expiry reads updated_at from memory_metadata when that table exists
+    from cli_agent_orchestrator.clients.database import MemoryMetadataModel
+
+    try:
+        with svc._get_db_session() as db:
+            db.query(MemoryMetadataModel).filter(
+                MemoryMetadataModel.file_path == str(wiki_file)
+            ).update({"updated_at": datetime.strptime(old_ts, "%Y-%m-%dT%H:%M:%SZ")})
+            db.commit()
+    except Exception:
+        pass
+
 
 # ===========================================================================
 # U8.1 — Unit Tests
@@ -670,6 +683,44 @@ class TestConcurrentStores:
             assert f"[concurrent-{i}]" in index_content
 
 
+class TestAsyncApiOffloadsIO:
+    """store/recall/forget run their blocking bodies on the memory I/O executor."""
+
+    def test_async_methods_run_off_the_event_loop(self, tmp_path: Path, monkeypatch):
+        svc = MemoryService(base_dir=tmp_path)
+        ctx = _make_terminal_context()
+        threads: list[str] = []
+
+        for name in ("store_sync", "recall_sync", "forget_sync"):
+            original = getattr(svc, name)
+
+            def record(*args, _original=original, **kwargs):
+                threads.append(threading.current_thread().name)
+                return _original(*args, **kwargs)
+
+            monkeypatch.setattr(svc, name, record)
+
+        async def roundtrip():
+            await svc.store(content="off loop", scope="global", key="k", terminal_context=ctx)
+            await svc.recall(query="off loop", terminal_context=ctx)
+            await svc.forget("k", scope="global", terminal_context=ctx)
+
+        _run(roundtrip())
+
+        assert len(threads) == 3
+        assert all(name.startswith("cao-memory-io") for name in threads)
+
+    def test_sync_api_needs_no_event_loop(self, tmp_path: Path):
+        svc = MemoryService(base_dir=tmp_path)
+        ctx = _make_terminal_context()
+
+        mem = svc.store_sync(content="plain call", scope="global", key="k", terminal_context=ctx)
+        assert Path(mem.file_path).exists()
+        assert [m.key for m in svc.recall_sync(query="plain", terminal_context=ctx)] == ["k"]
+        assert svc.forget_sync("k", scope="global", terminal_context=ctx) is True
+        assert not Path(mem.file_path).exists()
+
+
 @pytest.mark.integration
 class TestIndexConsistency:
     """U8.2: store/forget cycle → index matches filesystem (SC-14)."""
@@ -947,6 +998,40 @@ class TestCleanupSessionIntegration:
         assert Path(user_mem.file_path).exists()
         assert Path(feedback_mem.file_path).exists()
 
+    def test_cleanup_expires_many_entries_in_one_project(self, tmp_path: Path, monkeypatch):
+        """Every expired entry is removed from disk and from index.md."""
+        svc = MemoryService(base_dir=tmp_path)
+        ctx = _make_terminal_context()
+
+        mems = [
+            svc.store_sync(
+                content=f"stale finding {i}",
+                scope="project",
+                memory_type="project",
+                key=f"stale-{i}",
+                terminal_context=ctx,
+            )
+            for i in range(8)
+        ]
+        old_ts = (datetime.now(timezone.utc) - timedelta(days=120)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for mem in mems:
+            _backdate_memory(Path(mem.file_path), svc, "project", mem.scope_id, old_ts)
+
+        import cli_agent_orchestrator.services.cleanup_service as cs
+        import cli_agent_orchestrator.services.memory_service as ms
+
+        monkeypatch.setattr(cs, "MEMORY_BASE_DIR", tmp_path)
+        monkeypatch.setattr(ms, "MEMORY_BASE_DIR", tmp_path)
+
+        result = _run(cs.cleanup_expired_memories())
+
+        assert result.expired == 8
+        assert result.duration_seconds >= 0
+        index_content = svc.get_index_path("project", mems[0].scope_id).read_text(encoding="utf-8")
+        for mem in mems:
+            assert not Path(mem.file_path).exists()
+            assert f"[{mem.key}]" not in index_content
+
 
 # ---------------------------------------------------------------------------
 # P3-B — production path: _get_terminal_context() must resolve cwd
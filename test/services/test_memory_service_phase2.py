@@ -4,11 +4,14 @@ Tests create a per-test SQLite DB via db_engine fixture.
 """
 
 import asyncio
-from datetime import datetime, timezone
+import re
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 from cli_agent_orchestrator.clients.database import Base, MemoryMetadataModel
 from cli_agent_orchestrator.services.memory_service import MemoryService
@@ -189,6 +192,42 @@ class TestRecallUsesSqliteQuery:
         results = _run(svc.recall(memory_type="feedback", scope="global", terminal_context=ctx))
         assert all(r.memory_type == "feedback" for r in results)
 
+    def test_recall_reads_only_returned_files(self, svc):
+        ctx = _make_ctx()
+        for i in range(20):
+            _run(svc.store(content=f"note {i}", scope="global", key=f"note-{i}"))
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read:
+            results = _run(svc.recall(scope="global", limit=3, terminal_context=ctx))
+
+        assert [r.key for r in results] == ["note-19", "note-18", "note-17"]
+        assert read.call_count == 3
+
+    def test_recall_matches_body_and_orders_by_scope(self, svc):
+        ctx = _make_ctx()
+        for scope in ("global", "project", "session"):
+            _run(
+                svc.store(
+                    content=f"{scope} uses the Release_Train",
+                    scope=scope,
+                    key=f"train-{scope}",
+                    terminal_context=ctx,
+                )
+            )
+        _run(svc.store(content="unrelated", scope="session", key="other", terminal_context=ctx))
+
+        results = _run(svc.recall(query="release_train", terminal_context=ctx))
+        assert [r.key for r in results] == ["train-session", "train-project", "train-global"]
+
+    def test_recall_falls_back_to_index_walk(self, svc):
+        ctx = _make_ctx()
+        _run(svc.store(content="always use black", scope="global", key="use-black"))
+
+        with patch.object(svc, "_metadata_query", side_effect=RuntimeError("db gone")):
+            results = _run(svc.recall(query="black", scope="global", terminal_context=ctx))
+
+        assert [r.key for r in results] == ["use-black"]
+
 
 # ===========================================================================
 # U1.5 — forget() deletes SQLite row
@@ -559,6 +598,237 @@ class TestFullSqliteRoundtrip:
         assert len(results) == 10
 
 
+class TestIndexWriterBatching:
+    def test_burst_is_one_index_rewrite_and_one_transaction(self, svc, db_engine):
+        from cli_agent_orchestrator.services.memory_service import (
+            _flush_index_updates,
+            _IndexUpdate,
+        )
+
+        index_path = svc.get_index_path("global", None)
+        batch = []
+        for i in range(3):
+            key = f"burst-{i}"
+            metadata = {
+                "key": key,
+                "memory_type": "project",
+                "scope": "global",
+                "scope_id": None,
+                "file_path": str(svc.get_wiki_path("global", None, key)),
+                "tags": "",
+                "source_provider": None,
+                "source_terminal_id": None,
+                "token_estimate": 1,
+            }
+            entry = ("global", None, key, "project", "", "x", "2026-01-01T00:00:00Z", "created")
+            batch.append(_IndexUpdate(svc, index_path, entry, ("upsert", metadata)))
+        # A second update to the same key in the burst must not duplicate the row.
+        batch.append(_IndexUpdate(svc, index_path, batch[0].entry, batch[0].metadata))
+
+        with (
+            patch.object(svc, "_update_index", wraps=svc._update_index) as update_index,
+            patch.object(svc, "_upsert_metadata", wraps=svc._upsert_metadata) as single_upsert,
+        ):
+            _flush_index_updates(batch)
+
+        assert update_index.call_count == 1
+        assert single_upsert.call_count == 0
+        assert all(u.done.done() and u.done.exception() is None for u in batch)
+        index = index_path.read_text(encoding="utf-8")
+        assert all(f"[burst-{i}]" in index for i in range(3))
+        from sqlalchemy.orm import sessionmaker
+
+        with sessionmaker(bind=db_engine)() as db:
+            keys = sorted(r.key for r in db.query(MemoryMetadataModel).all())
+        assert keys == ["burst-0", "burst-1", "burst-2"]
+
+    def test_concurrent_stores_coalesce_index_rewrites(self, svc):
+        async def burst():
+            await asyncio.gather(
+                *(
+                    svc.store(content=f"item {i}", scope="global", key=f"conc-{i}")
+                    for i in range(20)
+                )
+            )
+
+        with patch.object(svc, "_update_index", wraps=svc._update_index) as update_index:
+            _run(burst())
+
+        assert update_index.call_count < 20
+        index = svc.get_index_path("global", None).read_text(encoding="utf-8")
+        assert all(f"[conc-{i}]" in index for i in range(20))
+        results = _run(svc.recall(scope="global", limit=50))
+        assert len(results) == 20
+
+    def test_lone_update_flushes_at_once_and_backlog_is_grouped(self, svc):
+        import threading
+
+        from cli_agent_orchestrator.services import memory_service
+
+        flush = memory_service._flush_index_updates
+        release = threading.Event()
+        batches: list[int] = []
+
+        def gated_flush(batch):
+            batches.append(len(batch))
+            if len(batches) == 1:
+                release.wait(5)
+            flush(batch)
+
+        def store(key):
+            svc.store_sync(content=f"{key} note", scope="global", key=key)
+
+        with patch.object(memory_service, "_flush_index_updates", side_effect=gated_flush):
+            first = threading.Thread(target=store, args=("first",))
+            first.start()
+            while not batches:
+                time.sleep(0.001)
+            # Queued while the first flush is still writing
+            behind = [threading.Thread(target=store, args=(f"behind-{i}",)) for i in range(3)]
+            for thread in behind:
+                thread.start()
+            while memory_service._index_queue.qsize() < 3:
+                time.sleep(0.001)
+            release.set()
+            for thread in [first, *behind]:
+                thread.join(5)
+            # Right after a flush, a lone update still does not wait
+            with patch.object(memory_service.time, "sleep") as sleep:
+                store("lone")
+
+        assert batches == [1, 3, 1]
+        sleep.assert_not_called()
+        index = svc.get_index_path("global", None).read_text(encoding="utf-8")
+        assert all(f"[{key}]" in index for key in ("first", "behind-0", "behind-2", "lone"))
+
+    def test_index_failure_is_raised_to_the_caller(self, svc):
+        with patch.object(svc, "_update_index", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                _run(svc.store(content="lost", scope="global", key="broken"))
+
+
+# ===========================================================================
+# Expiry driven by memory_metadata
+# ===========================================================================
+
+RETENTION = {"global": None, "agent": None, "project": 90, "session": 14}
+PERMANENT = frozenset({"user", "feedback"})
+
+
+def _age_row(db_engine, key: str, days: int) -> None:
+    from sqlalchemy.orm import sessionmaker
+
+    with sessionmaker(bind=db_engine)() as db:
+        row = db.query(MemoryMetadataModel).filter_by(key=key).one()
+        row.updated_at = datetime.now(timezone.utc) - timedelta(days=days)
+        db.commit()
+
+
+class TestExpiryUsesSqlQuery:
+    def test_expires_old_rows_with_one_rewrite_per_index(self, svc, db_engine):
+        ctx = _make_ctx()
+        stale = [f"stale-{i}" for i in range(5)]
+        memories = [(key, "project", "project") for key in stale] + [
+            ("recent", "project", "project"),
+            ("pref", "project", "user"),
+            ("sess", "session", "project"),
+            ("glob", "global", "project"),
+        ]
+        for key, scope, memory_type in memories:
+            svc.store_sync(
+                content=f"{key} note",
+                scope=scope,
+                memory_type=memory_type,
+                key=key,
+                terminal_context=ctx,
+            )
+        for key in stale + ["pref", "glob"]:
+            _age_row(db_engine, key, 120)
+        _age_row(db_engine, "sess", 20)
+
+        with (
+            patch.object(svc, "_update_index", wraps=svc._update_index) as update_index,
+            patch.object(svc, "_expired_scan") as scan,
+        ):
+            expired = svc.expire_sync(RETENTION, PERMANENT)
+
+        scan.assert_not_called()
+        assert sorted(e["key"] for e in expired) == sorted(stale + ["sess"])
+        # One rewrite for the project index, one for the global container holding sessions.
+        assert update_index.call_count == 2
+        project_index = svc.get_index_path("project", svc.resolve_scope_id("project", ctx))
+        index = project_index.read_text(encoding="utf-8")
+        assert "[recent]" in index and "[pref]" in index
+        assert not any(f"[{key}]" in index for key in stale)
+        assert all(not Path(e["file_path"]).exists() for e in expired)
+        from sqlalchemy.orm import sessionmaker
+
+        with sessionmaker(bind=db_engine)() as db:
+            keys = sorted(r.key for r in db.query(MemoryMetadataModel).all())
+        assert keys == ["glob", "pref", "recent"]
+
+    def _orphan_old_memory(self, svc, db_engine):
+        """An expired wiki file whose metadata row was never written."""
+        from sqlalchemy.orm import sessionmaker
+
+        from cli_agent_orchestrator.services import memory_service
+
+        svc.store_sync(content="old", scope="project", key="orphan", terminal_context=_make_ctx())
+        wiki_path = svc.get_wiki_path(
+            "project", svc.resolve_scope_id("project", _make_ctx()), "orphan"
+        )
+        old_ts = (datetime.now(timezone.utc) - timedelta(days=100)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        wiki_path.write_text(
+            re.sub(r"\d{4}-\d\d-\d\dT[\d:]+Z", old_ts, wiki_path.read_text(encoding="utf-8")),
+            encoding="utf-8",
+        )
+        with sessionmaker(bind=db_engine)() as db:
+            db.query(MemoryMetadataModel).delete()
+            db.execute(text("DELETE FROM memory_search_state"))
+            db.commit()
+        # As seen by a fresh process
+        memory_service._search_index_ready.pop(db_engine, None)
+        memory_service._metadata_backfilled.pop(db_engine, None)
+        return wiki_path
+
+    def test_expires_wiki_file_without_metadata_row(self, svc, db_engine):
+        wiki_path = self._orphan_old_memory(svc, db_engine)
+
+        expired = svc.expire_sync(RETENTION, PERMANENT)
+
+        assert [e["key"] for e in expired] == ["orphan"]
+        assert not wiki_path.exists()
+
+    def test_expires_wiki_file_without_metadata_row_without_fts5(self, svc, db_engine):
+        from cli_agent_orchestrator.services import memory_service
+
+        wiki_path = self._orphan_old_memory(svc, db_engine)
+        memory_service._search_index_ready[db_engine] = None
+
+        try:
+            expired = svc.expire_sync(RETENTION, PERMANENT)
+        finally:
+            memory_service._search_index_ready.pop(db_engine, None)
+
+        assert [e["key"] for e in expired] == ["orphan"]
+        assert not wiki_path.exists()
+
+    def test_falls_back_to_index_walk(self, svc):
+        svc.store_sync(content="old", scope="project", key="old", terminal_context=_make_ctx())
+        old_ts = (datetime.now(timezone.utc) - timedelta(days=100)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        index_path = svc.get_index_path("project", svc.resolve_scope_id("project", _make_ctx()))
+        index_path.write_text(
+            re.sub(r"updated:\S+", f"updated:{old_ts}", index_path.read_text(encoding="utf-8")),
+            encoding="utf-8",
+        )
+
+        with patch.object(svc, "_expired_query", side_effect=RuntimeError("no such table")):
+            expired = svc.expire_sync(RETENTION, PERMANENT)
+
+        assert [e["key"] for e in expired] == ["old"]
+        assert "[old]" not in index_path.read_text(encoding="utf-8")
+
+
 # ===========================================================================
 # Migration: fresh DB
 # ===========================================================================
@@ -0,0 +1,272 @@
+"""Similarity search: MinHash sketches, ``search_mode="similar"`` and duplicate detection."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from cli_agent_orchestrator.clients.database import Base
+from cli_agent_orchestrator.services import memory_service
+from cli_agent_orchestrator.services.memory_service import (
+    SIMILARITY_SKETCH_SIZE,
+    MemoryService,
+    _estimate_containment,
+    _estimate_similarity,
+    _similarity_text,
+    _sketch,
+)
+
+RUNBOOK = (
+    "Deploys run through the blue green pipeline on GitHub Actions. Each merge to main "
+    "builds a container image, pushes it to the registry and rolls the green stack. "
+    "Rollback is a manual approval step in the workflow. Secrets come from the cloud "
+    "secrets manager via OIDC; never commit credentials."
+)
+
+
+def run_async(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture()
+def svc(tmp_path):
+    """MemoryService with tmp_path as base_dir and a private in-memory DB."""
+    # One shared connection: metadata is written from the index writer thread.
+    eng = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(eng)
+    return MemoryService(base_dir=tmp_path, db_engine=eng)
+
+
+def _store(svc, key, content, **kwargs):
+    kwargs.setdefault("scope", "global")
+    return run_async(svc.store(content=content, key=key, **kwargs))
+
+
+def _similar(svc, query, **kwargs):
+    kwargs.setdefault("scan_all", True)
+    return run_async(svc.recall(query=query, search_mode="similar", **kwargs))
+
+
+def _index_bulk(svc, numbers, boilerplate: str) -> None:
+    """Index memories that share ``boilerplate`` without writing wiki files."""
+    with svc._get_db_session() as db:
+        assert svc._ensure_search_index(db)
+        for i in numbers:
+            key = f"bulk-{i}"
+            svc._index_memory(
+                db,
+                svc.get_wiki_path("global", None, key),
+                key,
+                "global",
+                None,
+                "project",
+                "",
+                f"{boilerplate} for ticket {i:05d}",
+            )
+        db.commit()
+
+
+def _sketch_rows(svc) -> int:
+    with svc._get_db_session() as db:
+        return db.execute(text("SELECT COUNT(*) FROM memory_sim_hashes")).scalar()
+
+
+class TestSketches:
+    def test_estimates_track_wording_overlap(self):
+        base = _sketch(_similarity_text("Always run pytest with -n 8 before pushing"))
+        reworded = _sketch(_similarity_text("always run pytest with -n 8 before you push"))
+        unrelated = _sketch(_similarity_text("The deploy pipeline uses GitHub actions"))
+
+        assert _estimate_similarity(base, reworded) > 0.6
+        assert _estimate_similarity(base, unrelated) < 0.1
+        assert _estimate_similarity(base, []) == 0.0
+
+    def test_containment_does_not_shrink_with_memory_length(self):
+        query = _sketch(_similarity_text("blue green rollback"))
+        short = _sketch(_similarity_text("blue green rollback steps"))
+        long = _sketch(_similarity_text(RUNBOOK))
+
+        assert _estimate_containment(query, short) == 1.0
+        assert _estimate_containment(query, long) >= 0.5
+        assert _estimate_similarity(query, long) < 0.2
+        assert _estimate_containment(query, []) == 0.0
+
+    def test_sketch_covers_only_the_latest_entry(self):
+        body = (
+            "# layout\n<!-- id: 1 | scope: global | type: project | tags: -->\n\n"
+            "## 2026-01-01T00:00:00Z\nold layout notes\n\n"
+            "## 2026-02-01T00:00:00Z\nServices live under src/\n"
+        )
+
+        assert _similarity_text(body) == "services live under src"
+        assert len(_sketch("x" * 5000)) == 1
+        assert len(_sketch(" ".join(f"word{i}" for i in range(500)))) == SIMILARITY_SKETCH_SIZE
+
+
+class TestSimilarRecall:
+    def test_tolerates_typos_and_ranks_closest_first(self, svc):
+        _store(svc, "parallel-tests", "Run pytest with -n 8 to use parallel workers")
+        _store(svc, "pytest-config", "pytest configuration lives in pyproject.toml")
+        _store(svc, "deploy", "Deploys go through the blue green pipeline")
+
+        with patch.object(svc, "_similar_scan") as scan:
+            results = _similar(svc, "run pytset with paralel workers")
+
+        scan.assert_not_called()
+        assert results[0].key == "parallel-tests"
+        assert "deploy" not in [m.key for m in results]
+
+    def test_short_query_finds_long_memory(self, svc):
+        _store(svc, "deploy-runbook", RUNBOOK)
+        _store(svc, "redis", "redis cache cluster settings")
+
+        assert [m.key for m in _similar(svc, "green stack rollback")] == ["deploy-runbook"]
+
+    def test_filters_by_scope_and_type(self, svc, tmp_path):
+        ctx = {"cwd": str(tmp_path)}
+        _store(svc, "global-cache", "redis cache cluster settings")
+        content = "redis cache cluster settings"
+        _store(svc, "project-cache", content, scope="project", terminal_context=ctx)
+        _store(svc, "pref-cache", "redis cache cluster settings", memory_type="user")
+
+        project = _similar(
+            svc, "redis cache", scope="project", terminal_context=ctx, scan_all=False
+        )
+        users = _similar(svc, "redis cache", memory_type="user")
+
+        assert [m.key for m in project] == ["project-cache"]
+        assert [m.key for m in users] == ["pref-cache"]
+
+    def test_store_and_forget_maintain_sketches(self, svc):
+        _store(svc, "note", "kafka topics are compacted")
+        assert [m.key for m in _similar(svc, "kafka topic compaction")] == ["note"]
+
+        _store(svc, "note", "we moved from kafka to nats")
+        assert _similar(svc, "kafka topic compaction") == []
+        assert [m.key for m in _similar(svc, "moved to nats")] == ["note"]
+
+        run_async(svc.forget("note", scope="global"))
+        assert _sketch_rows(svc) == 0
+
+    def test_falls_back_to_file_scan_without_fts5(self, svc):
+        _store(svc, "scan-me", "prefer ruff over flake8")
+
+        with patch.object(MemoryService, "_ensure_search_index", return_value=False):
+            results = _similar(svc, "prefer ruff to flake8")
+
+        assert [m.key for m in results] == ["scan-me"]
+
+    def test_index_built_before_sketches_is_rebuilt(self, svc):
+        _store(svc, "legacy", "sessions expire after fourteen days")
+        with svc._get_db_session() as db:
+            db.execute(text("DELETE FROM memory_sim"))
+            db.execute(text("DELETE FROM memory_sim_hashes"))
+            db.execute(text("DELETE FROM memory_search_state"))
+            db.commit()
+        memory_service._search_index_ready.clear()
+
+        assert [m.key for m in _similar(svc, "session expiry after 14 days")] == ["legacy"]
+
+
+class TestDuplicateDetection:
+    def test_store_reports_near_duplicates_in_same_scope(self, svc, tmp_path):
+        ctx = {"cwd": str(tmp_path)}
+        _store(svc, "use-pytest", "Always use pytest for tests in this repo")
+        _store(
+            svc,
+            "other-scope",
+            "Always use pytest for tests in this repo",
+            scope="project",
+            terminal_context=ctx,
+        )
+
+        dup = _store(svc, "pytest-always", "always use pytest for the tests in this repo")
+        fresh = _store(svc, "deploy", "Deploys go through the blue green pipeline")
+        update = _store(svc, "use-pytest", "Always use pytest for tests in this repo!")
+
+        assert dup.duplicates == ["use-pytest"]
+        assert fresh.duplicates == []
+        assert update.duplicates == ["pytest-always"]
+
+    def test_duplicate_check_never_scans_files(self, svc):
+        _store(svc, "a", "identical content here")
+
+        with (
+            patch.object(MemoryService, "_ensure_search_index", return_value=False),
+            patch.object(svc, "_similar_scan") as scan,
+        ):
+            stored = _store(svc, "b", "identical content here")
+
+        scan.assert_not_called()
+        assert stored.duplicates == []
+
+    def test_duplicate_check_cost_does_not_grow_with_store(self, svc):
+        boilerplate = "Always run the full test suite and the linters before merging"
+
+        def vm_steps() -> int:
+            steps = 0
+
+            def count() -> int:
+                nonlocal steps
+                steps += 1
+                return 0
+
+            raw = svc._db_engine.raw_connection().driver_connection
+            raw.set_progress_handler(count, 100)
+            try:
+                svc._find_duplicates(
+                    f"{boilerplate} for ticket 99999", "global", None, svc.base_dir / "new.md"
+                )
+            finally:
+                raw.set_progress_handler(None, 0)
+            return steps
+
+        _index_bulk(svc, range(300), boilerplate)
+        small = vm_steps()
+        _index_bulk(svc, range(300, 1500), boilerplate)
+        large = vm_steps()
+
+        # Five times the memories sharing every common trigram
+        assert large < small * 2
+
+    def test_duplicate_found_among_common_trigrams(self, svc):
+        boilerplate = "Always run the full test suite and the linters before merging"
+        _index_bulk(svc, range(600), boilerplate)
+        _store(svc, "ticket-4711", f"{boilerplate} for ticket xyzzy")
+
+        duplicates = svc._find_duplicates(
+            f"{boilerplate} for ticket xyzzy", "global", None, svc.base_dir / "new.md"
+        )
+
+        # The bulk memories are near-duplicates too, but this one is exact
+        assert duplicates[0] == "ticket-4711"
+
+    def test_mcp_store_returns_duplicates(self, svc):
+        from cli_agent_orchestrator.mcp_server.server import memory_store
+
+        _store(svc, "use-pytest", "Always use pytest for tests in this repo")
+        with (
+            patch("cli_agent_orchestrator.services.memory_service.MemoryService", return_value=svc),
+            patch(
+                "cli_agent_orchestrator.mcp_server.server._get_terminal_context_from_env",
+                return_value=None,
+            ),
+        ):
+            result = run_async(
+                memory_store(
+                    content="always use pytest for tests in this repo",
+                    scope="global",
+                    memory_type="project",
+                    key="pytest-rule",
+                    tags=None,
+                )
+            )
+
+        assert result["success"] is True
+        assert result["duplicates"] == ["use-pytest"]
@@ -0,0 +1,134 @@
+"""Tests for in-memory terminal output streams."""
+
+import os
+import time
+from unittest.mock import patch
+
+from cli_agent_orchestrator.services import output_stream_service
+from cli_agent_orchestrator.services.output_stream_service import (
+    OutputRingBuffer,
+    TerminalOutputStream,
+)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestOutputRingBuffer:
+    def test_keeps_only_capacity_bytes(self):
+        buf = OutputRingBuffer(capacity=8)
+        buf.append(b"0123456789")
+
+        assert buf.snapshot() == (b"23456789", 10)
+
+    def test_read_since_offset(self):
+        buf = OutputRingBuffer(capacity=8)
+        buf.append(b"abcd")
+        _, offset = buf.snapshot()
+        buf.append(b"efgh")
+
+        assert buf.read_since(offset) == (b"efgh", 8)
+
+    def test_read_since_clamps_to_buffered(self):
+        buf = OutputRingBuffer(capacity=4)
+        buf.append(b"abcdefgh")
+
+        assert buf.read_since(0) == (b"efgh", 8)
+
+    def test_read_since_max_bytes(self):
+        buf = OutputRingBuffer(capacity=1024)
+        buf.append(b"abcdefgh")
+
+        assert buf.read_since(2, max_bytes=3) == (b"cde", 5)
+
+    def test_wraps_around(self):
+        buf = OutputRingBuffer(capacity=8)
+        buf.append(b"abcdef")
+        buf.append(b"ghij")
+        buf.append(b"k")
+
+        assert buf.snapshot() == (b"defghijk", 11)
+        assert buf.read_since(5, max_bytes=4) == (b"fghi", 9)
+        assert buf.read_since(11) == (b"", 11)
+
+    def test_tail_text(self):
+        buf = OutputRingBuffer(capacity=1024)
+        buf.append(b"one\ntwo\nthree\n")
+
+        assert buf.tail_text(2) == "two\nthree"
+
+
+class TestTerminalOutputStream:
+    def test_fifo_feeds_buffer_and_listeners(self, tmp_path):
+        activity = []
+        stream = TerminalOutputStream(
+            "abcd1234", tmp_path / "abcd1234.pipe", capacity=1024, on_activity=activity.append
+        )
+        received = []
+        stream.subscribe(received.append)
+        stream.start()
+        try:
+            fd = os.open(stream.fifo_path, os.O_WRONLY)
+            os.write(fd, b"hello from tmux")
+            os.close(fd)
+
+            assert _wait_for(lambda: stream.buffer.end_offset == 15)
+            assert b"".join(received) == b"hello from tmux"
+            assert activity and activity[0] == "abcd1234"
+        finally:
+            stream.stop()
+        assert not stream.fifo_path.exists()
+
+    def test_unsubscribe(self, tmp_path):
+        stream = TerminalOutputStream("abcd1234", tmp_path / "abcd1234.pipe")
+        received = []
+        unsubscribe = stream.subscribe(received.append)
+        stream.feed(b"a")
+        unsubscribe()
+        stream.feed(b"b")
+
+        assert received == [b"a"]
+
+    def test_spill_writes_log(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        stream = TerminalOutputStream("abcd1234", tmp_path / "abcd1234.pipe", spill_path=log)
+        stream.start()
+        stream.feed(b"spilled")
+        stream.stop()
+
+        assert log.read_bytes() == b"spilled"
+
+
+class TestStreamRegistry:
+    def test_start_get_stop(self, tmp_path):
+        with patch.object(output_stream_service, "TERMINAL_LOG_DIR", tmp_path):
+            fifo = output_stream_service.start_stream("abcd1234")
+            try:
+                assert fifo == tmp_path / "abcd1234.pipe"
+                stream = output_stream_service.get_stream("abcd1234")
+                stream.feed(b"x")
+                assert "abcd1234" in output_stream_service.pop_active_terminals()
+                assert output_stream_service.pop_active_terminals() == set()
+            finally:
+                assert output_stream_service.stop_stream("abcd1234") is True
+        assert output_stream_service.get_stream("abcd1234") is None
+        assert output_stream_service.stop_stream("abcd1234") is False
+
+
+class TestInboxReadsStream:
+    def test_log_tail_prefers_stream(self, tmp_path):
+        from cli_agent_orchestrator.services.inbox_service import _get_log_tail
+
+        with patch.object(output_stream_service, "TERMINAL_LOG_DIR", tmp_path):
+            output_stream_service.start_stream("abcd1234")
+            try:
+                output_stream_service.get_stream("abcd1234").feed(b"working\n> ")
+                assert _get_log_tail("abcd1234") == "working\n> "
+            finally:
+                output_stream_service.stop_stream("abcd1234")
@@ -0,0 +1,134 @@
+"""Tests for the dashboard overview service."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.services import overview_service
+from cli_agent_orchestrator.services.session_service import SessionsSnapshot
+
+SESSIONS = [{"id": "cao-s", "name": "cao-s", "status": "detached"}]
+TERMINALS = [
+    {
+        "id": "aaaa1111",
+        "tmux_session": "cao-s",
+        "tmux_window": "dev-1",
+        "provider": "kiro_cli",
+        "agent_profile": "dev",
+        "last_active": datetime(2026, 1, 1, 12, 0),
+        "pending_messages": 2,
+    },
+    {
+        "id": "bbbb2222",
+        "tmux_session": "cao-gone",
+        "tmux_window": "dev-2",
+        "provider": "kiro_cli",
+        "agent_profile": "dev",
+        "last_active": None,
+        "pending_messages": 0,
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    overview_service._overview = None
+    yield
+    overview_service._overview = None
+
+
+def _provider(lines=200):
+    provider = MagicMock()
+    provider.status_capture_lines.return_value = lines
+    provider.classify_captured_status.return_value = TerminalStatus.IDLE
+    provider.get_status.return_value = TerminalStatus.PROCESSING
+    return provider
+
+
+@pytest.fixture
+def env():
+    provider = _provider()
+    with (
+        patch.object(
+            overview_service.session_service,
+            "get_sessions_snapshot",
+            return_value=SessionsSnapshot('"e"', SESSIONS),
+        ),
+        patch.object(
+            overview_service, "list_terminals_with_pending_counts", return_value=TERMINALS
+        ),
+        patch.object(overview_service.provider_manager, "get_provider", return_value=provider),
+        patch.object(overview_service, "tmux_client") as tmux,
+    ):
+        tmux.capture_panes.return_value = {("cao-s", "dev-1"): "idle> "}
+        yield provider, tmux
+
+
+class TestGetOverview:
+    def test_batches_status_capture(self, env):
+        provider, tmux = env
+
+        overview = overview_service.get_overview()
+
+        tmux.capture_panes.assert_called_once_with([("cao-s", "dev-1", 200)])
+        provider.classify_captured_status.assert_called_once_with("idle> ")
+        provider.get_status.assert_not_called()
+        # Terminals of sessions tmux no longer has are left out
+        assert overview == {
+            "sessions": [
+                {
+                    "id": "cao-s",
+                    "name": "cao-s",
+                    "status": "detached",
+                    "terminals": [
+                        {
+                            "id": "aaaa1111",
+                            "name": "dev-1",
+                            "provider": "kiro_cli",
+                            "agent_profile": "dev",
+                            "status": "idle",
+                            "last_active": "2026-01-01T12:00:00",
+                            "pending_messages": 2,
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def test_failed_batch_falls_back_to_get_status(self, env):
+        provider, tmux = env
+        tmux.capture_panes.return_value = None
+
+        overview = overview_service.get_overview()
+
+        assert overview["sessions"][0]["terminals"][0]["status"] == "processing"
+        provider.get_status.assert_called_once()
+
+    def test_provider_without_batch_support(self, env):
+        provider, tmux = env
+        provider.status_capture_lines.return_value = None
+
+        overview = overview_service.get_overview()
+
+        tmux.capture_panes.assert_not_called()
+        assert overview["sessions"][0]["terminals"][0]["status"] == "processing"
+
+    def test_unknown_provider_has_no_status(self, env):
+        with patch.object(
+            overview_service.provider_manager, "get_provider", side_effect=ValueError("gone")
+        ):
+            overview = overview_service.get_overview()
+
+        assert overview["sessions"][0]["terminals"][0]["status"] is None
+
+    def test_cached_within_max_age(self, env):
+        _, tmux = env
+
+        first = overview_service.get_overview()
+        second = overview_service.get_overview()
+        overview_service.get_overview(max_age=0)
+
+        assert first is second
+        assert tmux.capture_panes.call_count == 2
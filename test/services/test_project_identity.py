@@ -472,3 +472,61 @@ def test_legacy_cwd_hash_dir_remains_searchable_after_alias_recorded(
     dir_names = {d.name for d in dirs}
     assert legacy_hash in dir_names
     assert canonical in dir_names
+
+
+# ---------------------------------------------------------------------------
+# Git-remote identity is memoized per working directory
+# ---------------------------------------------------------------------------
+
+
+def test_repeated_resolution_skips_git_subprocess(
+    tmp_path: Path, isolated_db: Path, clear_overrides: None
+) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo, "git@github.com:acme/cached.git")
+
+    first = resolve_project_id(repo)
+    with patch(
+        "cli_agent_orchestrator.services.memory_service._git_remote_identity",
+        side_effect=AssertionError("git should not run on a cache hit"),
+    ):
+        assert resolve_project_id(repo) == first
+        assert resolve_project_id(repo / ".." / "repo") == first
+
+
+def test_git_config_change_invalidates_cached_identity(
+    tmp_path: Path, isolated_db: Path, clear_overrides: None
+) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo, "git@github.com:acme/before.git")
+    assert resolve_project_id(repo) == "github-com-acme-before"
+
+    subprocess.run(
+        ["git", "remote", "set-url", "origin", "git@github.com:acme/after.git"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    # Make sure the rewrite is visible even on coarse-mtime filesystems.
+    config = repo / ".git" / "config"
+    st = config.stat()
+    os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert resolve_project_id(repo) == "github-com-acme-after"
+
+
+def test_cached_identity_expires(
+    tmp_path: Path, isolated_db: Path, clear_overrides: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo, "git@github.com:acme/ttl.git")
+    monkeypatch.setattr(
+        "cli_agent_orchestrator.services.memory_service.PROJECT_ID_CACHE_TTL_SECONDS", 0
+    )
+
+    resolve_project_id(repo)
+    with patch(
+        "cli_agent_orchestrator.services.memory_service._git_remote_identity",
+        return_value="git@github.com:acme/renamed.git",
+    ):
+        assert resolve_project_id(repo) == "github-com-acme-renamed"
@@ -1,5 +1,6 @@
 """Tests for the session service."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,8 +8,12 @@ import pytest
 from cli_agent_orchestrator.services.session_service import (
     create_session,
     delete_session,
+    delete_sessions,
     get_session,
+    get_sessions_snapshot,
+    invalidate_sessions_snapshot,
     list_sessions,
+    subscribe_sessions_changed,
 )
 
 
@@ -97,6 +102,62 @@ class TestListSessions:
         assert result == []
 
 
+class TestSessionsSnapshot:
+    """Tests for the cached session list and its ETag."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        invalidate_sessions_snapshot()
+        yield
+        invalidate_sessions_snapshot()
+
+    @patch("cli_agent_orchestrator.services.session_service.tmux_client")
+    def test_reuses_enumeration_within_max_age(self, mock_tmux):
+        mock_tmux.list_sessions.return_value = [{"id": "cao-a", "name": "cao-a"}]
+
+        first = get_sessions_snapshot(max_age=60)
+        second = get_sessions_snapshot(max_age=60)
+
+        assert first is second
+        mock_tmux.list_sessions.assert_called_once()
+
+    @patch("cli_agent_orchestrator.services.session_service.tmux_client")
+    def test_etag_tracks_content(self, mock_tmux):
+        mock_tmux.list_sessions.return_value = [{"id": "cao-a", "name": "cao-a"}]
+        first = get_sessions_snapshot(max_age=0)
+        same = get_sessions_snapshot(max_age=0)
+        mock_tmux.list_sessions.return_value = [{"id": "cao-b", "name": "cao-b"}]
+        changed = get_sessions_snapshot(max_age=0)
+
+        assert same.etag == first.etag
+        assert changed.etag != first.etag
+
+    @patch("cli_agent_orchestrator.services.session_service.clear_session_env")
+    @patch("cli_agent_orchestrator.services.session_service.delete_terminals_by_session")
+    @patch("cli_agent_orchestrator.services.session_service.list_terminals_by_session")
+    @patch("cli_agent_orchestrator.services.session_service.tmux_client")
+    def test_delete_session_invalidates(self, mock_tmux, mock_list, mock_delete, mock_clear):
+        mock_tmux.session_exists.return_value = True
+        mock_tmux.list_sessions.return_value = [{"id": "cao-a", "name": "cao-a"}]
+        mock_list.return_value = []
+        get_sessions_snapshot(max_age=60)
+
+        delete_session("cao-a")
+        mock_tmux.list_sessions.return_value = []
+
+        assert get_sessions_snapshot(max_age=60).sessions == []
+
+    def test_invalidate_notifies_subscribers(self):
+        calls = []
+        unsubscribe = subscribe_sessions_changed(lambda: calls.append("changed"))
+
+        invalidate_sessions_snapshot()
+        unsubscribe()
+        invalidate_sessions_snapshot()
+
+        assert calls == ["changed"]
+
+
 class TestGetSession:
     """Tests for get_session function."""
 
@@ -260,3 +321,114 @@ class TestDeleteSession:
         mock_provider_manager.cleanup_provider.assert_any_call("term-bbb")
         mock_provider_manager.cleanup_provider.assert_any_call("term-ccc")
         mock_provider_manager.cleanup_provider.assert_any_call("term-ddd")
+
+    @patch("cli_agent_orchestrator.services.session_service.output_stream_service")
+    @patch("cli_agent_orchestrator.services.session_service.delete_terminals_by_session")
+    @patch("cli_agent_orchestrator.services.session_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.session_service.list_terminals_by_session")
+    @patch("cli_agent_orchestrator.services.session_service.tmux_client")
+    def test_delete_session_cleans_up_terminals_concurrently(
+        self, mock_tmux, mock_list_terminals, mock_provider_manager, mock_delete, mock_streams
+    ):
+        """Provider cleanups overlap instead of running one after another."""
+        mock_tmux.session_exists.return_value = True
+        mock_list_terminals.return_value = [{"id": f"term-{i}"} for i in range(4)]
+        barrier = threading.Barrier(4, timeout=5)
+        mock_provider_manager.cleanup_provider.side_effect = lambda _id: barrier.wait()
+
+        delete_session("cao-test")
+
+        assert not barrier.broken
+        assert mock_streams.stop_stream.call_count == 4
+        mock_streams.stop_stream.assert_any_call("term-0")
+
+
+@patch("cli_agent_orchestrator.services.session_service.clear_session_env")
+@patch("cli_agent_orchestrator.services.session_service.dispatch_plugin_event")
+@patch("cli_agent_orchestrator.services.session_service.output_stream_service")
+@patch("cli_agent_orchestrator.services.session_service.delete_terminals_by_session")
+@patch("cli_agent_orchestrator.services.session_service.provider_manager")
+@patch("cli_agent_orchestrator.services.session_service.list_terminals_by_session")
+@patch("cli_agent_orchestrator.services.session_service.tmux_client")
+class TestDeleteSessions:
+    """Tests for delete_sessions bulk shutdown."""
+
+    def test_all_cao_sessions(
+        self, mock_tmux, mock_list, mock_pm, mock_delete, mock_streams, mock_dispatch, mock_clear
+    ):
+        mock_tmux.list_sessions.return_value = [
+            {"id": "cao-a", "name": "cao-a"},
+            {"id": "cao-b", "name": "cao-b"},
+            {"id": "personal", "name": "personal"},
+        ]
+        mock_list.side_effect = lambda name: [{"id": f"{name}-1"}, {"id": f"{name}-2"}]
+
+        result = delete_sessions()
+
+        assert result == {"deleted": ["cao-a", "cao-b"], "errors": []}
+        assert {c.args[0] for c in mock_tmux.kill_session.call_args_list} == {"cao-a", "cao-b"}
+        assert mock_pm.cleanup_provider.call_count == 4
+        assert mock_streams.stop_stream.call_count == 4
+        assert mock_clear.call_count == 2
+        assert [c.args[1] for c in mock_dispatch.call_args_list] == ["post_kill_session"] * 2
+
+    def test_named_sessions_report_missing(
+        self, mock_tmux, mock_list, mock_pm, mock_delete, mock_streams, mock_dispatch, mock_clear
+    ):
+        mock_tmux.list_sessions.return_value = [{"id": "cao-a", "name": "cao-a"}]
+        mock_list.return_value = []
+
+        result = delete_sessions(["cao-a", "cao-gone", "cao-a"])
+
+        assert result["deleted"] == ["cao-a"]
+        assert result["errors"] == [
+            {"session": "cao-gone", "error": "Session 'cao-gone' not found"}
+        ]
+        mock_tmux.kill_session.assert_called_once_with("cao-a")
+
+    def test_kill_failure_does_not_stop_others(
+        self, mock_tmux, mock_list, mock_pm, mock_delete, mock_streams, mock_dispatch, mock_clear
+    ):
+        mock_tmux.list_sessions.return_value = [
+            {"id": "cao-a", "name": "cao-a"},
+            {"id": "cao-b", "name": "cao-b"},
+        ]
+        mock_list.return_value = []
+
+        def kill(name):
+            if name == "cao-a":
+                raise RuntimeError("kill failed")
+
+        mock_tmux.kill_session.side_effect = kill
+
+        result = delete_sessions()
+
+        assert result == {
+            "deleted": ["cao-b"],
+            "errors": [{"session": "cao-a", "error": "kill failed"}],
+        }
+        mock_delete.assert_called_once_with("cao-b")
+        assert [c.args[2].session_name for c in mock_dispatch.call_args_list] == ["cao-b"]
+
+    def test_cleanups_span_sessions_concurrently(
+        self, mock_tmux, mock_list, mock_pm, mock_delete, mock_streams, mock_dispatch, mock_clear
+    ):
+        mock_tmux.list_sessions.return_value = [
+            {"id": f"cao-{i}", "name": f"cao-{i}"} for i in range(4)
+        ]
+        mock_list.side_effect = lambda name: [{"id": f"{name}-1"}]
+        barrier = threading.Barrier(4, timeout=5)
+        mock_pm.cleanup_provider.side_effect = lambda _id: barrier.wait()
+
+        result = delete_sessions()
+
+        assert not barrier.broken
+        assert len(result["deleted"]) == 4
+
+    def test_no_sessions(
+        self, mock_tmux, mock_list, mock_pm, mock_delete, mock_streams, mock_dispatch, mock_clear
+    ):
+        mock_tmux.list_sessions.return_value = []
+
+        assert delete_sessions() == {"deleted": [], "errors": []}
+        mock_tmux.kill_session.assert_not_called()
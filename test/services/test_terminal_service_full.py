@@ -1,20 +1,29 @@
 """Full tests for terminal service."""
 
+import gzip
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from cli_agent_orchestrator.clients.tmux import ScrollbackMark
 from cli_agent_orchestrator.models.agent_profile import AgentProfile
-from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.models.terminal import TerminalStatus, TerminalTurn
+from cli_agent_orchestrator.services import terminal_service
 from cli_agent_orchestrator.services.terminal_service import (
     OutputMode,
+    TurnBoundary,
     create_terminal,
     delete_terminal,
     get_output,
+    get_output_cursor,
+    get_output_since,
     get_terminal,
+    get_turn_boundary,
     get_working_directory,
     send_input,
+    stream_scrollback,
 )
 
 
@@ -542,6 +551,24 @@ class TestGetOutput:
 
         assert result == "last message"
 
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_get_output_full_tail_and_strip(self, mock_get_metadata, mock_tmux):
+        mock_get_metadata.return_value = {"tmux_session": "cao-s", "tmux_window": "w"}
+        mock_tmux.get_history.return_value = "plain"
+
+        get_output("test1234", OutputMode.FULL, tail_lines=20, strip_escapes=True)
+
+        mock_tmux.get_history.assert_called_once_with(
+            "cao-s", "w", tail_lines=20, strip_escapes=True
+        )
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_turn")
+    def test_get_output_turn_tail_and_strip(self, mock_get_turn):
+        mock_get_turn.return_value = MagicMock(response="a\n\x1b[1mb\x1b[0m\nc")
+
+        assert get_output("abcd1234", turn=1, tail_lines=2, strip_escapes=True) == "b\nc"
+
     @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
     def test_get_output_not_found(self, mock_get_metadata):
         """Test getting output from non-existent terminal."""
@@ -566,6 +593,458 @@ class TestGetOutput:
             get_output("test1234", OutputMode.LAST)
 
 
+class TestGetOutputSince:
+    """Tests for cursor-based output reads."""
+
+    @pytest.fixture(autouse=True)
+    def metadata(self):
+        with patch(
+            "cli_agent_orchestrator.services.terminal_service.get_terminal_metadata",
+            return_value={"tmux_session": "cao-s", "tmux_window": "w"},
+        ):
+            yield
+
+    def test_file_mode_returns_only_new_output(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        log.write_bytes(b"old\n")
+        with patch("cli_agent_orchestrator.services.terminal_service.TERMINAL_LOG_DIR", tmp_path):
+            cursor = get_output_cursor("abcd1234")
+            with open(log, "ab") as f:
+                f.write(b"\x1b[32mnew\x1b[0m\r\n")
+
+            chunk = get_output_since("abcd1234", cursor, strip_escapes=True)
+            again = get_output_since("abcd1234", chunk.cursor)
+
+        assert chunk.output == "new\n"
+        assert chunk.truncated is False
+        assert again.output == ""
+        assert again.cursor == chunk.cursor
+
+    def test_file_mode_rotation_restarts_and_reports_truncation(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        log.write_bytes(b"before rotation")
+        with patch("cli_agent_orchestrator.services.terminal_service.TERMINAL_LOG_DIR", tmp_path):
+            cursor = get_output_cursor("abcd1234")
+            log.rename(tmp_path / "abcd1234.log.rotating")
+            log.write_bytes(b"fresh")
+
+            chunk = get_output_since("abcd1234", cursor)
+
+        assert chunk.output == "fresh"
+        assert chunk.truncated is True
+
+    def test_partial_utf8_character_is_left_for_next_read(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        log.write_bytes("é".encode()[:1])
+        with patch("cli_agent_orchestrator.services.terminal_service.TERMINAL_LOG_DIR", tmp_path):
+            chunk = get_output_since("abcd1234", "0:0")
+            with open(log, "ab") as f:
+                f.write("é".encode()[1:])
+            rest = get_output_since("abcd1234", chunk.cursor)
+
+        assert chunk.output == ""
+        assert rest.output == "é"
+
+    def test_memory_mode_reads_ring_buffer(self, tmp_path):
+        from cli_agent_orchestrator.services.output_stream_service import TerminalOutputStream
+
+        stream = TerminalOutputStream("abcd1234", tmp_path / "abcd1234.pipe", capacity=8)
+        stream.feed(b"abc")
+        with patch.object(
+            terminal_service.output_stream_service, "get_stream", return_value=stream
+        ):
+            cursor = get_output_cursor("abcd1234")
+            stream.feed(b"def")
+            chunk = get_output_since("abcd1234", cursor)
+            stream.feed(b"0123456789")
+            behind = get_output_since("abcd1234", chunk.cursor, tail_lines=1)
+
+        assert (chunk.output, chunk.cursor, chunk.truncated) == ("def", "mem:6", False)
+        assert (behind.output, behind.cursor, behind.truncated) == ("23456789", "mem:16", True)
+
+    def test_unknown_terminal(self):
+        with patch(
+            "cli_agent_orchestrator.services.terminal_service.get_terminal_metadata",
+            return_value=None,
+        ):
+            with pytest.raises(ValueError, match="not found"):
+                get_output_since("deadbeef", "0:0")
+
+
+class TestStreamScrollback:
+    """Tests for streaming full scrollback."""
+
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_live_terminal_streams_from_tmux(self, mock_get_metadata, mock_tmux):
+        mock_get_metadata.return_value = {"tmux_session": "cao-s", "tmux_window": "w"}
+        mock_tmux.iter_history.return_value = iter([b"a", b"b"])
+
+        assert list(stream_scrollback("abcd1234", strip_escapes=False)) == [b"a", b"b"]
+        mock_tmux.iter_history.assert_called_once_with("cao-s", "w", strip_escapes=False)
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_deleted_terminal_streams_archive(self, mock_get_metadata, tmp_path):
+        mock_get_metadata.return_value = None
+        with gzip.open(tmp_path / "abcd1234.scrollback.gz", "wb") as f:
+            f.write(b"x" * 10)
+
+        with (
+            patch("cli_agent_orchestrator.services.archive_service.TERMINAL_LOG_DIR", tmp_path),
+            patch("cli_agent_orchestrator.services.archive_service.READ_CHUNK_BYTES", 4),
+        ):
+            chunks = list(stream_scrollback("abcd1234"))
+
+        assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_no_scrollback(self, mock_get_metadata, tmp_path):
+        mock_get_metadata.return_value = None
+
+        with patch("cli_agent_orchestrator.services.archive_service.TERMINAL_LOG_DIR", tmp_path):
+            with pytest.raises(ValueError, match="No scrollback"):
+                stream_scrollback("abcd1234")
+
+
+class TestTurnBoundaries:
+    """Tests for turn boundaries recorded at send time and used for LAST extraction."""
+
+    @patch("cli_agent_orchestrator.services.terminal_service.update_last_active")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_send_input_records_boundary(self, mock_get_metadata, mock_tmux, mock_pm, mock_update):
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+        }
+        mark = ScrollbackMark(line=42, history_limit=2000, context=("$ ls",))
+        mock_tmux.mark_cursor_line.return_value = mark
+
+        send_input("turn0001", "hello")
+
+        assert get_turn_boundary("turn0001") == TurnBoundary(scrollback=mark)
+
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_get_output_last_uses_turn_slice(
+        self, mock_get_metadata, mock_tmux, mock_provider_manager
+    ):
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+        }
+        mark = ScrollbackMark(line=10, history_limit=2000, context=())
+        mock_tmux.get_history_from_mark.return_value = "turn output"
+        mock_provider = MagicMock()
+        mock_provider.extract_last_message_from_script.return_value = "last message"
+        mock_provider_manager.get_provider.return_value = mock_provider
+
+        with patch.dict(
+            terminal_service._turn_boundaries,
+            {"turn0002": TurnBoundary(scrollback=mark)},
+        ):
+            result = get_output("turn0002", OutputMode.LAST)
+
+        assert result == "last message"
+        mock_tmux.get_history_from_mark.assert_called_once_with(
+            "cao-session", "developer-abcd", mark
+        )
+        mock_provider.extract_last_message_from_script.assert_called_once_with("turn output")
+        mock_tmux.get_history.assert_not_called()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_get_output_last_falls_back_to_tail(
+        self, mock_get_metadata, mock_tmux, mock_provider_manager
+    ):
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+        }
+        mock_tmux.get_history_from_mark.return_value = "partial"
+        mock_tmux.get_history.return_value = "tail output"
+        mock_provider = MagicMock()
+        mock_provider.extraction_retries = 0
+        mock_provider.extract_last_message_from_script.side_effect = [
+            ValueError("no response marker"),
+            "from tail",
+        ]
+        mock_provider_manager.get_provider.return_value = mock_provider
+
+        with patch.dict(
+            terminal_service._turn_boundaries,
+            {"turn0003": TurnBoundary(scrollback=ScrollbackMark(10, 2000, ()))},
+        ):
+            result = get_output("turn0003", OutputMode.LAST)
+
+        assert result == "from tail"
+        mock_tmux.get_history.assert_called_once()
+
+
+class TestTranscriptTurns:
+    """Tests for the per-turn transcript recorded by send_input/get_output."""
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_turn")
+    def test_get_output_turn_served_from_store(self, mock_get_turn, mock_get_metadata):
+        mock_get_turn.return_value = TerminalTurn(
+            terminal_id="abcd1234", turn=2, input="task", response="stored answer"
+        )
+
+        assert get_output("abcd1234", OutputMode.LAST, turn=2) == "stored answer"
+        mock_get_turn.assert_called_once_with("abcd1234", 2)
+        mock_get_metadata.assert_not_called()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_turn")
+    def test_get_output_turn_missing(self, mock_get_turn):
+        mock_get_turn.return_value = None
+
+        with pytest.raises(ValueError, match="no recorded output"):
+            get_output("abcd1234", turn=5)
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_get_output_last_after_terminal_deleted(self, mock_get_metadata, mock_get_turn):
+        mock_get_metadata.return_value = None
+        mock_get_turn.return_value = TerminalTurn(
+            terminal_id="abcd1234", turn=1, input="task", response="handoff result"
+        )
+
+        assert get_output("abcd1234", OutputMode.LAST) == "handoff result"
+
+    @staticmethod
+    def _poll(terminal_id):
+        """get_terminal(), then wait for the transcript worker to catch up."""
+        get_terminal(terminal_id)
+        terminal_service._transcript_executor.submit(lambda: None).result(timeout=5)
+
+    @staticmethod
+    def _open_turn(mock_get_metadata, mock_tmux, mock_pm, terminal_id):
+        mock_get_metadata.return_value = {
+            "id": terminal_id,
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+            "provider": "claude_code",
+            "agent_profile": "developer",
+            "last_active": None,
+        }
+        mock_tmux.mark_cursor_line.return_value = None
+        mock_tmux.get_history.return_value = "screen"
+        mock_provider = mock_pm.get_provider.return_value
+        mock_provider.paste_enter_count = 1
+        mock_provider.extraction_retries = 0
+        mock_provider.extract_last_message_from_script.return_value = "answer"
+        send_input(terminal_id, "do the thing")
+        return mock_provider
+
+    @patch("cli_agent_orchestrator.services.terminal_service.append_terminal_turn_status")
+    @patch("cli_agent_orchestrator.services.terminal_service.complete_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.create_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.update_last_active")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_completed_response_is_recorded(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_pm,
+        mock_update,
+        mock_create_turn,
+        mock_complete_turn,
+        mock_append_status,
+    ):
+        mock_create_turn.return_value = 1
+        mock_provider = self._open_turn(mock_get_metadata, mock_tmux, mock_pm, "abcd5678")
+        mock_create_turn.assert_called_once_with("abcd5678", "claude_code", "do the thing")
+
+        mock_provider.get_status.return_value = TerminalStatus.PROCESSING
+        self._poll("abcd5678")
+        mock_complete_turn.assert_not_called()
+
+        mock_provider.get_status.return_value = TerminalStatus.COMPLETED
+        self._poll("abcd5678")
+        mock_complete_turn.assert_called_once_with("abcd5678", "answer", turn=1)
+        assert [c.args[1] for c in mock_append_status.call_args_list] == [
+            "processing",
+            "completed",
+        ]
+
+        # Later polls neither re-record nor re-extract.
+        self._poll("abcd5678")
+        mock_complete_turn.assert_called_once()
+        mock_provider.extract_last_message_from_script.assert_called_once()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.append_terminal_turn_status")
+    @patch("cli_agent_orchestrator.services.terminal_service.complete_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.create_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.update_last_active")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_idle_before_processing_keeps_turn_open(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_pm,
+        mock_update,
+        mock_create_turn,
+        mock_complete_turn,
+        mock_append_status,
+        mock_get_turn,
+    ):
+        mock_create_turn.return_value = 2
+        mock_get_turn.return_value = TerminalTurn(
+            terminal_id="abcd9999", turn=1, input="earlier task", response="answer"
+        )
+        mock_provider = self._open_turn(mock_get_metadata, mock_tmux, mock_pm, "abcd9999")
+
+        # The pane has not picked up the message yet: it still shows turn 1's answer.
+        mock_provider.get_status.return_value = TerminalStatus.IDLE
+        self._poll("abcd9999")
+        get_output("abcd9999", OutputMode.LAST)
+        mock_complete_turn.assert_not_called()
+        mock_get_turn.assert_called_once_with("abcd9999", 1)
+
+        mock_provider.extract_last_message_from_script.return_value = "new answer"
+        mock_provider.get_status.return_value = TerminalStatus.PROCESSING
+        self._poll("abcd9999")
+        mock_provider.get_status.return_value = TerminalStatus.IDLE
+        self._poll("abcd9999")
+        mock_complete_turn.assert_called_once_with("abcd9999", "new answer", turn=2)
+
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.append_terminal_turn_status")
+    @patch("cli_agent_orchestrator.services.terminal_service.complete_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.create_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.update_last_active")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_turn_first_seen_completed_is_closed(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_pm,
+        mock_update,
+        mock_create_turn,
+        mock_complete_turn,
+        mock_append_status,
+        mock_get_turn,
+    ):
+        mock_create_turn.return_value = 1
+        mock_provider = self._open_turn(mock_get_metadata, mock_tmux, mock_pm, "abcd1111")
+
+        # The agent finished before the first poll.
+        mock_provider.get_status.return_value = TerminalStatus.COMPLETED
+        self._poll("abcd1111")
+
+        mock_complete_turn.assert_called_once_with("abcd1111", "answer", turn=1)
+        mock_get_turn.assert_not_called()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.append_terminal_turn_status")
+    @patch("cli_agent_orchestrator.services.terminal_service.complete_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.create_terminal_turn")
+    @patch("cli_agent_orchestrator.services.terminal_service.update_last_active")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_turn_first_seen_done_uses_turn_output(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_pm,
+        mock_update,
+        mock_create_turn,
+        mock_complete_turn,
+        mock_append_status,
+    ):
+        mock_create_turn.return_value = 3
+        mock_provider = self._open_turn(mock_get_metadata, mock_tmux, mock_pm, "abcd2222")
+        terminal_service._turn_boundaries["abcd2222"] = terminal_service.TurnBoundary(
+            ScrollbackMark(10, 2000, ())
+        )
+        mock_tmux.get_history_from_mark.return_value = "> do the thing"
+        mock_provider.extract_last_message_from_script.side_effect = ValueError("no response")
+
+        # Idle with only the message since the boundary: not picked up yet.
+        mock_provider.get_status.return_value = TerminalStatus.IDLE
+        self._poll("abcd2222")
+        mock_complete_turn.assert_not_called()
+
+        mock_provider.extract_last_message_from_script.side_effect = None
+        mock_provider.get_status.return_value = TerminalStatus.PROCESSING
+        self._poll("abcd2222")
+        mock_provider.get_status.return_value = TerminalStatus.COMPLETED
+        self._poll("abcd2222")
+        mock_complete_turn.assert_called_once_with("abcd2222", "answer", turn=3)
+        mock_tmux.get_history.assert_not_called()
+
+    def test_status_poll_leaves_transcript_work_to_worker(self):
+        terminal_service._open_turns["abcd3333"] = terminal_service._OpenTurn(1)
+        threads = []
+        try:
+            with patch.object(
+                terminal_service,
+                "_write_transcript_status",
+                side_effect=lambda *args: threads.append(threading.current_thread().name),
+            ) as write:
+                terminal_service._record_transcript_status("abcd3333", "completed", {}, MagicMock())
+                terminal_service._transcript_executor.submit(lambda: None).result(timeout=5)
+        finally:
+            terminal_service._open_turns.pop("abcd3333", None)
+
+        write.assert_called_once()
+        assert threads[0].startswith("cao-transcript")
+
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_get_output_last_does_not_check_status(self, mock_get_metadata, mock_tmux, mock_pm):
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+        }
+        mock_tmux.get_history.return_value = "screen"
+        mock_provider = mock_pm.get_provider.return_value
+        mock_provider.extraction_retries = 0
+        mock_provider.extract_last_message_from_script.return_value = "answer"
+
+        assert get_output("abcd4321", OutputMode.LAST) == "answer"
+        mock_provider.get_status.assert_not_called()
+
+
+class TestStartOutputPipe:
+    """Tests for choosing the pipe-pane sink."""
+
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    def test_file_mode_pipes_to_log(self, mock_tmux, tmp_path):
+        with patch("cli_agent_orchestrator.services.terminal_service.TERMINAL_LOG_DIR", tmp_path):
+            terminal_service.start_output_pipe("abcd1234", "cao-s", "win")
+
+        assert (tmp_path / "abcd1234.log").exists()
+        mock_tmux.pipe_pane.assert_called_once_with("cao-s", "win", str(tmp_path / "abcd1234.log"))
+
+    @patch("cli_agent_orchestrator.services.terminal_service.output_stream_service")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    def test_memory_mode_pipes_to_fifo(self, mock_tmux, mock_streams, tmp_path):
+        mock_streams.start_stream.return_value = tmp_path / "abcd1234.pipe"
+
+        with patch(
+            "cli_agent_orchestrator.services.terminal_service.TERMINAL_OUTPUT_SINK", "memory"
+        ):
+            terminal_service.start_output_pipe("abcd1234", "cao-s", "win")
+
+        mock_streams.start_stream.assert_called_once()
+        mock_tmux.pipe_pane.assert_called_once_with(
+            "cao-s", "win", str(tmp_path / "abcd1234.pipe"), fifo=True
+        )
+
+
 class TestDeleteTerminal:
     """Tests for delete_terminal function."""
 
@@ -609,6 +1088,119 @@ class TestDeleteTerminal:
 
         assert result is True
 
+    @patch("cli_agent_orchestrator.services.archive_service.enqueue")
+    @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_delete_terminal_archives_rendered_scrollback(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_provider_manager,
+        mock_db_delete,
+        mock_enqueue,
+        tmp_path,
+    ):
+        """The pane is captured before the window is killed and handed to the archiver."""
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+            "provider": "claude_code",
+        }
+        mock_tmux.iter_history.return_value = iter([b"rendered ", b"screen\n"])
+        mock_db_delete.return_value = True
+
+        with patch("cli_agent_orchestrator.services.archive_service.TERMINAL_LOG_DIR", tmp_path):
+            delete_terminal("test1234")
+
+        calls = [name for name, _, _ in mock_tmux.mock_calls]
+        assert calls.index("iter_history") < calls.index("kill_window")
+        mock_tmux.iter_history.assert_called_once_with(
+            "cao-session", "developer-abcd", strip_escapes=True
+        )
+        job = mock_enqueue.call_args.args[0]
+        assert job.scrollback_path == tmp_path / "test1234.scrollback.capture"
+        assert job.scrollback_path.read_bytes() == b"rendered screen\n"
+        assert job.output is None
+
+    @patch("cli_agent_orchestrator.services.archive_service.enqueue")
+    @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_delete_terminal_streams_scrollback_to_disk(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_provider_manager,
+        mock_db_delete,
+        mock_enqueue,
+        tmp_path,
+    ):
+        """Each history chunk is on disk before the next one is read."""
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+            "provider": "claude_code",
+        }
+        capture = tmp_path / "test1234.scrollback.capture"
+        chunk = b"x" * 4096
+        written = []
+
+        def history(*args, **kwargs):
+            for i in range(50):
+                # Everything yielded so far has already been written out
+                written.append(capture.stat().st_size if capture.exists() else 0)
+                yield chunk
+
+        mock_tmux.iter_history.side_effect = history
+        mock_db_delete.return_value = True
+
+        with patch("cli_agent_orchestrator.services.archive_service.TERMINAL_LOG_DIR", tmp_path):
+            delete_terminal("test1234")
+
+        # Only buffered (io.DEFAULT_BUFFER_SIZE) bytes may lag behind
+        assert all(i * len(chunk) - size <= 8192 for i, size in enumerate(written))
+        assert capture.stat().st_size == 50 * len(chunk)
+        job = mock_enqueue.call_args.args[0]
+        assert job.scrollback_path == capture
+        assert job.output is None
+
+    @patch("cli_agent_orchestrator.services.archive_service.enqueue")
+    @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
+    @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
+    @patch("cli_agent_orchestrator.services.terminal_service.tmux_client")
+    @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
+    def test_delete_terminal_failed_capture_leaves_no_file(
+        self,
+        mock_get_metadata,
+        mock_tmux,
+        mock_provider_manager,
+        mock_db_delete,
+        mock_enqueue,
+        tmp_path,
+    ):
+        mock_get_metadata.return_value = {
+            "tmux_session": "cao-session",
+            "tmux_window": "developer-abcd",
+            "provider": "claude_code",
+        }
+
+        def history(*args, **kwargs):
+            yield b"partial"
+            raise RuntimeError("pane gone")
+
+        mock_tmux.iter_history.side_effect = history
+        mock_db_delete.return_value = True
+
+        with patch("cli_agent_orchestrator.services.archive_service.TERMINAL_LOG_DIR", tmp_path):
+            delete_terminal("test1234")
+
+        assert not (tmp_path / "test1234.scrollback.capture").exists()
+        job = mock_enqueue.call_args.args[0]
+        assert job.scrollback_path is None
+
     @patch("cli_agent_orchestrator.services.terminal_service.db_delete_terminal")
     @patch("cli_agent_orchestrator.services.terminal_service.provider_manager")
     @patch("cli_agent_orchestrator.services.terminal_service.get_terminal_metadata")
@@ -0,0 +1,70 @@
+"""Tests for the bounded, rotating pipe-pane log sink."""
+
+import gzip
+import io
+import subprocess
+import sys
+
+from cli_agent_orchestrator.utils.log_sink import main, run, segment_path
+
+
+class ChunkedStream:
+    """Stream whose read1 yields the given chunks one at a time, like a pipe."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def read1(self, size):
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class TestLogSink:
+    def test_appends_below_cap(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        log.write_bytes(b"existing ")
+
+        run(log, segment_bytes=1024, segments=2, stream=io.BytesIO(b"new output"))
+
+        assert log.read_bytes() == b"existing new output"
+        assert not segment_path(log, 1).exists()
+
+    def test_rotates_and_compresses(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        stream = ChunkedStream([b"a" * 10, b"b" * 10, b"c" * 4])
+
+        run(log, segment_bytes=10, segments=5, stream=stream)
+
+        assert log.read_bytes() == b"cccc"
+        assert gzip.decompress(segment_path(log, 1).read_bytes()) == b"b" * 10
+        assert gzip.decompress(segment_path(log, 2).read_bytes()) == b"a" * 10
+
+    def test_drops_segments_beyond_limit(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+        stream = ChunkedStream(bytes([ord("a") + i]) * 10 for i in range(5))
+
+        run(log, segment_bytes=10, segments=2, stream=stream)
+
+        assert gzip.decompress(segment_path(log, 1).read_bytes()) == b"e" * 10
+        assert gzip.decompress(segment_path(log, 2).read_bytes()) == b"d" * 10
+        assert not segment_path(log, 3).exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "abcd1234.log",
+            "abcd1234.log.1.gz",
+            "abcd1234.log.2.gz",
+        ]
+
+    def test_main_usage_error(self, capsys):
+        assert main(["only-one-arg"]) == 2
+        assert "usage" in capsys.readouterr().err
+
+    def test_runs_as_module(self, tmp_path):
+        log = tmp_path / "abcd1234.log"
+
+        subprocess.run(
+            [sys.executable, "-m", "cli_agent_orchestrator.utils.log_sink", str(log), "1024", "2"],
+            input=b"piped from tmux",
+            check=True,
+            timeout=30,
+        )
+
+        assert log.read_bytes() == b"piped from tmux"
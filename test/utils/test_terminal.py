@@ -9,6 +9,7 @@ from cli_agent_orchestrator.utils.terminal import (
     generate_session_name,
     generate_terminal_id,
     generate_window_name,
+    strip_ansi,
     validate_tmux_name,
     wait_for_shell,
     wait_until_status,
@@ -125,6 +126,16 @@ class TestValidateTmuxName:
             pytest.fail("expected ValueError")
 
 
+class TestStripAnsi:
+    def test_removes_escape_sequences(self):
+        raw = "\x1b[1;31mred\x1b[0m\r\n\x1b]0;title\x07ok\x1b(B\x1b]8;;http://x\x1b\\link"
+
+        assert strip_ansi(raw) == "red\noklink"
+
+    def test_plain_text_unchanged(self):
+        assert strip_ansi("a [b] c") == "a [b] c"
+
+
 class TestWaitForShell:
     """Tests for wait_for_shell function."""
 
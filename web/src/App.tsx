@@ -1,5 +1,6 @@
 import { useEffect, useState, Suspense } from 'react'
 import { useStore } from './store'
+import { api } from './api'
 import { ErrorBoundary } from './components/ErrorBoundary'
 import { DashboardHome } from './components/DashboardHome'
 import { AgentPanel } from './components/AgentPanel'
@@ -49,12 +50,21 @@ function Snackbar() {
 
 export default function App() {
   const [tab, setTab] = useState<TabKey>('home')
-  const { sessions, connected, fetchSessions } = useStore()
+  const { sessions, connected, fetchSessions, applySessionsEvent, setConnected } = useStore()
 
+  // The server pushes session list changes; fall back to conditional
+  // (ETag) polling where EventSource is unavailable.
   useEffect(() => {
-    fetchSessions()
-    const interval = setInterval(fetchSessions, 10000)
-    return () => clearInterval(interval)
+    if (typeof EventSource === 'undefined') {
+      fetchSessions()
+      const interval = setInterval(fetchSessions, 10000)
+      return () => clearInterval(interval)
+    }
+    const events = new EventSource(api.sessionEventsUrl())
+    events.onmessage = (e) => applySessionsEvent(JSON.parse(e.data))
+    // EventSource reconnects by itself and the server resends a snapshot
+    events.onerror = () => setConnected(false)
+    return () => events.close()
   }, [])
 
   // Keyboard shortcuts: Alt+1-4
@@ -18,6 +18,31 @@ export interface Session {
   status: string
 }
 
+/** Session list pushed by GET /sessions/events: a full snapshot, then deltas. */
+export type SessionsEvent =
+  | { type: 'snapshot'; etag: string; sessions: Session[] }
+  | { type: 'delta'; etag: string; upserted: Session[]; removed: string[] }
+
+/**
+ * GET /sessions with If-None-Match. Resolves to null sessions on 304 (the
+ * caller's copy is current).
+ */
+async function listSessionsIfChanged(etag: string | null): Promise<{ etag: string | null; sessions: Session[] | null }> {
+  const controller = new AbortController()
+  const timeout = setTimeout(() => controller.abort(), 10000)
+  try {
+    const res = await fetch(`${BASE}/sessions`, {
+      headers: etag ? { 'If-None-Match': etag } : undefined,
+      signal: controller.signal,
+    })
+    if (res.status === 304) return { etag, sessions: null }
+    if (!res.ok) throw new Error(`${res.status} ${res.statusText}`)
+    return { etag: res.headers.get('ETag'), sessions: await res.json() }
+  } finally {
+    clearTimeout(timeout)
+  }
+}
+
 export interface Terminal {
   id: string
   name: string
@@ -43,6 +68,20 @@ export interface TerminalMeta {
   last_active: string | null
 }
 
+export interface OverviewTerminal {
+  id: string
+  name: string
+  provider: string
+  agent_profile: string | null
+  status: string | null
+  last_active: string | null
+  pending_messages: number
+}
+
+export interface Overview {
+  sessions: (Session & { terminals: OverviewTerminal[] })[]
+}
+
 /**
  * Known profile source values the backend can emit.
  * Using `string` (not a closed union) so new provider-discovered directories
@@ -105,6 +144,9 @@ export const api = {
 
   // Sessions
   listSessions: () => fetchJSON<Session[]>('/sessions'),
+  listSessionsIfChanged,
+  getOverview: () => fetchJSON<Overview>('/overview'),
+  sessionEventsUrl: () => `${BASE}/sessions/events`,
   getSession: (name: string) => fetchJSON<SessionDetail>(`/sessions/${name}`),
   createSession: (provider: string, agentProfile: string, sessionName?: string, workingDirectory?: string) =>
     fetchJSON<Terminal>(`/sessions?provider=${provider}&agent_profile=${agentProfile}${sessionName ? `&session_name=${sessionName}` : ''}${workingDirectory ? `&working_directory=${encodeURIComponent(workingDirectory)}` : ''}`, { method: 'POST', timeoutMs: 90000 }),
@@ -124,21 +124,34 @@ export function DashboardHome({ onNavigate }: { onNavigate: (tab: string) => voi
     return counts
   }
 
-  // Fetch session details with terminals
+  // One overview request returns every session's terminals and live statuses
   useEffect(() => {
+    let lastJson = ''
     const fetchAll = async () => {
       try {
-        const sessionDetails = await Promise.all(
-          sessions.map(async s => {
-            try {
-              const detail = await api.getSession(s.name)
-              return { name: s.name, status: s.status, terminals: detail.terminals || [] }
-            } catch {
-              return { name: s.name, status: s.status, terminals: [] }
-            }
-          })
-        )
+        const overview = await api.getOverview()
+        const json = JSON.stringify(overview)
+        if (json === lastJson) return
+        lastJson = json
+        const sessionDetails: SessionWithTerminals[] = overview.sessions.map(s => ({
+          name: s.name,
+          status: s.status,
+          terminals: s.terminals.map(t => ({
+            id: t.id,
+            tmux_session: s.name,
+            tmux_window: t.name,
+            provider: t.provider,
+            agent_profile: t.agent_profile,
+            created_at: null,
+            last_active: t.last_active,
+          })),
+        }))
         setSessionData(sessionDetails)
+        const allIds = overview.sessions.flatMap(s => s.terminals.map(t => t.id))
+        clearTerminalStatuses(allIds)
+        overview.sessions.forEach(s => s.terminals.forEach(t => {
+          if (t.status) setTerminalStatus(t.id, t.status)
+        }))
         // Auto-expand only newly seen sessions
         const newNames = sessionDetails.map(s => s.name).filter(n => !seenSessionsRef.current.has(n))
         newNames.forEach(n => seenSessionsRef.current.add(n))
@@ -152,27 +165,10 @@ export function DashboardHome({ onNavigate }: { onNavigate: (tab: string) => voi
       } catch {}
     }
     fetchAll()
-    const interval = setInterval(fetchAll, 5000)
+    const interval = setInterval(fetchAll, 3000)
     return () => clearInterval(interval)
   }, [sessions.map(s => s.id).join(',')])
 
-  // Poll statuses
-  useEffect(() => {
-    const allIds = sessionData.flatMap(s => s.terminals.map(t => t.id))
-    if (!allIds.length) return
-    clearTerminalStatuses(allIds)
-    const fetch = () => {
-      allIds.forEach(id => {
-        api.getTerminalStatus(id)
-          .then(status => { if (status) setTerminalStatus(id, status) })
-          .catch(() => {})
-      })
-    }
-    fetch()
-    const interval = setInterval(fetch, 3000)
-    return () => clearInterval(interval)
-  }, [sessionData.flatMap(s => s.terminals.map(t => t.id)).join(',')])
-
   useEffect(() => {
     api.listProfiles().then(p => setProfileCount(p.length)).catch(() => {})
   }, [])
@@ -1,8 +1,44 @@
-import { useEffect, useRef } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { Terminal } from '@xterm/xterm'
 import { FitAddon } from '@xterm/addon-fit'
 import '@xterm/xterm/css/xterm.css'
-import { X, Terminal as TermIcon } from 'lucide-react'
+import { X, Lock, Terminal as TermIcon } from 'lucide-react'
+
+// Binary client frames: one opcode byte, then the payload (see terminal_hub.py)
+const FRAME_INPUT = 0x00
+const FRAME_RESIZE = 0x01
+const encoder = new TextEncoder()
+
+function inputFrame(data: string): Uint8Array {
+  const bytes = encoder.encode(data)
+  const frame = new Uint8Array(bytes.length + 1)
+  frame[0] = FRAME_INPUT
+  frame.set(bytes, 1)
+  return frame
+}
+
+function resizeFrame(rows: number, cols: number): Uint8Array {
+  const frame = new Uint8Array(5)
+  const view = new DataView(frame.buffer)
+  frame[0] = FRAME_RESIZE
+  view.setUint16(1, rows)
+  view.setUint16(3, cols)
+  return frame
+}
+
+/**
+ * Parse a text control frame from the server. Returns whether this viewer
+ * owns input for an `input_owner` frame, or null for anything else.
+ */
+export function parseInputOwner(text: string): boolean | null {
+  try {
+    const msg = JSON.parse(text)
+    if (msg && msg.type === 'input_owner' && typeof msg.owner === 'boolean') return msg.owner
+  } catch {
+    // not a control frame
+  }
+  return null
+}
 
 interface TerminalViewProps {
   terminalId: string
@@ -13,6 +49,9 @@ interface TerminalViewProps {
 
 export function TerminalView({ terminalId, provider, agentProfile, onClose }: TerminalViewProps) {
   const containerRef = useRef<HTMLDivElement>(null)
+  // Only the longest-connected viewer may type or resize; the server says
+  // which one we are with an `input_owner` frame.
+  const [readOnly, setReadOnly] = useState(false)
 
   useEffect(() => {
     const el = containerRef.current
@@ -47,16 +86,28 @@ export function TerminalView({ terminalId, provider, agentProfile, onClose }: Te
     const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:'
     const ws = new WebSocket(`${protocol}//${location.host}/terminals/${terminalId}/ws`)
     ws.binaryType = 'arraybuffer'
+    let ownsInput = true
 
     ws.onopen = () => {
       // Fit once the connection is live so we send correct dimensions
       fitAddon.fit()
-      ws.send(JSON.stringify({ type: 'resize', rows: term.rows, cols: term.cols }))
+      ws.send(resizeFrame(term.rows, term.cols))
     }
 
     ws.onmessage = (e) => {
       if (e.data instanceof ArrayBuffer) {
         term.write(new Uint8Array(e.data))
+      } else if (typeof e.data === 'string') {
+        const owner = parseInputOwner(e.data)
+        if (owner === null) return
+        ownsInput = owner
+        term.options.disableStdin = !owner
+        setReadOnly(!owner)
+        if (owner) {
+          // Took over input: size the shared client to this viewer
+          fitAddon.fit()
+          ws.send(resizeFrame(term.rows, term.cols))
+        }
       }
     }
 
@@ -85,8 +136,8 @@ export function TerminalView({ terminalId, provider, agentProfile, onClose }: Te
     // onData handles ALL input including paste — xterm.js
     // receives pasted text through the browser's input system
     term.onData((data) => {
-      if (ws.readyState === WebSocket.OPEN) {
-        ws.send(JSON.stringify({ type: 'input', data }))
+      if (ownsInput && ws.readyState === WebSocket.OPEN) {
+        ws.send(inputFrame(data))
       }
     })
 
@@ -96,8 +147,8 @@ export function TerminalView({ terminalId, provider, agentProfile, onClose }: Te
       clearTimeout(resizeTimer)
       resizeTimer = setTimeout(() => {
         fitAddon.fit()
-        if (ws.readyState === WebSocket.OPEN) {
-          ws.send(JSON.stringify({ type: 'resize', rows: term.rows, cols: term.cols }))
+        if (ownsInput && ws.readyState === WebSocket.OPEN) {
+          ws.send(resizeFrame(term.rows, term.cols))
         }
       }, 50)
     })
@@ -128,6 +179,15 @@ export function TerminalView({ terminalId, provider, agentProfile, onClose }: Te
           <span className="text-sm font-mono text-gray-300">{terminalId}</span>
           {provider && <span className="text-xs text-gray-500 bg-gray-800 px-2 py-0.5 rounded">{provider}</span>}
           {agentProfile && <span className="text-xs text-emerald-400 bg-emerald-900/30 px-2 py-0.5 rounded">{agentProfile}</span>}
+          {readOnly && (
+            <span
+              className="flex items-center gap-1 text-xs text-amber-400 bg-amber-900/30 px-2 py-0.5 rounded"
+              title="Another viewer is controlling this terminal; you can watch but not type"
+            >
+              <Lock size={12} />
+              Read-only
+            </span>
+          )}
         </div>
         <div className="flex items-center gap-3">
           <span className="text-[10px] text-gray-600">Click X to close</span>
@@ -1,5 +1,5 @@
 import { create } from 'zustand'
-import { api, Session, SessionDetail, TerminalMeta } from './api'
+import { api, Session, SessionDetail, SessionsEvent, TerminalMeta } from './api'
 
 // Only trigger React re-renders when data actually changed
 function jsonEqual(a: unknown, b: unknown): boolean {
@@ -13,6 +13,7 @@ interface Snackbar {
 
 interface Store {
   sessions: Session[]
+  sessionsEtag: string | null
   activeSession: string | null
   activeSessionDetail: SessionDetail | null
   connected: boolean
@@ -20,6 +21,7 @@ interface Store {
   terminalStatuses: Record<string, string>
 
   fetchSessions: () => Promise<void>
+  applySessionsEvent: (event: SessionsEvent) => void
   selectSession: (name: string | null) => Promise<void>
   createSession: (provider: string, agentProfile: string, workingDirectory?: string) => Promise<void>
   deleteSession: (name: string) => Promise<void>
@@ -32,6 +34,7 @@ interface Store {
 
 export const useStore = create<Store>((set, get) => ({
   sessions: [],
+  sessionsEtag: null,
   activeSession: null,
   activeSessionDetail: null,
   connected: false,
@@ -40,8 +43,12 @@ export const useStore = create<Store>((set, get) => ({
 
   fetchSessions: async () => {
     try {
-      const sessions = await api.listSessions()
+      const { etag, sessions } = await api.listSessionsIfChanged(get().sessionsEtag)
       const prev = get()
+      if (sessions === null) {
+        if (!prev.connected) set({ connected: true })
+        return
+      }
       // Only skip empty responses when reconnecting (connected was false),
       // not after intentional deletions.
       if (sessions.length === 0 && prev.sessions.length > 0 && !prev.connected) {
@@ -49,13 +56,31 @@ export const useStore = create<Store>((set, get) => ({
         return
       }
       if (!prev.connected || !jsonEqual(prev.sessions, sessions)) {
-        set({ sessions, connected: true })
+        set({ sessions, sessionsEtag: etag, connected: true })
+      } else {
+        set({ sessionsEtag: etag })
       }
     } catch {
       if (get().connected) set({ connected: false })
     }
   },
 
+  applySessionsEvent: (event) => {
+    if (event.type === 'snapshot') {
+      set({ sessions: event.sessions, sessionsEtag: event.etag, connected: true })
+      return
+    }
+    const removed = new Set(event.removed)
+    const upserted = new Map(event.upserted.map(s => [s.id, s]))
+    const sessions = get().sessions
+      .filter(s => !removed.has(s.id))
+      .map(s => upserted.get(s.id) ?? s)
+    for (const s of event.upserted) {
+      if (!sessions.some(existing => existing.id === s.id)) sessions.push(s)
+    }
+    set({ sessions, sessionsEtag: event.etag, connected: true })
+  },
+
   selectSession: async (name) => {
     if (!name) {
       set({ activeSession: null, activeSessionDetail: null })
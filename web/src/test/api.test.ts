@@ -29,6 +29,26 @@ describe('API wrapper', () => {
     expect(mockFetch).toHaveBeenCalledWith('/sessions', expect.objectContaining({ signal: expect.any(AbortSignal) }))
   })
 
+  it('listSessionsIfChanged sends If-None-Match and handles 304', async () => {
+    mockFetch.mockResolvedValueOnce({ ok: false, status: 304, statusText: 'Not Modified' })
+    const result = await api.listSessionsIfChanged('"e1"')
+    expect(result).toEqual({ etag: '"e1"', sessions: null })
+    expect(mockFetch).toHaveBeenCalledWith('/sessions', expect.objectContaining({ headers: { 'If-None-Match': '"e1"' } }))
+  })
+
+  it('listSessionsIfChanged returns new sessions and ETag', async () => {
+    const sessions = [{ id: 's1', name: 'test', status: 'active' }]
+    mockFetch.mockResolvedValueOnce({
+      ok: true,
+      status: 200,
+      statusText: 'OK',
+      headers: { get: () => '"e2"' },
+      json: () => Promise.resolve(sessions),
+    })
+    const result = await api.listSessionsIfChanged(null)
+    expect(result).toEqual({ etag: '"e2"', sessions })
+  })
+
   it('listProfiles fetches /agents/profiles', async () => {
     const profiles = [{ name: 'dev', description: 'Developer', source: 'built-in' }]
     mockResponse(profiles)
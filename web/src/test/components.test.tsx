@@ -4,6 +4,7 @@ import { StatusBadge } from '../components/StatusBadge'
 import { ErrorBoundary } from '../components/ErrorBoundary'
 import { ConfirmModal } from '../components/ConfirmModal'
 import { FALLBACK_PROVIDERS } from '../components/AgentPanel'
+import { parseInputOwner } from '../components/TerminalView'
 
 describe('StatusBadge', () => {
   it('renders idle status', () => {
@@ -180,3 +181,15 @@ describe('FALLBACK_PROVIDERS', () => {
     expect(names).toContain('opencode_cli')
   })
 })
+
+describe('parseInputOwner', () => {
+  it('reads the owner flag from input_owner frames', () => {
+    expect(parseInputOwner('{"type": "input_owner", "owner": true}')).toBe(true)
+    expect(parseInputOwner('{"type": "input_owner", "owner": false}')).toBe(false)
+  })
+
+  it('ignores other text frames', () => {
+    expect(parseInputOwner('{"type": "resize", "rows": 24}')).toBeNull()
+    expect(parseInputOwner('not json')).toBeNull()
+  })
+})
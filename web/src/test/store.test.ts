@@ -46,6 +46,33 @@ describe('Store', () => {
     expect(useStore.getState().snackbar).toBeNull()
   })
 
+  it('applies session snapshot and delta events', () => {
+    const { applySessionsEvent } = useStore.getState()
+    applySessionsEvent({
+      type: 'snapshot',
+      etag: '"a"',
+      sessions: [
+        { id: 'cao-1', name: 'cao-1', status: 'detached' },
+        { id: 'cao-2', name: 'cao-2', status: 'detached' },
+      ],
+    })
+    applySessionsEvent({
+      type: 'delta',
+      etag: '"b"',
+      upserted: [
+        { id: 'cao-2', name: 'cao-2', status: 'active' },
+        { id: 'cao-3', name: 'cao-3', status: 'detached' },
+      ],
+      removed: ['cao-1'],
+    })
+    const state = useStore.getState()
+    expect(state.sessions.map(s => [s.id, s.status])).toEqual([
+      ['cao-2', 'active'],
+      ['cao-3', 'detached'],
+    ])
+    expect(state.sessionsEtag).toBe('"b"')
+  })
+
   it('shows error snackbar', () => {
     const { showSnackbar } = useStore.getState()
     showSnackbar({ type: 'error', message: 'Something failed' })
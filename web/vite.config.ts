@@ -20,6 +20,7 @@ export default defineConfig({
       '/sessions': { target: 'http://localhost:9889', changeOrigin: true },
       '/terminals': { target: 'http://localhost:9889', changeOrigin: true, ws: true },
       '/health': { target: 'http://localhost:9889', changeOrigin: true },
+      '/overview': { target: 'http://localhost:9889', changeOrigin: true },
       '/agents': { target: 'http://localhost:9889', changeOrigin: true },
       '/settings': { target: 'http://localhost:9889', changeOrigin: true },
       '/flows': { target: 'http://localhost:9889', changeOrigin: true },